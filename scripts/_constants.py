@@ -96,6 +96,10 @@ STRONG_MATCH_THRESHOLD = 80
 MODERATE_MATCH_THRESHOLD = 60
 WEAK_MATCH_THRESHOLD = 40
 
+# TF-IDF cosine (similarity.py) above which an existing skill is listed as a
+# near-duplicate before triage recommends CREATE_NEW.
+SIMILAR_SKILL_MIN_COSINE = 0.15
+
 
 def score_band(score: float) -> str:
     """Map a numeric match score to an honest keyword-match band."""
@@ -121,7 +125,8 @@ INDEX_MAX_AGE_HOURS = 24
 # ===========================================================================
 # One vocabulary, two consumers: discover_skills.classify_domain tags skills
 # with domains; triage_skill_request.detect_query_domains maps queries to the
-# same domains. All matching is word-boundary based (common.phrase_in_text).
+# same domains. Both go through common.DOMAIN_MATCHER (one word-boundary pass
+# over the whole vocabulary), and discovery persists each skill's hits.
 
 DOMAIN_VOCABULARY = {
     # Document types
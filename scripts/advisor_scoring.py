@@ -11,20 +11,23 @@ from __future__ import annotations
 import hashlib
 import re
 from dataclasses import asdict, dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 try:
+    from common import phrase_pattern
     from context_sources import Evidence
     from skillforge_config import level_settings
-    from triage_skill_request import classify_input, find_matching_skills
+    from triage_skill_request import classify_input, find_matching_skills, find_matching_skills_many
 except ImportError:
     import sys
 
     sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from common import phrase_pattern
     from context_sources import Evidence
     from skillforge_config import level_settings
-    from triage_skill_request import classify_input, find_matching_skills
+    from triage_skill_request import classify_input, find_matching_skills, find_matching_skills_many
 
 
 FRICTION_TERMS = {
@@ -48,6 +51,9 @@ DOMAIN_EVIDENCE_TERMS = {
     "code_quality": {"code", "review", "reviews", "pull", "request", "pr"},
 }
 
+# Bump when relevant_terms() changes so terms persisted in the index are recomputed.
+ADVISOR_TERMS_VERSION = 1
+
 
 @dataclass
 class Suggestion:
@@ -88,35 +94,91 @@ def candidate_key(candidate: dict[str, Any]) -> tuple[str, str, str]:
     )
 
 
-def relevant_terms(skill: dict[str, Any]) -> set[str]:
-    """Extract terms used to connect evidence to a skill."""
+def _skill_signature(skill: dict[str, Any]) -> tuple[Any, ...]:
+    """The fields relevant_terms() reads, as a hashable cache key."""
+    return (
+        str(skill.get("name", "")),
+        tuple(str(trigger) for trigger in skill.get("triggers", [])),
+        tuple(str(domain) for domain in skill.get("domains", [])),
+        tuple(str(keyword) for keyword in skill.get("keywords", [])),
+        str(skill.get("description", "")),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _terms_for_signature(signature: tuple[Any, ...]) -> frozenset[str]:
+    name, triggers, domains, keywords, description = signature
     terms: set[str] = set()
-    name = str(skill.get("name", ""))
     terms.update(part for part in re.split(r"[-_\s]+", name.lower()) if len(part) > 3)
-    terms.update(str(trigger).lower() for trigger in skill.get("triggers", []) if len(str(trigger)) > 3)
+    terms.update(trigger.lower() for trigger in triggers if len(trigger) > 3)
     terms.update(
-        str(domain).lower()
-        for domain in skill.get("domains", [])
-        if len(str(domain)) > 3 and str(domain).lower() not in BROAD_EVIDENCE_TERMS
+        domain.lower()
+        for domain in domains
+        if len(domain) > 3 and domain.lower() not in BROAD_EVIDENCE_TERMS
     )
-    for domain in skill.get("domains", []):
-        terms.update(DOMAIN_EVIDENCE_TERMS.get(str(domain).lower(), set()))
-    terms.update(str(keyword).lower() for keyword in skill.get("keywords", []) if len(str(keyword)) > 3)
-    description = str(skill.get("description", "")).lower()
+    for domain in domains:
+        terms.update(DOMAIN_EVIDENCE_TERMS.get(domain.lower(), set()))
+    terms.update(keyword.lower() for keyword in keywords if len(keyword) > 3)
+    description = description.lower()
     terms.update(word for word in re.findall(r"[a-zA-Z][a-zA-Z0-9_-]{3,}", description) if len(word) > 3)
-    return {term for term in terms if term not in BROAD_EVIDENCE_TERMS}
+    return frozenset(term for term in terms if term not in BROAD_EVIDENCE_TERMS)
+
+
+def skill_terms(skill: dict[str, Any]) -> frozenset[str]:
+    """Relevant terms for a skill: persisted in the index, else computed once per process."""
+    persisted = skill.get("advisor_terms")
+    if (
+        isinstance(persisted, dict)
+        and persisted.get("version") == ADVISOR_TERMS_VERSION
+        and isinstance(persisted.get("terms"), (list, tuple))
+    ):
+        return frozenset(str(term) for term in persisted["terms"])
+    return _terms_for_signature(_skill_signature(skill))
+
+
+def relevant_terms(skill: dict[str, Any]) -> set[str]:
+    """Extract terms used to connect evidence to a skill."""
+    return set(skill_terms(skill))
+
+
+def annotate_advisor_terms(skills: list[dict[str, Any]]) -> None:
+    """Persist each skill's relevant terms on its index record (before save_index)."""
+    for skill in skills:
+        terms = _terms_for_signature(_skill_signature(skill))
+        skill["advisor_terms"] = {"version": ADVISOR_TERMS_VERSION, "terms": sorted(terms)}
+
+
+@lru_cache(maxsize=4096)
+def compile_terms(terms: frozenset[str]) -> re.Pattern[str] | None:
+    """One whole-token matcher for a term set (None when the set is empty).
+
+    Equivalent to testing each term with term_in_text(): a lookahead that
+    fails for one alternative backtracks into the next. Haystacks must
+    already be lowercased.
+    """
+    terms = frozenset(term.lower() for term in terms if term)
+    if not terms:
+        return None
+    alternation = "|".join(re.escape(term) for term in sorted(terms, key=lambda t: (-len(t), t)))
+    return re.compile(rf"(?<![a-z0-9])(?:{alternation})(?![a-z0-9])")
+
+
+def skill_term_matcher(skill: dict[str, Any]) -> re.Pattern[str] | None:
+    """Compiled matcher for a skill's relevant terms, cached across calls."""
+    return compile_terms(skill_terms(skill))
 
 
 def term_in_text(term: str, text: str) -> bool:
     """Return True when a relevant term appears as a whole token or phrase."""
     if not term:
         return False
-    return re.search(rf"(?<![a-z0-9]){re.escape(term.lower())}(?![a-z0-9])", text.lower()) is not None
+    return phrase_pattern(term.lower()).search(text.lower()) is not None
 
 
 def any_term_in_text(terms: set[str], text: str) -> bool:
     """Return True when any relevant term appears in text."""
-    return any(term_in_text(term, text) for term in terms)
+    matcher = compile_terms(frozenset(terms))
+    return matcher is not None and matcher.search(text.lower()) is not None
 
 
 def evidence_text_for_skill_match(item: Evidence) -> str:
@@ -126,6 +188,13 @@ def evidence_text_for_skill_match(item: Evidence) -> str:
     return f"{item.path} {item.excerpt} {' '.join(item.matched_terms)}".lower()
 
 
+def session_text_for_skill_match(item: Evidence) -> str:
+    """Return the session evidence text used for session support ('' otherwise)."""
+    if item.tier != "session":
+        return ""
+    return f"{item.excerpt} {' '.join(item.matched_terms)}".lower()
+
+
 def direct_match_strength(match: dict[str, Any], evidence: list[Evidence]) -> int:
     """Score how explicit the candidate match is in current context."""
     reasons = [str(reason) for reason in match.get("reasons", [])]
@@ -169,18 +238,24 @@ def has_specific_name_signal(skill: dict[str, Any], context_text: str, evidence:
     return any(re.search(rf"(?<![a-z0-9]){re.escape(token)}(?![a-z0-9])", haystack) for token in tokens)
 
 
-def evidence_score(skill: dict[str, Any], evidence: list[Evidence]) -> int:
-    """Score source-tier evidence for a candidate skill."""
-    terms = relevant_terms(skill)
+def evidence_score(
+    skill: dict[str, Any], evidence: list[Evidence], haystacks: list[str] | None = None
+) -> int:
+    """Score source-tier evidence for a candidate skill.
+
+    haystacks, when given, are evidence_text_for_skill_match() per item.
+    """
+    matcher = skill_term_matcher(skill)
     if not evidence:
         return 0
+    if haystacks is None:
+        haystacks = [evidence_text_for_skill_match(item) for item in evidence]
 
     matched_count = 0
     session_matched = 0
     tiers: set[str] = set()
-    for item in evidence:
-        haystack = evidence_text_for_skill_match(item)
-        if not terms or any_term_in_text(terms, haystack):
+    for item, haystack in zip(evidence, haystacks):
+        if matcher is None or matcher.search(haystack):
             matched_count += 1
             if item.tier == "session":
                 session_matched += 1
@@ -191,29 +266,44 @@ def evidence_score(skill: dict[str, Any], evidence: list[Evidence]) -> int:
     return min(100, matched_count * 18 + len(tiers) * 10 + session_matched * 40)
 
 
-def has_session_skill_evidence(skill: dict[str, Any], evidence: list[Evidence]) -> bool:
-    """Return True when session evidence supports a candidate skill."""
-    terms = relevant_terms(skill)
-    if not terms:
+def has_session_skill_evidence(
+    skill: dict[str, Any], evidence: list[Evidence], haystacks: list[str] | None = None
+) -> bool:
+    """Return True when session evidence supports a candidate skill.
+
+    haystacks, when given, are session_text_for_skill_match() per item.
+    """
+    matcher = skill_term_matcher(skill)
+    if matcher is None:
         return False
-    for item in evidence:
+    if haystacks is None:
+        haystacks = [session_text_for_skill_match(item) for item in evidence]
+    for item, haystack in zip(evidence, haystacks):
         if item.tier != "session":
             continue
-        haystack = f"{item.excerpt} {' '.join(item.matched_terms)}".lower()
-        if any_term_in_text(terms, haystack):
+        if matcher.search(haystack):
             return True
     return False
 
 
-def select_relevant_evidence(skill: dict[str, Any], evidence: list[Evidence], limit: int = 3) -> list[Evidence]:
-    """Choose evidence that actually supports this skill."""
-    terms = relevant_terms(skill)
-    if not terms:
+def select_relevant_evidence(
+    skill: dict[str, Any],
+    evidence: list[Evidence],
+    limit: int = 3,
+    haystacks: list[str] | None = None,
+) -> list[Evidence]:
+    """Choose evidence that actually supports this skill.
+
+    haystacks, when given, are evidence_text_for_skill_match() per item.
+    """
+    matcher = skill_term_matcher(skill)
+    if matcher is None:
         return evidence[:limit]
+    if haystacks is None:
+        haystacks = [evidence_text_for_skill_match(item) for item in evidence]
     selected: list[Evidence] = []
-    for item in evidence:
-        haystack = evidence_text_for_skill_match(item)
-        if any_term_in_text(terms, haystack):
+    for item, haystack in zip(evidence, haystacks):
+        if matcher.search(haystack):
             selected.append(item)
         if len(selected) >= limit:
             break
@@ -327,10 +417,14 @@ def build_suggestions(
         combined_text = project_key
 
     _, signals = classify_input(combined_text)
-    matches = find_matching_skills(combined_text, skills, limit=24, signals=signals)
-    if context_text.strip():
+    if not context_text.strip():
+        matches = find_matching_skills(combined_text, skills, limit=24, signals=signals)
+    else:
+        # One pass over the roster ranks it for both texts.
         _, session_signals = classify_input(context_text)
-        session_matches = find_matching_skills(context_text, skills, limit=12, signals=session_signals)
+        matches, session_matches = find_matching_skills_many(
+            [(combined_text, 24, signals), (context_text, 12, session_signals)], skills
+        )
         seen_candidates: set[tuple[str, str, str]] = set()
         seeded_matches: list[dict[str, Any]] = []
         for match in [*session_matches, *matches]:
@@ -350,6 +444,9 @@ def build_suggestions(
     suggestions: list[Suggestion] = []
     seen_names: set[str] = set()
     explicit_names = explicitly_named_skills(context_text, skills)
+    # Lowercased once here; every candidate's compiled matcher scans the same text.
+    match_haystacks = [evidence_text_for_skill_match(item) for item in evidence]
+    session_haystacks = [session_text_for_skill_match(item) for item in evidence]
 
     for match in matches:
         match_name = match.get("name")
@@ -363,10 +460,10 @@ def build_suggestions(
             seen_names.add(match_name)
 
         skill = skill_by_key.get(candidate_key(match), first_skill_by_name.get(str(match.get("name")), match))
-        display_evidence = select_relevant_evidence(skill, evidence)
+        display_evidence = select_relevant_evidence(skill, evidence, haystacks=match_haystacks)
         skill_match = int(match.get("score", 0))
-        context_evidence = evidence_score(skill, evidence)
-        session_support = has_session_skill_evidence(skill, evidence)
+        context_evidence = evidence_score(skill, evidence, match_haystacks)
+        session_support = has_session_skill_evidence(skill, evidence, session_haystacks)
         timeliness = timeliness_score(context_text, evidence)
         feedback = feedback_score(match.get("name"), state)
         directness = direct_match_strength(match, evidence)
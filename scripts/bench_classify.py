@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+bench_classify.py - Benchmark triage's combined input-classification regex.
+
+classify_input() runs two precompiled matchers (one over the lowercased
+query, one over the raw text) instead of walking every *_PATTERNS list with
+re.search. This script replays a query corpus through both - the combined
+matchers and a sequential walk over the same public pattern lists - checks
+that every category agrees, and reports throughput. The signal-level
+equivalence check runs over the triage test corpus in tests/test_triage.py.
+
+The built-in corpus covers every category and the priority collisions
+between them (a create request that also pastes a traceback, a "please"
+task that also names a skill, ...); --corpus adds queries from a JSONL file
+in replay_triage.py's format (one {"query": ...} object per line).
+
+Usage:
+    python3 bench_classify.py
+    python3 bench_classify.py --corpus queries.jsonl --repeat 5
+    python3 bench_classify.py --json
+
+Exit Codes:
+    0 - Benchmark ran and both paths agreed
+    1 - The combined and sequential categories differ
+    2 - Corpus file unreadable or malformed
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import triage_skill_request as triage
+    from triage_skill_request import InputCategory, classify_input
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    import triage_skill_request as triage
+    from triage_skill_request import InputCategory, classify_input
+
+SAMPLE_QUERIES = [
+    "create a skill for code review",
+    "create a skill for baking bread",
+    "create a skill for pdf merging",
+    "skillforge: build something for terraform drift",
+    "I want a new skill to summarise meeting notes.",
+    "build the ultimate skill for release notes",
+    "improve the code-review skill",
+    "fix the pdf-tools skill, it misses encrypted files",
+    "the deploy skill needs better rollback steps",
+    "add to the vercel skill a section on env vars",
+    "do I have a skill for code review?",
+    "which skill handles pdf merging",
+    "is there a skill for ffmpeg?",
+    "suggest a skill for writing changelogs",
+    "help me with my terraform plan",
+    "I need to merge two pdfs",
+    "how do I rotate the api keys",
+    "can you tidy this module",
+    "please could you fix the flaky test",
+    "Traceback (most recent call last):\n  File \"app.py\", line 3, in <module>\nKeyError: 'x'",
+    "TypeError: cannot read properties of undefined",
+    "    at Object.<anonymous> (/srv/app/index.js:10:5)",
+    "def handler(event):\n    return event",
+    "const total = items.reduce((a, b) => a + b, 0)",
+    "<div class=\"card\">hello</div>",
+    "@dataclass\nclass Point:\n    x: int",
+    "look at https://example.com/docs/page",
+    "please help, Error: ENOENT while building",
+    "create a skill for this:\nTraceback (most recent call last):",
+    "can you check https://example.com for me",
+    "please make a skill for handling => arrows",
+    "what skill should I use? const x = 1",
+    "merge pdf files",
+    "bake bread",
+    "ok",
+    "",
+]
+
+
+# Priority order of classify_input(): (patterns, match the raw text?, category).
+_SEQUENTIAL = (
+    (triage.EXPLICIT_CREATE_PATTERNS, False, InputCategory.EXPLICIT_CREATE),
+    (triage.EXPLICIT_IMPROVE_PATTERNS, False, InputCategory.EXPLICIT_IMPROVE),
+    (triage.SKILL_QUESTION_PATTERNS, False, InputCategory.SKILL_QUESTION),
+    (triage.ERROR_PATTERNS, True, InputCategory.ERROR_MESSAGE),
+    (triage.CODE_PATTERNS, True, InputCategory.CODE_SNIPPET),
+    (triage.URL_PATTERNS, True, InputCategory.URL_CONTENT),
+    (triage.TASK_REQUEST_PATTERNS, False, InputCategory.TASK_REQUEST),
+)
+
+
+def sequential_category(query: str) -> str:
+    """Timing baseline: one re.search per pattern, in priority order."""
+    query_lower = query.lower()
+    for patterns, raw, category in _SEQUENTIAL:
+        text, flags = (query, re.MULTILINE) if raw else (query_lower, 0)
+        if any(re.search(p, text, flags) for p in patterns):
+            return category
+    return InputCategory.GENERAL
+
+
+def load_queries(path: Path) -> List[str]:
+    """Queries from a JSONL corpus; raises ValueError on a malformed line."""
+    queries = []
+    with path.open(encoding="utf-8") as handle:
+        for number, line in enumerate(handle, 1):
+            if not line.strip():
+                continue
+            try:
+                query = json.loads(line).get("query")
+            except (json.JSONDecodeError, AttributeError):
+                query = None
+            if not isinstance(query, str):
+                raise ValueError(f"{path}:{number}: expected an object with a string 'query'")
+            queries.append(query)
+    return queries
+
+
+def mismatches(queries: List[str]) -> List[Dict[str, Any]]:
+    """Queries whose combined and sequential categories differ."""
+    found = []
+    for query in queries:
+        combined, expected = classify_input(query)[0], sequential_category(query)
+        if combined != expected:
+            found.append({"query": query, "combined": combined, "sequential": expected})
+    return found
+
+
+def _best_seconds(fn, queries: List[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for query in queries:
+            fn(query)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(queries: List[str], repeat: int = 5, rounds: int = 50) -> Dict[str, Any]:
+    workload = queries * rounds
+    sequential = _best_seconds(sequential_category, workload, repeat)
+    combined = _best_seconds(classify_input, workload, repeat)
+    differing = mismatches(queries)
+    return {
+        "queries": len(queries),
+        "classifications": len(workload),
+        "sequential_seconds": round(sequential, 4),
+        "combined_seconds": round(combined, 4),
+        "speedup": round(sequential / combined, 2) if combined else None,
+        "identical": not differing,
+        "mismatches": differing,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark triage's combined classification regex against "
+                    "a sequential walk over the same pattern lists",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s
+  %(prog)s --corpus queries.jsonl --repeat 5
+  %(prog)s --rounds 200 --json
+        """,
+    )
+    parser.add_argument("--corpus", type=Path, help="Extra queries (JSONL with a 'query' field)")
+    parser.add_argument("--rounds", type=int, default=50,
+                        help="Times the corpus is replayed per timing (default: 50)")
+    parser.add_argument("--repeat", type=int, default=5, help="Best of N timings (default: 5)")
+    parser.add_argument("--json", action="store_true", help="Machine-readable JSON output")
+    args = parser.parse_args(argv)
+
+    queries = list(SAMPLE_QUERIES)
+    if args.corpus:
+        try:
+            queries.extend(load_queries(args.corpus.expanduser()))
+        except (OSError, ValueError) as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 2
+    result = run_benchmark(queries, max(1, args.repeat), max(1, args.rounds))
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"Corpus: {result['queries']} queries, "
+              f"{result['classifications']:,} classifications per timing")
+        print(f"  sequential re.search: {result['sequential_seconds']:.3f}s")
+        print(f"  combined matchers:    {result['combined_seconds']:.3f}s  "
+              f"({result['speedup']}x)")
+        print(f"  identical results: {result['identical']}")
+        for entry in result["mismatches"]:
+            print(f"    {entry['query']!r}: {entry['combined']} != {entry['sequential']}")
+    return 0 if result["identical"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+bench_friction.py - Benchmark mine_skill_friction.py's line pre-filter.
+
+Generates a SYNTHETIC transcript corpus shaped like real session logs
+(assistant text and tool_use turns for Read/Edit/Grep/Bash/Skill, user
+prompts, large tool_result payloads, summary and progress noise), then mines
+every session twice - with and without the byte-level pre-filter - checks
+that both produce identical partial stats, and reports throughput.
+
+Nothing here touches real transcripts: the corpus lives in a temporary
+directory (or --corpus DIR) and is generated from a fixed seed.
+
+Usage:
+    python3 bench_friction.py
+    python3 bench_friction.py --sessions 200 --turns 300 --payload-kb 32
+    python3 bench_friction.py --json
+
+Exit Codes:
+    0 - Benchmark ran and both paths agreed
+    1 - The pre-filtered and full-decode results differ
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    from mine_skill_friction import mine_partial, relevant_line
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from mine_skill_friction import mine_partial, relevant_line
+
+_TOOLS = ("Read", "Edit", "Grep", "Glob", "Bash", "Bash", "Skill")
+_COMMANDS = ("pytest -q tests", "ffmpeg -i in.mov out.mp4", "terraform plan",
+             "git status", "ls -la", "jq '.items' data.json", "npm run build")
+_PROMPTS = ("please fix the failing test", "no, that's not what I meant",
+            "great, now add docs", "stop", "can you also handle the edge case?")
+
+
+def _envelope(kind: str, session: str, i: int) -> Dict[str, Any]:
+    return {"type": kind, "sessionId": session, "uuid": f"{session}-{i}",
+            "parentUuid": f"{session}-{i - 1}", "userType": "external",
+            "cwd": "/home/dev/project", "version": "2.0.0",
+            "timestamp": f"2026-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}.000Z"}
+
+
+def synthetic_session(rng: random.Random, session: str, turns: int,
+                      payload_kb: int) -> List[str]:
+    lines: List[str] = [json.dumps({"type": "summary", "summary": "Working on tests",
+                                    "leafUuid": f"{session}-0"})]
+    for i in range(1, turns + 1):
+        roll = rng.random()
+        if roll < 0.15:
+            entry = _envelope("user", session, i)
+            entry["message"] = {"role": "user", "content": rng.choice(_PROMPTS)}
+        elif roll < 0.55:
+            tool = rng.choice(_TOOLS)
+            tool_input: Dict[str, Any] = {"file_path": f"/home/dev/project/m{i}.py"}
+            if tool == "Bash":
+                tool_input = {"command": rng.choice(_COMMANDS)}
+            elif tool == "Skill":
+                tool_input = {"skill": f"skill-{rng.randint(0, 9)}"}
+            entry = _envelope("assistant", session, i)
+            entry["message"] = {"role": "assistant", "content": [
+                {"type": "text", "text": "Let me look at that."},
+                {"type": "tool_use", "id": f"toolu_{i}", "name": tool, "input": tool_input},
+            ]}
+        elif roll < 0.9:
+            size = rng.randint(payload_kb // 4, payload_kb) * 1024
+            entry = _envelope("user", session, i)
+            entry["message"] = {"role": "user", "content": [
+                {"type": "tool_result", "tool_use_id": f"toolu_{i - 1}",
+                 "content": "x = 1  # line of file output\n" * (size // 30)},
+            ]}
+            entry["toolUseResult"] = {"stdout": "...", "interrupted": False}
+        elif roll < 0.97:
+            entry = _envelope("assistant", session, i)
+            entry["message"] = {"role": "assistant", "content": [
+                {"type": "text", "text": "Here is what I changed. " * rng.randint(5, 40)}]}
+        else:
+            entry = {"type": "progress", "data": {"step": i}}
+        lines.append(json.dumps(entry))
+    return lines
+
+
+def build_corpus(root: Path, sessions: int, turns: int, payload_kb: int,
+                 seed: int = 7) -> List[Path]:
+    rng = random.Random(seed)
+    paths = []
+    for s in range(sessions):
+        project = root / f"proj-{s % 5}"
+        project.mkdir(parents=True, exist_ok=True)
+        path = project / f"session-{s:04d}.jsonl"
+        path.write_text("\n".join(synthetic_session(rng, f"s{s:04d}", turns, payload_kb))
+                        + "\n", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def _time_mining(paths: List[Path], prefilter: bool) -> Dict[str, Any]:
+    start = time.perf_counter()
+    partials = [mine_partial(path, prefilter=prefilter) for path in paths]
+    return {"seconds": time.perf_counter() - start, "partials": partials}
+
+
+def run_benchmark(paths: List[Path], repeat: int = 3) -> Dict[str, Any]:
+    total_bytes = sum(p.stat().st_size for p in paths)
+    lines = kept = 0
+    for path in paths:
+        with path.open("rb") as handle:
+            for raw in handle:
+                lines += 1
+                kept += relevant_line(raw)
+    full = min((_time_mining(paths, False) for _ in range(repeat)), key=lambda r: r["seconds"])
+    fast = min((_time_mining(paths, True) for _ in range(repeat)), key=lambda r: r["seconds"])
+    return {
+        "sessions": len(paths),
+        "megabytes": round(total_bytes / 1e6, 2),
+        "lines": lines,
+        "lines_decoded_with_prefilter": kept,
+        "full_decode_seconds": round(full["seconds"], 4),
+        "prefilter_seconds": round(fast["seconds"], 4),
+        "speedup": round(full["seconds"] / fast["seconds"], 2) if fast["seconds"] else None,
+        "identical": full["partials"] == fast["partials"],
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the friction miner's byte-level line pre-filter "
+                    "on a synthetic transcript corpus",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s
+  %(prog)s --sessions 200 --turns 300 --payload-kb 32
+  %(prog)s --corpus /tmp/friction-corpus --json   # keep the corpus around
+        """,
+    )
+    parser.add_argument("--sessions", type=int, default=40, help="Sessions (default: 40)")
+    parser.add_argument("--turns", type=int, default=200, help="Entries per session (default: 200)")
+    parser.add_argument("--payload-kb", type=int, default=16,
+                        help="Largest tool_result payload in KB (default: 16)")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N timings (default: 3)")
+    parser.add_argument("--corpus", type=Path, help="Write the corpus here instead of a temp dir")
+    parser.add_argument("--json", action="store_true", help="Machine-readable JSON output")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="friction-bench-") as tmp:
+        root = args.corpus.expanduser() if args.corpus else Path(tmp)
+        paths = build_corpus(root, args.sessions, args.turns, args.payload_kb)
+        result = run_benchmark(paths, max(1, args.repeat))
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"Corpus: {result['sessions']} sessions, {result['megabytes']} MB, "
+              f"{result['lines']:,} lines ({result['lines_decoded_with_prefilter']:,} "
+              "decoded with the pre-filter)")
+        print(f"  full decode: {result['full_decode_seconds']:.3f}s")
+        print(f"  pre-filter:  {result['prefilter_seconds']:.3f}s  "
+              f"({result['speedup']}x)")
+        print(f"  identical results: {result['identical']}")
+    return 0 if result["identical"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
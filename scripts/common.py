@@ -2,18 +2,28 @@
 """
 common.py - Shared runtime helpers for SkillForge scripts.
 
-Single home for the Result dataclass, the skill index path, and the
-word-boundary phrase matcher, so no script carries its own diverging copy.
+Single home for the Result dataclass, the skill index path, the stopword
+tokenizer, and the word-boundary phrase matchers (one phrase, or a whole
+vocabulary in one pass), so no script carries its own diverging copy.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import re
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, List, Mapping, Sequence, Set
+
+try:
+    from _constants import DOMAIN_VOCABULARY
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from _constants import DOMAIN_VOCABULARY
 
 
 @dataclass
@@ -58,3 +68,99 @@ def phrase_in_text(phrase: str, text: str) -> bool:
     if not phrase:
         return False
     return phrase_pattern(phrase).search(text.lower()) is not None
+
+
+# Function words carry no triggering signal; excluded from keyword matching.
+STOPWORDS = frozenset("""
+a about above after again all also am an and any are as at be because been
+before being below between both but by can cannot could did do does doing
+down during each few for from further get got had has have having he her
+here hers him his how i if in into is it its itself just like me more most
+my no nor not now of off on once only or other our ours out over own same
+she should so some such than that the their theirs them then there these
+they this those through to too under until up use used using very want was
+we were what when where which while who whom why will with would you your
+yours yourself
+""".split())
+
+_WORD_RE = re.compile(r"[a-z0-9]+(?:['-][a-z0-9]+)*")
+
+
+def content_tokens(text: str) -> List[str]:
+    """Meaningful lowercase keywords in order, repeats kept (for term counts)."""
+    return [
+        token for token in _WORD_RE.findall(text.lower())
+        if len(token) >= 3 and token not in STOPWORDS and not token.isdigit()
+    ]
+
+
+def content_words(text: str) -> set:
+    """Extract meaningful lowercase keywords (word-boundary, no stopwords)."""
+    return set(content_tokens(text))
+
+
+class TermMatcher:
+    """Every phrase of a fixed set that appears in a text, in one regex pass.
+
+    Same word-boundary semantics as phrase_in_text(), but one compiled
+    alternation instead of a search per phrase. The scan is a zero-width
+    lookahead at each token start, so overlapping phrases are all found; at
+    one start only the longest alternative is reported, and the shorter
+    phrases it implies (e.g. "api" inside "api docs") are added back.
+    """
+
+    def __init__(self, phrases: Iterable[str]) -> None:
+        unique = {p.strip().lower() for p in phrases if p and p.strip()}
+        self.phrases = sorted(unique, key=lambda p: (-len(p), p))
+        self._implied: Dict[str, List[str]] = {
+            longer: [p for p in self.phrases
+                     if len(p) < len(longer) and phrase_pattern(p).match(longer)]
+            for longer in self.phrases
+        }
+        alternation = "|".join(re.escape(p) for p in self.phrases)
+        self._pattern = (
+            re.compile(rf"(?<![a-z0-9])(?=({alternation})(?![a-z0-9]))") if self.phrases else None
+        )
+
+    def found(self, text: str) -> Set[str]:
+        """The phrases present in text (case-insensitive, whole tokens)."""
+        hits: Set[str] = set()
+        if self._pattern is None or not text:
+            return hits
+        for match in self._pattern.finditer(text.lower()):
+            phrase = match.group(1)
+            if phrase not in hits:
+                hits.add(phrase)
+                hits.update(self._implied[phrase])
+        return hits
+
+
+def domain_phrase(domain: str) -> str:
+    """A domain name as it reads in prose ("code_quality" -> "code quality")."""
+    return domain.replace("_", " ")
+
+
+class DomainMatcher(TermMatcher):
+    """TermMatcher over a domain vocabulary plus the domain names themselves."""
+
+    def __init__(self, vocabulary: Mapping[str, Sequence[str]]) -> None:
+        self.vocabulary = {domain: list(terms) for domain, terms in vocabulary.items()}
+        super().__init__([t for terms in self.vocabulary.values() for t in terms]
+                         + [domain_phrase(d) for d in self.vocabulary])
+        # Persisted alongside per-skill hits so an index built against a
+        # different vocabulary is recomputed instead of trusted.
+        self.signature = hashlib.sha256(
+            json.dumps(self.vocabulary, sort_keys=True).encode("utf-8")
+        ).hexdigest()[:12]
+
+    def domain_terms(self, found: Set[str]) -> Dict[str, List[str]]:
+        """Matched terms per domain (vocabulary order), only domains with a hit."""
+        result = {}
+        for domain, terms in self.vocabulary.items():
+            matched = [t for t in terms if t in found]
+            if matched:
+                result[domain] = matched
+        return result
+
+
+DOMAIN_MATCHER = DomainMatcher(DOMAIN_VOCABULARY)
@@ -29,7 +29,8 @@ try:
     from context_sources import collect_context_evidence
     from discover_skills import discover_skills, get_index_path, index_age_hours, save_index
     from skillforge_config import data_dir, level_settings, load_config, project_key
-    from triage_skill_request import load_skill_index
+    from skill_record import skill_records
+    from triage_skill_request import load_skill_index, load_skills
 except ImportError:
     sys.path.insert(0, str(Path(__file__).resolve().parent))
     from _constants import INDEX_MAX_AGE_HOURS
@@ -37,7 +38,8 @@ except ImportError:
     from context_sources import collect_context_evidence
     from discover_skills import discover_skills, get_index_path, index_age_hours, save_index
     from skillforge_config import data_dir, level_settings, load_config, project_key
-    from triage_skill_request import load_skill_index
+    from skill_record import skill_records
+    from triage_skill_request import load_skill_index, load_skills
 
 
 QUEUE_FILE = data_dir() / "advice.jsonl"
@@ -186,16 +188,20 @@ def is_suppressed(suggestion: Suggestion, state: dict[str, Any]) -> bool:
 
 
 def ensure_skill_index() -> dict[str, Any]:
-    """Load the skill index, rebuilding when it is missing OR stale (>24h)."""
+    """Load the skill index, rebuilding when it is missing OR stale (>24h).
+
+    Comes back as {"skills": ...}: the mmap-shared sidecar when it is
+    current (see mapped_index.py), else compact SkillRecords.
+    """
     age = index_age_hours(get_index_path())
     if age is not None and age <= INDEX_MAX_AGE_HOURS:
-        index = load_skill_index()
-        if index:
-            return index
+        skills = load_skills()
+        if skills is not None:
+            return {"skills": skills}
     result = discover_skills(verbose=False)
     save_index(result, get_index_path())
     index = load_skill_index()
-    return index or {"skills": []}
+    return {"skills": skill_records((index or {}).get("skills", []))}
 
 
 def read_context_text(args: argparse.Namespace) -> str:
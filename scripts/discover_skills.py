@@ -33,13 +33,17 @@ from typing import List, Dict, Optional, Any
 
 try:
     from _constants import DOMAIN_VOCABULARY, INDEX_MAX_AGE_HOURS
-    from common import Result, get_index_path, phrase_pattern
-    from frontmatter import parse_frontmatter
+    from advisor_scoring import annotate_advisor_terms
+    from common import DOMAIN_MATCHER, Result, get_index_path
+    from frontmatter import parse_frontmatter, parse_yaml_mapping, split_frontmatter
+    from mapped_index import write_mapped_index
 except ImportError:
     sys.path.insert(0, str(Path(__file__).resolve().parent))
     from _constants import DOMAIN_VOCABULARY, INDEX_MAX_AGE_HOURS
-    from common import Result, get_index_path, phrase_pattern
-    from frontmatter import parse_frontmatter
+    from advisor_scoring import annotate_advisor_terms
+    from common import DOMAIN_MATCHER, Result, get_index_path
+    from frontmatter import parse_frontmatter, parse_yaml_mapping, split_frontmatter
+    from mapped_index import write_mapped_index
 
 
 # ===========================================================================
@@ -90,6 +94,11 @@ SKILL_SOURCES = [
 # Shared with triage_skill_request.py via _constants.DOMAIN_VOCABULARY
 DOMAIN_KEYWORDS = DOMAIN_VOCABULARY
 
+# Relative references/scripts/assets paths mentioned in a SKILL.md body.
+_REL_PATH_RE = re.compile(r"(?<![\w/.-])((?:references|scripts|assets)/[\w][\w\-./]*)")
+# Mentions containing template placeholders are not real paths.
+_PLACEHOLDER_RE = re.compile(r"\{\{|[<>*$]|TODO", re.IGNORECASE)
+
 
 # ===========================================================================
 # PARSING FUNCTIONS
@@ -172,50 +181,78 @@ def extract_keywords(content: str, name: str) -> List[str]:
     return list(set(keywords))
 
 
-def classify_domain(keywords: List[str], content: str) -> List[str]:
-    """Classify skill into domains using word-boundary keyword matching.
+def domain_matches(keywords: List[str], content: str) -> Dict[str, List[str]]:
+    """Matched vocabulary terms per domain: keyword hits or whole-token content hits.
 
-    Uses whole-token matching (common.phrase_pattern), so 'ai' does not
+    One pass of common.DOMAIN_MATCHER over the content, so 'ai' does not
     match 'email' and 'ml' does not match 'html'.
     """
-    domains = []
-    content_lower = content.lower()
-    keyword_set = {k.strip().lower() for k in keywords}
+    found = DOMAIN_MATCHER.found(content)
+    found.update(k.strip().lower() for k in keywords)
+    return DOMAIN_MATCHER.domain_terms(found)
 
-    for domain, domain_keywords in DOMAIN_KEYWORDS.items():
-        score = 0
-        for kw in domain_keywords:
-            if kw in keyword_set or phrase_pattern(kw).search(content_lower):
-                score += 1
-        if score >= 2:
-            domains.append(domain)
 
-    if not domains:
-        domains.append("general")
+def domains_from_matches(matches: Dict[str, List[str]]) -> List[str]:
+    """Domains with two or more matched terms, else ["general"]."""
+    domains = [domain for domain, terms in matches.items() if len(terms) >= 2]
+    return domains or ["general"]
 
-    return domains
 
+def classify_domain(keywords: List[str], content: str) -> List[str]:
+    """Classify skill into domains using word-boundary keyword matching."""
+    return domains_from_matches(domain_matches(keywords, content))
 
-def parse_skill_file(path: Path, source_name: str, priority: int) -> Optional[Dict]:
-    """Parse a skill file and extract metadata."""
-    try:
-        content = path.read_text(encoding="utf-8")
-    except Exception:
-        return None
+
+def domain_record(matches: Dict[str, List[str]], description: str) -> Dict:
+    """The index's precomputed domain hits, so triage never rescans skill text.
+
+    "matches" is domain -> matched terms (the count is its length);
+    "description" is every vocabulary term or domain name in the description.
+    """
+    return {
+        "signature": DOMAIN_MATCHER.signature,
+        "matches": matches,
+        "description": sorted(DOMAIN_MATCHER.found(description)),
+    }
+
+
+def extract_relative_refs(body: str) -> List[str]:
+    """Relative references/scripts/assets paths mentioned in a SKILL.md body."""
+    refs = []
+    for match in _REL_PATH_RE.finditer(body):
+        ref = match.group(1).rstrip(".,:;)")
+        if _PLACEHOLDER_RE.search(ref):
+            continue
+        refs.append(ref)
+    return sorted(set(refs))
+
+
+def parse_skill_text(content: str, path: Path, source_name: str, priority: int) -> Dict:
+    """Extract index metadata from SKILL.md text that is already in memory.
+
+    The frontmatter is split and parsed once. Besides the routing metadata,
+    the record carries "facts" - the raw frontmatter description, the model
+    pin, the body word count, and relative file references - so
+    skillforge_doctor.py can lint from the record instead of re-reading the
+    file.
+    """
+    fm_text, body = split_frontmatter(content)
+    frontmatter = parse_yaml_mapping(fm_text)[0] if fm_text is not None else {}
 
     # Extract skill name from path or frontmatter
-    frontmatter = extract_frontmatter(content)
     name = str(frontmatter.get("name") or path.parent.name)
 
     # Extract metadata
     triggers = extract_triggers(content)
     keywords = extract_keywords(content, name)
-    domains = classify_domain(keywords, content)
+    matches = domain_matches(keywords, content)
+    domains = domains_from_matches(matches)
 
     # Get description
     description = frontmatter.get("description", "")
     if not isinstance(description, str):
         description = str(description)
+    facts_description = str(frontmatter.get("description") or "").strip()
     if not description:
         # Try to extract from first paragraph
         lines = content.split("\n")
@@ -224,6 +261,7 @@ def parse_skill_file(path: Path, source_name: str, priority: int) -> Optional[Di
                 description = line.strip()[:200]
                 break
 
+    model = frontmatter.get("model")
     return {
         "name": name,
         "source": source_name,
@@ -233,10 +271,34 @@ def parse_skill_file(path: Path, source_name: str, priority: int) -> Optional[Di
         "triggers": triggers,
         "keywords": keywords,
         "domains": domains,
-        "version": get_version(frontmatter)
+        "domain_terms": domain_record(matches, description),
+        "version": get_version(frontmatter),
+        "facts": {
+            "description": facts_description,
+            "model": str(model) if model else None,
+            "body_words": len(body.split()),
+            "refs": extract_relative_refs(body),
+        },
     }
 
 
+def parse_skill_file(path: Path, source_name: str, priority: int) -> Optional[Dict]:
+    """Parse a skill file and extract metadata.
+
+    The file's mtime_ns and size are recorded so a later scan can tell an
+    unchanged file from an edited one without reading it.
+    """
+    try:
+        stat = path.stat()
+        content = path.read_text(encoding="utf-8")
+    except Exception:
+        return None
+    record = parse_skill_text(content, path, source_name, priority)
+    record["mtime_ns"] = stat.st_mtime_ns
+    record["size"] = stat.st_size
+    return record
+
+
 # ===========================================================================
 # DISCOVERY
 # ===========================================================================
@@ -281,14 +343,24 @@ def dedupe_skills(skills: List[Dict]) -> List[Dict]:
     return list(best.values())
 
 
-def discover_skills(verbose: bool = False) -> Result:
-    """Scan all skill sources and build index."""
+def build_domain_index(skills: List[Dict]) -> Dict[str, List[str]]:
+    """Domain -> names of the skills tagged with it, in roster order."""
+    domain_index: Dict[str, List[str]] = {}
+    for skill in skills:
+        for domain in skill.get("domains", []):
+            domain_index.setdefault(domain, []).append(skill["name"])
+    return domain_index
+
+
+def discover_skills(verbose: bool = False, sources: Optional[List[Dict]] = None) -> Result:
+    """Scan all skill sources (default: SKILL_SOURCES) and build index."""
+    sources = SKILL_SOURCES if sources is None else sources
     skills = []
     errors = []
     warnings = []
     missing_sources = 0
 
-    for source in SKILL_SOURCES:
+    for source in sources:
         source_path = source["path"]
 
         if not source_path.exists():
@@ -317,24 +389,16 @@ def discover_skills(verbose: bool = False) -> Result:
     # Sort by priority (lower = higher priority)
     skills.sort(key=lambda s: (s["priority"], s["name"]))
 
-    # Build domain index
-    domain_index = {}
-    for skill in skills:
-        for domain in skill["domains"]:
-            if domain not in domain_index:
-                domain_index[domain] = []
-            domain_index[domain].append(skill["name"])
-
     return Result(
         success=True,
         message=(
-            f"Discovered {len(skills)} unique skills from {len(SKILL_SOURCES)} sources "
+            f"Discovered {len(skills)} unique skills from {len(sources)} sources "
             f"({duplicates_removed} duplicate name(s) removed)"
         ),
         data={
             "skills": skills,
-            "domains": domain_index,
-            "sources": {s["name"]: str(s["path"]) for s in SKILL_SOURCES},
+            "domains": build_domain_index(skills),
+            "sources": {s["name"]: str(s["path"]) for s in sources},
             "total_count": len(skills),
             "duplicates_removed": duplicates_removed,
             "missing_sources": missing_sources,
@@ -359,9 +423,14 @@ def index_age_hours(path: Optional[Path] = None) -> Optional[float]:
 
 
 def save_index(result: Result, output_path: Optional[Path] = None) -> None:
-    """Save skill index to disk."""
+    """Save skill index to disk, plus its mmap-shared sidecar (mapped_index.py).
+
+    Every skill record gets its advisor_terms persisted here, so readers of
+    any index this writes never recompute them.
+    """
     path = output_path or get_index_path()
     path.parent.mkdir(parents=True, exist_ok=True)
+    annotate_advisor_terms(result.data["skills"])
 
     index_data = {
         "version": "2.0.0",
@@ -373,6 +442,10 @@ def save_index(result: Result, output_path: Optional[Path] = None) -> None:
     }
 
     path.write_text(json.dumps(index_data, indent=2))
+    try:
+        write_mapped_index(index_data["skills"], path)
+    except OSError:
+        pass  # readers fall back to the JSON; a stale sidecar is never used
 
 
 # ===========================================================================
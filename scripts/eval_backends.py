@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+eval_backends.py - Pluggable runner backends for run_skill_evals.py --live.
+
+A backend turns one prompt into (completed, output), the contract of
+run_skill_evals.invoke_claude. Four backends ship:
+
+    cli      headless `claude -p` subprocess per call (the default)
+    process  one long-lived process speaking JSON lines on stdin/stdout
+    http     POST {"prompt", "max_turns", "timeout"} to an endpoint
+    stub     in-process deterministic stand-in (no model, no network)
+
+The stub answers judge prompts with passing verdicts, trigger prompts with
+a keyword-overlap decision, and scenario tasks with a fixed echo, optionally
+sleeping to simulate model latency. It can also be served over stdio or a
+loopback HTTP port, so the process/http backends - and the eval pipeline's
+own throughput and scheduling - can be exercised without the real CLI.
+
+Usage:
+    python3 eval_backends.py serve --stdio
+    python3 eval_backends.py serve --port 8765 --latency 0.2
+
+Exit Codes:
+    0  - Server stopped cleanly
+    2  - Invalid arguments
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import shlex
+import shutil
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from abc import ABC, abstractmethod
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from common import content_words
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from common import content_words
+
+BACKEND_NAMES = ("cli", "process", "http", "stub")
+
+# Prompt markers the stub keys on (see run_skill_evals.JUDGE_PROMPT and
+# TRIGGER_PROMPT); anything else is treated as a scenario task.
+_JUDGE_MARKER = "You are a strict evaluator."
+_TRIGGER_MARKER = "You are an agent deciding whether to load a skill."
+_ASSERTION_RE = re.compile(r"^- (.+)$", re.MULTILINE)
+_TRIGGER_FIELDS_RE = re.compile(
+    r"^\s*name: (?P<name>.*)\n\s*description: (?P<description>.*)\n"
+    r"(?:.*\n)*?The user says: (?P<query>.*)$",
+    re.MULTILINE,
+)
+
+
+# ===========================================================================
+# BACKENDS
+# ===========================================================================
+
+class RunnerBackend(ABC):
+    """One way of executing a headless prompt. Subclasses implement invoke()."""
+
+    name = "base"
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+
+    def available(self) -> bool:
+        """Return True when the backend can accept prompts."""
+        return True
+
+    @abstractmethod
+    def invoke(self, prompt: str, max_turns: int, timeout: int) -> Tuple[bool, str]:
+        """Run one prompt; return (completed, output)."""
+
+    def run(self, prompt: str, max_turns: int, timeout: int) -> Tuple[bool, str]:
+        """invoke() plus call/latency accounting for the scoreboard."""
+        started = time.monotonic()
+        try:
+            return self.invoke(prompt, max_turns, timeout)
+        finally:
+            with self._lock:
+                self.calls += 1
+                self.seconds += time.monotonic() - started
+
+    def close(self) -> None:
+        """Release any held resources (processes, sockets)."""
+
+    def stats(self) -> Dict[str, Any]:
+        mean = self.seconds / self.calls if self.calls else None
+        return {
+            "backend": self.name,
+            "calls": self.calls,
+            "seconds": round(self.seconds, 3),
+            "mean_seconds": None if mean is None else round(mean, 4),
+        }
+
+
+class CliBackend(RunnerBackend):
+    """Headless `claude -p` subprocess per call."""
+
+    name = "cli"
+
+    def available(self) -> bool:
+        if shutil.which("claude") is None:
+            return False
+        try:
+            probe = subprocess.run(
+                ["claude", "--version"], capture_output=True, text=True, timeout=20,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        return probe.returncode == 0
+
+    def invoke(self, prompt: str, max_turns: int, timeout: int) -> Tuple[bool, str]:
+        try:
+            proc = subprocess.run(
+                ["claude", "-p", prompt, "--max-turns", str(max_turns)],
+                capture_output=True, text=True, timeout=timeout,
+            )
+        except subprocess.TimeoutExpired:
+            return False, f"timed out after {timeout}s"
+        except OSError as exc:
+            return False, f"failed to launch claude: {exc}"
+        if proc.returncode != 0:
+            return False, f"claude exited {proc.returncode}: {proc.stderr.strip()[:500]}"
+        return True, proc.stdout
+
+
+class ProcessBackend(RunnerBackend):
+    """One long-lived process; one JSON request/response line per call.
+
+    Request:  {"prompt": str, "max_turns": int, "timeout": int}
+    Response: {"completed": bool, "output": str}
+
+    Calls are serialized over the single pipe. A process that dies or
+    answers garbage fails the call and is restarted on the next one.
+    """
+
+    name = "process"
+
+    def __init__(self, command: List[str]) -> None:
+        super().__init__()
+        self.command = list(command)
+        self._proc: Optional[subprocess.Popen] = None
+        self._io_lock = threading.Lock()
+
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                self.command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL, text=True, bufsize=1,
+            )
+        return self._proc
+
+    def available(self) -> bool:
+        if not self.command or shutil.which(self.command[0]) is None:
+            return False
+        try:
+            self._ensure_started()
+        except OSError:
+            return False
+        return True
+
+    def invoke(self, prompt: str, max_turns: int, timeout: int) -> Tuple[bool, str]:
+        request = json.dumps({"prompt": prompt, "max_turns": max_turns, "timeout": timeout})
+        with self._io_lock:
+            try:
+                proc = self._ensure_started()
+            except OSError as exc:
+                return False, f"failed to launch backend process: {exc}"
+            reply: List[str] = []
+            reader = threading.Thread(
+                target=lambda: reply.append(proc.stdout.readline()), daemon=True)
+            try:
+                proc.stdin.write(request + "\n")
+                proc.stdin.flush()
+            except (OSError, ValueError) as exc:
+                self._kill()
+                return False, f"backend process unavailable: {exc}"
+            reader.start()
+            reader.join(timeout)
+            if reader.is_alive():
+                self._kill()
+                return False, f"timed out after {timeout}s"
+        if not reply or not reply[0]:
+            self._kill()
+            return False, "backend process exited without a response"
+        return parse_response(reply[0])
+
+    def _kill(self) -> None:
+        if self._proc is not None and self._proc.poll() is None:
+            self._proc.kill()
+            self._proc.wait()
+        self._proc = None
+
+    def close(self) -> None:
+        if self._proc is not None and self._proc.poll() is None:
+            try:
+                self._proc.stdin.close()
+                self._proc.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self._kill()
+        self._proc = None
+
+
+class HttpBackend(RunnerBackend):
+    """POST each prompt as JSON to an HTTP endpoint."""
+
+    name = "http"
+
+    def __init__(self, url: str) -> None:
+        super().__init__()
+        self.url = url
+
+    def available(self) -> bool:
+        return self.url.startswith(("http://", "https://"))
+
+    def invoke(self, prompt: str, max_turns: int, timeout: int) -> Tuple[bool, str]:
+        body = json.dumps({"prompt": prompt, "max_turns": max_turns,
+                           "timeout": timeout}).encode("utf-8")
+        request = urllib.request.Request(
+            self.url, data=body, method="POST",
+            headers={"Content-Type": "application/json"},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                text = response.read().decode("utf-8", errors="replace")
+        except urllib.error.HTTPError as exc:
+            return False, f"backend returned HTTP {exc.code}"
+        except (urllib.error.URLError, OSError) as exc:
+            reason = getattr(exc, "reason", exc)
+            if isinstance(reason, TimeoutError) or "timed out" in str(reason):
+                return False, f"timed out after {timeout}s"
+            return False, f"backend request failed: {reason}"
+        return parse_response(text)
+
+
+class StubBackend(RunnerBackend):
+    """In-process deterministic stand-in; see stub_respond()."""
+
+    name = "stub"
+
+    def __init__(self, latency: float = 0.0) -> None:
+        super().__init__()
+        self.latency = max(0.0, latency)
+
+    def invoke(self, prompt: str, max_turns: int, timeout: int) -> Tuple[bool, str]:
+        if self.latency:
+            if self.latency > timeout:
+                time.sleep(timeout)
+                return False, f"timed out after {timeout}s"
+            time.sleep(self.latency)
+        return True, stub_respond(prompt)
+
+
+def parse_response(text: str) -> Tuple[bool, str]:
+    """Decode a process/http backend reply into (completed, output)."""
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        return False, f"backend returned invalid JSON: {text.strip()[:300]}"
+    if not isinstance(data, dict) or not isinstance(data.get("completed"), bool):
+        return False, f"backend response missing 'completed': {text.strip()[:300]}"
+    return data["completed"], str(data.get("output", ""))
+
+
+def make_backend(name: str, command: Optional[str] = None, url: Optional[str] = None,
+                 latency: float = 0.0) -> RunnerBackend:
+    """Build a backend by name. Raises ValueError on a bad name or missing option."""
+    if name == "cli":
+        return CliBackend()
+    if name == "process":
+        if not command:
+            raise ValueError("the process backend requires --backend-command")
+        return ProcessBackend(shlex.split(command))
+    if name == "http":
+        if not url:
+            raise ValueError("the http backend requires --backend-url")
+        return HttpBackend(url)
+    if name == "stub":
+        return StubBackend(latency)
+    raise ValueError(f"unknown backend: {name} (choose from {', '.join(BACKEND_NAMES)})")
+
+
+# ===========================================================================
+# STUB RESPONDER
+# ===========================================================================
+
+def stub_respond(prompt: str) -> str:
+    """Deterministic stand-in for a model reply to one eval prompt."""
+    if prompt.startswith(_JUDGE_MARKER):
+        assertions_block = prompt.split("Assertions:", 1)[-1].split("Respond with", 1)[0]
+        verdicts = [
+            {"assertion": a.strip(), "pass": True, "evidence": "stub judge"}
+            for a in _ASSERTION_RE.findall(assertions_block)
+        ]
+        return json.dumps({"verdicts": verdicts})
+    if prompt.startswith(_TRIGGER_MARKER):
+        match = _TRIGGER_FIELDS_RE.search(prompt)
+        if not match:
+            return json.dumps({"triggered": False})
+        query = match.group("query").strip().strip("'\"")
+        skill_words = content_words(f"{match.group('name')} {match.group('description')}")
+        triggered = bool(content_words(query) & skill_words)
+        return json.dumps({"triggered": triggered})
+    return f"[stub] completed task: {prompt.strip()[:200]}"
+
+
+def serve_stdio(latency: float) -> int:
+    """JSON-lines server for the process backend (one reply per request line)."""
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+            prompt = str(request.get("prompt", ""))
+        except (json.JSONDecodeError, AttributeError):
+            reply = {"completed": False, "output": "invalid request"}
+        else:
+            if latency:
+                time.sleep(latency)
+            reply = {"completed": True, "output": stub_respond(prompt)}
+        sys.stdout.write(json.dumps(reply) + "\n")
+        sys.stdout.flush()
+    return 0
+
+
+def make_stub_server(port: int, latency: float) -> ThreadingHTTPServer:
+    """Loopback-only HTTP stub server; port 0 picks a free port."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:  # noqa: N802 - http.server naming
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                request = json.loads(self.rfile.read(length) or b"{}")
+                prompt = str(request.get("prompt", ""))
+            except (json.JSONDecodeError, AttributeError):
+                self.send_error(400, "invalid request")
+                return
+            if latency:
+                time.sleep(latency)
+            body = json.dumps({"completed": True,
+                               "output": stub_respond(prompt)}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            return
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    server.daemon_threads = True
+    return server
+
+
+# ===========================================================================
+# CLI
+# ===========================================================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Serve the deterministic stub backend for run_skill_evals.py --live",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s serve --stdio                      # for --backend process
+  %(prog)s serve --port 8765 --latency 0.2    # for --backend http
+        """,
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    serve = sub.add_parser("serve", help="Run the stub responder as a server")
+    where = serve.add_mutually_exclusive_group(required=True)
+    where.add_argument("--stdio", action="store_true",
+                       help="JSON lines on stdin/stdout (process backend)")
+    where.add_argument("--port", type=int,
+                       help="Loopback HTTP port (http backend; 0 = any free port)")
+    serve.add_argument("--latency", type=float, default=0.0,
+                       help="Seconds to sleep per request to simulate a model (default: 0)")
+    args = parser.parse_args(argv)
+
+    if args.stdio:
+        return serve_stdio(args.latency)
+    server = make_stub_server(args.port, args.latency)
+    host, port = server.server_address[:2]
+    print(f"stub backend listening on http://{host}:{port}/", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -41,7 +41,7 @@ from skillforge_config import (  # noqa: E402
     load_config,
     project_key,
 )
-from triage_skill_request import load_skill_index  # noqa: E402
+from triage_skill_request import load_skills  # noqa: E402
 
 
 # The hard budget is 2s; the soft deadline leaves headroom for scoring,
@@ -142,8 +142,8 @@ def main() -> int:
         return 0
 
     # Prebuilt index only. A missing index means no suggestion, never a rebuild.
-    index = load_skill_index()
-    skills = (index or {}).get("skills", [])
+    # The mmap-shared sidecar keeps concurrent sessions on one copy.
+    skills = load_skills() or []
     if not skills:
         return 0
 
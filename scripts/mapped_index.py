@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+mapped_index.py - Read-only, mmap-shared copy of the skill index.
+
+Every Claude Code session runs its own hook processes, and each one used to
+parse skill_index.json into a private tree of dicts. save_index() now also
+writes a binary sidecar (skill_index.bin) that processes map read-only, so
+N sessions share one page-cache copy and only decode the fields they touch.
+
+Layout (little-endian):
+
+    header   magic, format version, field count, record count,
+             size and mtime_ns of the JSON it was built from,
+             records offset, pool offset
+    records  one fixed-size record per skill: a (offset, length, kind) slot
+             per FIELDS entry plus one for any other keys
+    pool     deduplicated UTF-8 strings; kind says raw text or JSON
+
+A sidecar whose recorded size/mtime no longer match the JSON is ignored, so
+a stale or foreign file can never shadow a newer index; callers fall back
+to parsing the JSON. The sidecar is replaced atomically, and processes that
+already mapped the old one keep reading it until they exit.
+
+Usage:
+    python3 mapped_index.py                  # (re)build the sidecar, show stats
+    python3 mapped_index.py --index path/to/skill_index.json --json
+
+Exit Codes:
+    0 - Success
+    1 - General failure
+    2 - Skill index not found (run discover_skills.py first)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from common import get_index_path
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from common import get_index_path
+
+MAGIC = b"SFINDEX\x00"
+FORMAT_VERSION = 1
+# Fields with their own slot, in slot order. Keys not listed here are kept
+# as one JSON object in the trailing "extra" slot.
+FIELDS = (
+    "name", "source", "path", "priority", "description", "triggers", "keywords",
+    "domains", "version", "facts", "domain_terms", "advisor_terms",
+)
+_HEADER = struct.Struct("<8sIIIQqII")
+_SLOT = struct.Struct("<IIB3x")
+_RECORD_SIZE = _SLOT.size * (len(FIELDS) + 1)
+_FIELD_SLOT = {name: i for i, name in enumerate(FIELDS)}
+_EXTRA_SLOT = len(FIELDS)
+
+# Slot kinds
+_ABSENT, _TEXT, _JSON = 0, 1, 2
+
+
+def mapped_path(index_path: Path) -> Path:
+    """Where the sidecar for an index JSON lives."""
+    return Path(index_path).with_suffix(".bin")
+
+
+# ===========================================================================
+# WRITER
+# ===========================================================================
+
+class _Pool:
+    """Append-only string pool that stores each distinct encoding once."""
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+        self._offsets: Dict[bytes, int] = {}
+
+    def add(self, encoded: bytes) -> int:
+        offset = self._offsets.get(encoded)
+        if offset is None:
+            offset = self._offsets[encoded] = len(self.data)
+            self.data += encoded
+        return offset
+
+
+def _encode(value: Any) -> Tuple[int, bytes]:
+    if isinstance(value, str):
+        return _TEXT, value.encode("utf-8")
+    return _JSON, json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def write_mapped_index(skills: List[Dict[str, Any]], index_path: Path) -> Path:
+    """
+    Write the sidecar for index_path (which must already be saved).
+
+    Written to a temporary file and renamed into place, so readers only ever
+    map a complete file.
+    """
+    index_path = Path(index_path)
+    source = index_path.stat()
+    pool = _Pool()
+    records = bytearray()
+    for skill in skills:
+        slots = [(0, 0, _ABSENT)] * (len(FIELDS) + 1)
+        extra = {k: v for k, v in skill.items() if k not in _FIELD_SLOT}
+        values = [(_FIELD_SLOT[k], v) for k, v in skill.items() if k in _FIELD_SLOT]
+        if extra:
+            values.append((_EXTRA_SLOT, extra))
+        for slot, value in values:
+            kind, encoded = _encode(value)
+            slots[slot] = (pool.add(encoded), len(encoded), kind)
+        for slot in slots:
+            records += _SLOT.pack(*slot)
+
+    records_offset = _HEADER.size
+    pool_offset = records_offset + len(records)
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, len(FIELDS), len(skills),
+                          source.st_size, source.st_mtime_ns, records_offset, pool_offset)
+    target = mapped_path(index_path)
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("wb") as handle:
+            handle.write(header)
+            handle.write(records)
+            handle.write(pool.data)
+        os.replace(tmp, target)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+    return target
+
+
+# ===========================================================================
+# READER
+# ===========================================================================
+
+class MappedSkill(Mapping):
+    """One skill record, decoded field by field from the shared mapping."""
+
+    __slots__ = ("_index", "_base")
+
+    def __init__(self, index: "MappedIndex", position: int) -> None:
+        self._index = index
+        self._base = index.records_offset + position * _RECORD_SIZE
+
+    def _slot(self, slot: int) -> Any:
+        offset, length, kind = _SLOT.unpack_from(self._index.buffer, self._base + slot * _SLOT.size)
+        if kind == _ABSENT:
+            raise KeyError(slot)
+        start = self._index.pool_offset + offset
+        raw = self._index.buffer[start:start + length]
+        return raw.decode("utf-8") if kind == _TEXT else json.loads(raw)
+
+    def _extra(self) -> Dict[str, Any]:
+        try:
+            return self._slot(_EXTRA_SLOT)
+        except KeyError:
+            return {}
+
+    def __getitem__(self, key: str) -> Any:
+        slot = _FIELD_SLOT.get(key)
+        if slot is None:
+            return self._extra()[key]
+        try:
+            return self._slot(slot)
+        except KeyError:
+            raise KeyError(key) from None
+
+    def _present(self) -> List[str]:
+        return [name for slot, name in enumerate(FIELDS)
+                if _SLOT.unpack_from(self._index.buffer, self._base + slot * _SLOT.size)[2]]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._present()
+        yield from self._extra()
+
+    def __len__(self) -> int:
+        return len(self._present()) + len(self._extra())
+
+    def __repr__(self) -> str:
+        return f"MappedSkill({self.get('name')!r})"
+
+
+class MappedIndex(Sequence):
+    """The skill records of a sidecar, as a read-only sequence of mappings."""
+
+    def __init__(self, path: Path) -> None:
+        with Path(path).open("rb") as handle:
+            self.buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.buffer) < _HEADER.size:
+            raise ValueError(f"{path}: truncated header")
+        (magic, version, field_count, self.count, self.source_size, self.source_mtime_ns,
+         self.records_offset, self.pool_offset) = _HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC or version != FORMAT_VERSION or field_count != len(FIELDS):
+            raise ValueError(f"{path}: not a v{FORMAT_VERSION} skill index sidecar")
+        if self.pool_offset != self.records_offset + self.count * _RECORD_SIZE \
+                or self.pool_offset > len(self.buffer):
+            raise ValueError(f"{path}: record table does not fit the file")
+
+    def matches(self, index_path: Path) -> bool:
+        """True when this sidecar was built from index_path as it is now."""
+        source = Path(index_path).stat()
+        return (source.st_size, source.st_mtime_ns) == (self.source_size, self.source_mtime_ns)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(self.count))]
+        if position < 0:
+            position += self.count
+        if not 0 <= position < self.count:
+            raise IndexError("skill record out of range")
+        return MappedSkill(self, position)
+
+
+def open_mapped_index(index_path: Path) -> Optional[MappedIndex]:
+    """The current sidecar for index_path, or None (missing, stale, or unreadable)."""
+    try:
+        mapped = MappedIndex(mapped_path(index_path))
+        if mapped.matches(index_path):
+            return mapped
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+# ===========================================================================
+# CLI
+# ===========================================================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Build the mmap-shared sidecar for a skill index",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                                   # shared cache index
+  %(prog)s --index ./skill_index.json --json
+        """,
+    )
+    parser.add_argument("--index", type=Path, help="Skill index (default: shared cache)")
+    parser.add_argument("--json", action="store_true", help="Machine-readable JSON output")
+    args = parser.parse_args(argv)
+
+    index_path = (args.index or get_index_path()).expanduser()
+    try:
+        skills = json.loads(index_path.read_text()).get("skills", [])
+    except (OSError, json.JSONDecodeError, AttributeError):
+        print("Error: skill index not found. Run discover_skills.py first.", file=sys.stderr)
+        return 2
+    try:
+        target = write_mapped_index([s for s in skills if isinstance(s, dict)], index_path)
+    except OSError as exc:
+        print(f"Error: could not write sidecar: {exc}", file=sys.stderr)
+        return 1
+
+    stats = {"index": str(index_path), "sidecar": str(target), "records": len(skills),
+             "json_bytes": index_path.stat().st_size, "sidecar_bytes": target.stat().st_size}
+    if args.json:
+        print(json.dumps(stats, indent=2))
+    else:
+        print(f"Wrote {stats['sidecar']}: {stats['records']} records, "
+              f"{stats['sidecar_bytes']:,} bytes (JSON: {stats['json_bytes']:,} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,11 +15,19 @@ PRIVACY: this script REFUSES to run without --consent. It reads only local
 files, never opens a network connection, and never sends anything anywhere.
 Quoted evidence is redacted for obvious secrets (password / api key / token /
 secret patterns) before it is stored. The only output is a local report and
-a local evidence file for the Context Skill Advisor.
+a local evidence file for the Context Skill Advisor, plus per-transcript
+checkpoints beside it (friction_checkpoints.json) so later runs only parse
+bytes appended since the last run (--no-checkpoints re-reads everything).
+--bounded aggregates in fixed memory instead (approximate pattern counts,
+estimated session counts, a sample of abandoned invocations) and skips
+checkpoints, so neither memory nor disk grows with the size of the history.
 
 Usage:
     python3 mine_skill_friction.py --consent
     python3 mine_skill_friction.py --consent --days 14 --json
+    python3 mine_skill_friction.py --consent --jobs 8
+    python3 mine_skill_friction.py --consent --days 365 --bounded
+    python3 mine_skill_friction.py --consent --days 1 --by-timestamp
 
 Exit Codes:
     0  - Report produced
@@ -30,14 +38,21 @@ Exit Codes:
 from __future__ import annotations
 
 import argparse
+import hashlib
+import heapq
 import json
+import math
+import os
+import random
 import re
 import sys
 import time
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial as bind
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 try:
     from common import get_index_path, phrase_in_text
@@ -136,24 +151,70 @@ def normalize_command(command: str) -> Optional[str]:
 
 # --- transcript parsing (defensive against schema variance) ------------------
 
-def iter_jsonl(path: Path) -> Iterable[dict]:
-    """Yield parsed JSON objects from a transcript, skipping bad lines."""
+# Byte-level pre-filter. mine_partial() only reads assistant tool_use blocks
+# named Skill/Bash and user entries carrying text; everything else - above
+# all user entries that are nothing but (often huge) tool_result payloads -
+# can be dropped before json.loads. The checks are conservative: a line is
+# dropped only when it provably cannot matter. Escaped quotes inside string
+# values (\"Bash\") never match the quoted-token needles.
+_TOOL_USE = b'"tool_use"'
+_RELEVANT_TOOLS = (b'"Skill"', b'"Bash"')
+_USER = b'"user"'
+_TOOL_RESULT = b'"tool_result"'
+_TEXT = b'"text"'
+
+
+def relevant_line(raw: bytes) -> bool:
+    """False only for complete lines mine_partial() provably ignores."""
+    if _TOOL_USE in raw and any(tool in raw for tool in _RELEVANT_TOOLS):
+        return True
+    if _USER not in raw:
+        return False
+    # A user entry with no text block and a tool_result is tool output only.
+    return _TOOL_RESULT not in raw or _TEXT in raw
+
+
+def iter_jsonl_offsets(path: Path, offset: int = 0,
+                       keep: Optional[Callable[[bytes], bool]] = None
+                       ) -> Iterator[Tuple[Optional[dict], int]]:
+    """Yield (entry or None, resume offset) per line from a byte offset.
+
+    The resume offset is just past the line. A torn last line (no newline,
+    not valid JSON - the session is mid-write) is not yielded, so a later
+    run resumes in front of it. Complete lines for which keep(raw) is False
+    are yielded as None without being decoded.
+    """
     try:
-        with path.open(encoding="utf-8", errors="replace") as handle:
-            for line in handle:
-                line = line.strip()
+        with path.open("rb") as handle:
+            handle.seek(offset)
+            position = offset
+            for raw in handle:
+                position += len(raw)
+                if keep is not None and raw.endswith(b"\n") and not keep(raw):
+                    yield None, position
+                    continue
+                line = raw.decode("utf-8", errors="replace").strip()
                 if not line:
+                    yield None, position
                     continue
                 try:
                     obj = json.loads(line)
                 except json.JSONDecodeError:
-                    continue
-                if isinstance(obj, dict):
-                    yield obj
+                    if not raw.endswith(b"\n"):
+                        return
+                    obj = None
+                yield (obj if isinstance(obj, dict) else None), position
     except OSError:
         return
 
 
+def iter_jsonl(path: Path) -> Iterable[dict]:
+    """Yield parsed JSON objects from a transcript, skipping bad lines."""
+    for obj, _offset in iter_jsonl_offsets(path):
+        if obj is not None:
+            yield obj
+
+
 def _content_blocks(entry: dict) -> List[Any]:
     """Extract message content blocks, tolerating schema variants."""
     message = entry.get("message")
@@ -188,13 +249,231 @@ def tool_uses(entry: dict) -> List[dict]:
     return uses
 
 
+# --- timestamp windows ----------------------------------------------------------
+# The mtime filter keeps or drops whole files, so a long-lived session touched
+# today is re-read in full even for --days 1. Entries carry ISO timestamps and
+# are appended in time order, so the first in-window entry can be found by a
+# binary search over byte offsets that decodes only O(log size) lines.
+
+def entry_time(entry: dict) -> Optional[float]:
+    """Epoch seconds of an entry's "timestamp", or None if absent/unparseable."""
+    stamp = entry.get("timestamp")
+    if not isinstance(stamp, str) or not stamp:
+        return None
+    try:  # "Z" is not accepted by fromisoformat() before Python 3.11
+        return datetime.fromisoformat(stamp.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _first_stamped_line(handle: Any, position: int) -> Optional[Tuple[int, float]]:
+    """(start, time) of the first timestamped line starting at or after position."""
+    if position > 0:
+        handle.seek(position - 1)
+        handle.readline()  # finish the line position falls in (or its newline)
+    else:
+        handle.seek(0)
+    while True:
+        start = handle.tell()
+        raw = handle.readline()
+        if not raw:
+            return None
+        try:
+            obj = json.loads(raw)
+        except ValueError:
+            continue
+        stamp = entry_time(obj) if isinstance(obj, dict) else None
+        if stamp is not None:
+            return start, stamp
+
+
+def seek_to_time(path: Path, since: float) -> int:
+    """Byte offset just past the last entry stamped before since (0 if none).
+
+    Assumes entries are appended in time order; stray out-of-order entries
+    past the offset are still dropped by mine_partial(since=...).
+    """
+    try:
+        size = path.stat().st_size
+        with path.open("rb") as handle:
+            lo, hi = 0, size
+            while lo < hi:  # smallest position whose next stamped line is in window
+                mid = (lo + hi) // 2
+                probe = _first_stamped_line(handle, mid)
+                if probe is None or probe[1] >= since:
+                    hi = mid
+                else:
+                    lo = max(mid, probe[0]) + 1
+            if lo == 0:
+                return 0
+            handle.seek(lo - 1)
+            handle.readline()
+            return handle.tell()
+    except OSError:
+        return 0
+
+
+# --- bounded aggregation ------------------------------------------------------
+# Exact stats keep every Bash prefix with a full set of session ids and every
+# abandoned invocation, so memory grows with total history. --bounded swaps in
+# fixed-size stand-ins with the same interface: space-saving top-k counters
+# for prefixes (counts are upper bounds, off by at most "overcount"), a
+# HyperLogLog per tracked prefix for distinct sessions, and a reservoir
+# sample of abandoned invocations.
+
+BOUNDED_PATTERNS = 2048  # prefixes tracked by the space-saving table
+HLL_PRECISION = 8  # 256 one-byte registers, ~6.5% standard error
+ABANDONED_SAMPLE = 200  # abandoned invocations kept in bounded mode
+
+
+class HyperLogLog:
+    """Distinct-count estimate in 2**precision bytes; add() / len() like a set."""
+
+    __slots__ = ("precision", "registers")
+
+    def __init__(self, precision: int = HLL_PRECISION) -> None:
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, item: str) -> None:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "big")
+        width = 64 - self.precision
+        index = value >> width
+        rank = width - (value & ((1 << width) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def __len__(self) -> int:
+        m = len(self.registers)
+        estimate = (0.7213 / (1 + 1.079 / m)) * m * m / sum(
+            2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if zeros and estimate <= 2.5 * m:  # small range: linear counting
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+class SpaceSaving:
+    """Space-saving top-k table of Bash clusters, indexed like the exact dict.
+
+    Looking up an untracked prefix when the table is full evicts the smallest
+    cluster; the newcomer inherits its count as overcount, so every reported
+    count is an upper bound that exceeds the truth by at most "overcount".
+    """
+
+    def __init__(self, capacity: int = BOUNDED_PATTERNS) -> None:
+        self.capacity = max(1, capacity)
+        self.clusters: Dict[str, Dict[str, Any]] = {}
+        self._heap: List[Tuple[int, str]] = []  # one (count <= current, prefix) each
+
+    def __getitem__(self, prefix: str) -> Dict[str, Any]:
+        cluster = self.clusters.get(prefix)
+        if cluster is not None:
+            return cluster
+        floor = 0
+        if len(self.clusters) >= self.capacity:
+            floor = self._evict()
+        cluster = {"count": floor, "sessions": HyperLogLog(), "example": "",
+                   "overcount": floor}
+        self.clusters[prefix] = cluster
+        heapq.heappush(self._heap, (floor, prefix))
+        return cluster
+
+    def _evict(self) -> int:
+        # Counts only grow, so a stale heap entry is re-pushed at its current
+        # count; the first fresh entry popped is the true minimum.
+        while True:
+            count, prefix = heapq.heappop(self._heap)
+            current = self.clusters[prefix]["count"]
+            if current == count:
+                del self.clusters[prefix]
+                return count
+            heapq.heappush(self._heap, (current, prefix))
+
+    def items(self) -> Iterable[Tuple[str, Dict[str, Any]]]:
+        return self.clusters.items()
+
+    def __len__(self) -> int:
+        return len(self.clusters)
+
+
+class Reservoir:
+    """Uniform sample of at most size items from a stream (algorithm R).
+
+    Seeded, so the same transcripts always yield the same sample.
+    """
+
+    def __init__(self, size: int = ABANDONED_SAMPLE, seed: int = 0) -> None:
+        self.size = size
+        self.seen = 0
+        self.items: List[Any] = []
+        self._random = random.Random(seed)
+
+    def extend(self, items: Iterable[Any]) -> None:
+        for item in items:
+            self.seen += 1
+            if len(self.items) < self.size:
+                self.items.append(item)
+            else:
+                slot = self._random.randrange(self.seen)
+                if slot < self.size:
+                    self.items[slot] = item
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
 # --- mining -----------------------------------------------------------------
 
-def mine_session(path: Path, stats: Dict[str, Any]) -> None:
-    """Fold one session transcript into the accumulating stats."""
+def new_stats(bounded: bool = False, max_patterns: int = BOUNDED_PATTERNS
+              ) -> Dict[str, Any]:
+    """Empty accumulator that session partials are folded into.
+
+    bounded swaps the prefix table and the abandoned list for the fixed-size
+    structures above; merge_partial() and mine() use either unchanged.
+    """
+    if bounded:
+        return {
+            "invocations": defaultdict(int),
+            "abandoned": Reservoir(),
+            "bash_clusters": SpaceSaving(max_patterns),
+        }
+    return {
+        "invocations": defaultdict(int),
+        "abandoned": [],
+        "bash_clusters": defaultdict(
+            lambda: {"count": 0, "sessions": set(), "example": ""}),
+    }
+
+
+def mine_partial(path: Path, offset: int = 0, pending_skill: Optional[str] = None,
+                 prefilter: bool = True, since: Optional[float] = None) -> Dict[str, Any]:
+    """Compact, picklable stats for one session transcript.
+
+    {"session", "invocations": {skill: n}, "abandoned": [...],
+    "bash": {prefix: [count, first redacted example]}, "offset",
+    "pending_skill"} - dicts keep first-seen order, so folding partials in
+    transcript order reproduces a serial scan. offset/pending_skill let a
+    later run resume on appended bytes (see combine_partials()). prefilter
+    skips irrelevant lines undecoded (relevant_line()); results are the same.
+    since drops entries stamped earlier (see seek_to_time()).
+    """
     session_id = path.stem
-    pending_skill: Optional[str] = None
-    for entry in iter_jsonl(path):
+    invocations: Dict[str, int] = {}
+    abandoned: List[Dict[str, str]] = []
+    bash: Dict[str, List[Any]] = {}
+    keep = relevant_line if prefilter else None
+    for entry, offset in iter_jsonl_offsets(path, offset, keep):
+        if entry is None:
+            continue
+        if since is not None:
+            stamp = entry_time(entry)
+            if stamp is not None and stamp < since:
+                continue
         entry_type = entry.get("type")
         if entry_type == "assistant":
             for use in tool_uses(entry):
@@ -203,29 +482,200 @@ def mine_session(path: Path, stats: Dict[str, Any]) -> None:
                 if name == "Skill":
                     skill = str(tool_input.get("skill") or "").strip()
                     if skill:
-                        stats["invocations"][skill] += 1
+                        invocations[skill] = invocations.get(skill, 0) + 1
                         pending_skill = skill
                 elif name == "Bash":
                     command = str(tool_input.get("command") or "")
                     prefix = normalize_command(command)
                     if prefix:
-                        cluster = stats["bash_clusters"][prefix]
-                        cluster["count"] += 1
-                        cluster["sessions"].add(session_id)
-                        if not cluster["example"]:
-                            cluster["example"] = redact(command)[:200]
+                        cluster = bash.setdefault(prefix, [0, ""])
+                        cluster[0] += 1
+                        if not cluster[1]:
+                            cluster[1] = redact(command)[:200]
         elif entry_type == "user":
             text = user_text(entry)
             if not text:
                 continue  # tool results are not user speech
             if pending_skill is not None:
                 if is_correction(text):
-                    stats["abandoned"].append({
+                    abandoned.append({
                         "skill": pending_skill,
                         "session": session_id,
                         "user_reaction": redact(text)[:160],
                     })
                 pending_skill = None
+    return {"session": session_id, "invocations": invocations,
+            "abandoned": abandoned, "bash": bash,
+            "offset": offset, "pending_skill": pending_skill}
+
+
+def combine_partials(earlier: Dict[str, Any], later: Dict[str, Any]) -> Dict[str, Any]:
+    """One session's partial for bytes [0, a) followed by [a, b) -> [0, b)."""
+    invocations = dict(earlier["invocations"])
+    for skill, count in later["invocations"].items():
+        invocations[skill] = invocations.get(skill, 0) + count
+    bash = {prefix: list(cluster) for prefix, cluster in earlier["bash"].items()}
+    for prefix, (count, example) in later["bash"].items():
+        cluster = bash.setdefault(prefix, [0, ""])
+        cluster[0] += count
+        if not cluster[1]:
+            cluster[1] = example
+    return {"session": earlier["session"], "invocations": invocations,
+            "abandoned": earlier["abandoned"] + later["abandoned"], "bash": bash,
+            "offset": later["offset"], "pending_skill": later["pending_skill"]}
+
+
+def merge_partial(stats: Dict[str, Any], partial: Dict[str, Any]) -> None:
+    """Fold one session partial into the accumulating stats."""
+    for skill, count in partial["invocations"].items():
+        stats["invocations"][skill] += count
+    stats["abandoned"].extend(partial["abandoned"])
+    for prefix, (count, example) in partial["bash"].items():
+        cluster = stats["bash_clusters"][prefix]
+        cluster["count"] += count
+        cluster["sessions"].add(partial["session"])
+        if not cluster["example"]:
+            cluster["example"] = example
+
+
+def mine_session(path: Path, stats: Dict[str, Any]) -> None:
+    """Fold one session transcript into the accumulating stats."""
+    merge_partial(stats, mine_partial(path))
+
+
+def mine_since(path: Path, since: float) -> Dict[str, Any]:
+    """mine_partial() over only the entries stamped at or after since."""
+    return mine_partial(path, seek_to_time(path, since), since=since)
+
+
+def mine_partials(transcripts: List[Path], jobs: int = 1,
+                  offsets: Optional[List[int]] = None,
+                  pending: Optional[List[Optional[str]]] = None,
+                  since: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+    """Session partials in transcript order; jobs > 1 maps across processes.
+
+    offsets/pending resume each transcript from a checkpoint (default: byte 0);
+    since instead seeks each transcript to its first entry in the window.
+    """
+    if since is not None:
+        fn: Callable[..., Dict[str, Any]] = bind(mine_since, since=since)
+        columns: Tuple[List[Any], ...] = (transcripts,)
+    else:
+        fn = mine_partial
+        columns = (transcripts,
+                   offsets if offsets is not None else [0] * len(transcripts),
+                   pending if pending is not None else [None] * len(transcripts))
+    if jobs <= 1 or len(transcripts) < 2:
+        yield from map(fn, *columns)
+        return
+    chunksize = max(1, len(transcripts) // (jobs * 8))
+    with ProcessPoolExecutor(max_workers=min(jobs, len(transcripts))) as pool:
+        yield from pool.map(fn, *columns, chunksize=chunksize)
+
+
+# --- checkpoints --------------------------------------------------------------
+# Transcripts are append-only. A checkpoint remembers how far a transcript was
+# read (inode, size, byte offset, the bytes just before the offset) and the
+# partial stats up to there, so the next run skips untouched sessions and
+# parses only the bytes appended to growing ones. Partials are already
+# redacted, exactly like the evidence file they sit next to.
+
+CHECKPOINT_VERSION = 1
+_TAIL_BYTES = 32  # re-read before resuming: guards against rewritten files
+
+
+def default_checkpoint_path(evidence_path: Path) -> Path:
+    return evidence_path.parent / "friction_checkpoints.json"
+
+
+def load_checkpoints(path: Path) -> Dict[str, Dict[str, Any]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CHECKPOINT_VERSION:
+        return {}
+    transcripts = data.get("transcripts")
+    return transcripts if isinstance(transcripts, dict) else {}
+
+
+def save_checkpoints(path: Path, checkpoints: Dict[str, Dict[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps({"version": CHECKPOINT_VERSION, "transcripts": checkpoints}),
+                   encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _tail(path: Path, offset: int) -> str:
+    start = max(0, offset - _TAIL_BYTES)
+    with path.open("rb") as handle:
+        handle.seek(start)
+        return handle.read(offset - start).hex()
+
+
+def checkpoint_plan(path: Path, checkpoint: Optional[Dict[str, Any]]) -> str:
+    """"skip" (untouched), "append" (grew since the offset) or "full"."""
+    if not checkpoint:
+        return "full"
+    try:
+        stat = path.stat()
+        if stat.st_ino != checkpoint["inode"] or stat.st_size < checkpoint["offset"]:
+            return "full"
+        if _tail(path, checkpoint["offset"]) != checkpoint["tail"]:
+            return "full"
+    except (OSError, KeyError, TypeError):
+        return "full"
+    if stat.st_size == checkpoint["size"] and stat.st_mtime_ns == checkpoint["mtime_ns"]:
+        return "skip"
+    return "append"
+
+
+def make_checkpoint(path: Path, partial: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    try:
+        stat = path.stat()
+        tail = _tail(path, partial["offset"])
+    except OSError:
+        return None
+    return {"inode": stat.st_ino, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+            "offset": partial["offset"], "tail": tail, "partial": partial}
+
+
+def mine_incremental(transcripts: List[Path], checkpoint_path: Path,
+                     stats: Dict[str, Any], jobs: int = 1) -> Dict[str, int]:
+    """Fold per-transcript partials into stats, using and refreshing checkpoints.
+
+    Partials are merged in transcript order as they arrive. Returns
+    {"skipped", "appended", "parsed"}. Checkpoints for transcripts outside
+    this window are dropped.
+    """
+    previous = load_checkpoints(checkpoint_path)
+    plans = [checkpoint_plan(t, previous.get(str(t))) for t in transcripts]
+    todo = [i for i, plan in enumerate(plans) if plan != "skip"]
+    offsets = [previous[str(transcripts[i])]["offset"] if plans[i] == "append" else 0
+               for i in todo]
+    pending = [previous[str(transcripts[i])]["partial"]["pending_skill"]
+               if plans[i] == "append" else None for i in todo]
+    fresh = mine_partials([transcripts[i] for i in todo], jobs, offsets, pending)
+    checkpoints: Dict[str, Dict[str, Any]] = {}
+    for i, transcript in enumerate(transcripts):
+        key = str(transcript)
+        if plans[i] == "skip":
+            partial = previous[key]["partial"]
+            checkpoints[key] = previous[key]
+        else:
+            partial = next(fresh)
+            if plans[i] == "append":
+                partial = combine_partials(previous[key]["partial"], partial)
+            checkpoint = make_checkpoint(transcript, partial)
+            if checkpoint:
+                checkpoints[key] = checkpoint
+        merge_partial(stats, partial)
+    fresh.close()
+    save_checkpoints(checkpoint_path, checkpoints)
+    counts = {plan: plans.count(plan) for plan in ("skip", "append", "full")}
+    return {"skipped": counts["skip"], "appended": counts["append"],
+            "parsed": counts["full"]}
 
 
 def load_skill_index() -> List[Dict[str, str]]:
@@ -244,47 +694,126 @@ def load_skill_index() -> List[Dict[str, str]]:
     ]
 
 
+def _coverage_haystack(skill: Dict[str, str]) -> str:
+    return f"{skill['name'].replace('-', ' ')} {skill['description']}"
+
+
 def covered_by_skill(prefix: str, skills: List[Dict[str, str]]) -> Optional[str]:
     """Name of an installed skill covering every token of the prefix, if any."""
     tokens = [t for t in prefix.split() if t]
     if not tokens:
         return None
     for skill in skills:
-        haystack = f"{skill['name'].replace('-', ' ')} {skill['description']}"
+        haystack = _coverage_haystack(skill)
         if all(phrase_in_text(token, haystack) for token in tokens):
             return skill["name"]
     return None
 
 
-def mine(projects_dir: Path, days: int, min_sessions: int, min_count: int
-         ) -> Dict[str, Any]:
+# phrase_in_text() bounds matches with [a-z0-9], so a purely alphanumeric
+# token matches a haystack exactly when it is one of the haystack's maximal
+# [a-z0-9] runs.
+_ALNUM_RUN_RE = re.compile(r"[a-z0-9]+")
+
+
+class CoverageIndex:
+    """Token -> skill inverted index giving covered_by_skill()'s answers.
+
+    A prefix's candidate skills are the intersection of the postings of its
+    tokens' alphanumeric runs, so coverage costs one set intersection per
+    cluster instead of clusters x skills x tokens regex searches. Tokens with
+    punctuation ("docker-compose", "./build.sh") are confirmed with
+    phrase_in_text() on the few surviving candidates; the first covering
+    skill in roster order wins, exactly as in the linear scan.
+    """
+
+    def __init__(self, skills: List[Dict[str, str]]) -> None:
+        self.skills = skills
+        self.haystacks = [_coverage_haystack(skill) for skill in skills]
+        self.postings: Dict[str, Set[int]] = defaultdict(set)
+        for i, haystack in enumerate(self.haystacks):
+            for run in set(_ALNUM_RUN_RE.findall(haystack.lower())):
+                self.postings[run].add(i)
+        self.lookups = 0
+        self.regex_checks = 0
+        self.scan_checks = 0  # upper bound the linear scan would have run
+
+    def covering(self, prefix: str) -> Optional[str]:
+        tokens = [t.lower() for t in prefix.split() if t]
+        if not tokens:
+            return None
+        self.lookups += 1
+        self.scan_checks += len(self.skills) * len(tokens)
+        runs: Set[str] = set()
+        verify = []
+        for token in tokens:
+            token_runs = _ALNUM_RUN_RE.findall(token)
+            if not token_runs:  # no anchor for the index: scan like before
+                self.regex_checks += len(self.skills) * len(tokens)
+                return covered_by_skill(prefix, self.skills)
+            runs.update(token_runs)
+            if token_runs != [token]:
+                verify.append(token)
+        postings = sorted((self.postings.get(run, set()) for run in runs), key=len)
+        candidates = set(postings[0]).intersection(*postings[1:]) if postings else set()
+        for i in sorted(candidates):
+            self.regex_checks += len(verify)
+            if all(phrase_in_text(token, self.haystacks[i]) for token in verify):
+                return self.skills[i]["name"]
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "skills": len(self.skills),
+            "indexed_tokens": len(self.postings),
+            "patterns_checked": self.lookups,
+            "regex_checks": self.regex_checks,
+            "linear_scan_checks": self.scan_checks,
+        }
+
+
+def mine(projects_dir: Path, days: int, min_sessions: int, min_count: int,
+         jobs: int = 1, checkpoint_path: Optional[Path] = None,
+         bounded: bool = False, max_patterns: int = BOUNDED_PATTERNS,
+         by_timestamp: bool = False) -> Dict[str, Any]:
+    """Mine transcripts modified in the last days into the evidence dict.
+
+    by_timestamp also windows inside each transcript on entry timestamps
+    (seeking past old entries); it reads no checkpoints, since a checkpoint's
+    partial covers entries that slide out of the window. bounded reads and
+    writes none either: a checkpoint keeps each transcript's exact partial,
+    which would grow with the history the sketches are meant to cap.
+    """
     cutoff = time.time() - days * 86400
     transcripts = [
         p for p in sorted(projects_dir.glob("*/*.jsonl"))
         if p.is_file() and p.stat().st_mtime >= cutoff
     ]
-    stats: Dict[str, Any] = {
-        "invocations": defaultdict(int),
-        "abandoned": [],
-        "bash_clusters": defaultdict(
-            lambda: {"count": 0, "sessions": set(), "example": ""}),
-    }
-    for transcript in transcripts:
-        mine_session(transcript, stats)
+    stats = new_stats(bounded, max_patterns)
+    checkpoint_counts = None
+    if checkpoint_path is not None and not (by_timestamp or bounded):
+        checkpoint_counts = mine_incremental(transcripts, checkpoint_path, stats, jobs)
+    else:
+        since = cutoff if by_timestamp else None
+        for partial in mine_partials(transcripts, jobs, since=since):
+            merge_partial(stats, partial)
 
-    skills = load_skill_index()
+    started = time.perf_counter()
+    coverage = CoverageIndex(load_skill_index())
     candidates = []
     covered = []
     for prefix, cluster in stats["bash_clusters"].items():
         if len(cluster["sessions"]) < min_sessions or cluster["count"] < min_count:
             continue
-        covering = covered_by_skill(prefix, skills)
+        covering = coverage.covering(prefix)
         record = {
             "pattern": prefix,
             "occurrences": cluster["count"],
             "sessions": len(cluster["sessions"]),
             "example": cluster["example"],
         }
+        if cluster.get("overcount"):
+            record["overcount"] = cluster["overcount"]
         if covering:
             record["covered_by"] = covering
             covered.append(record)
@@ -292,17 +821,33 @@ def mine(projects_dir: Path, days: int, min_sessions: int, min_count: int
             candidates.append(record)
     candidates.sort(key=lambda c: (c["sessions"], c["occurrences"]), reverse=True)
     covered.sort(key=lambda c: (c["sessions"], c["occurrences"]), reverse=True)
+    coverage_stats = coverage.stats()
+    coverage_stats["seconds"] = round(time.perf_counter() - started, 4)
+    coverage_stats["check_reduction"] = round(
+        coverage_stats["linear_scan_checks"] / max(1, coverage_stats["regex_checks"]), 1)
 
     invocations = dict(sorted(stats["invocations"].items(),
                               key=lambda kv: kv[1], reverse=True))
+    bounded_info = None
+    if bounded:
+        bounded_info = {
+            "max_patterns": stats["bash_clusters"].capacity,
+            "patterns_tracked": len(stats["bash_clusters"]),
+            "abandoned_total": stats["abandoned"].seen,
+            "abandoned_sampled": len(stats["abandoned"]),
+        }
     return {
         "generated_at": datetime.now().isoformat(),
         "days": days,
+        "window": "entry timestamps" if by_timestamp else "file mtime",
         "transcripts_scanned": len(transcripts),
+        "checkpoints": checkpoint_counts,
+        "bounded": bounded_info,
         "skill_invocations": invocations,
-        "abandoned": stats["abandoned"],
+        "abandoned": list(stats["abandoned"]),
         "candidate_patterns": candidates,
         "covered_patterns": covered,
+        "coverage_stats": coverage_stats,
     }
 
 
@@ -314,6 +859,20 @@ def format_report(data: Dict[str, Any]) -> str:
         f"Skill friction report - last {data['days']} days "
         f"({data['transcripts_scanned']} transcripts, local only)",
         f"{'=' * 64}",
+    ]
+    if data.get("window") == "entry timestamps":
+        lines.append("Window: entry timestamps (older entries in active sessions skipped)")
+    if data.get("checkpoints"):
+        ckpt = data["checkpoints"]
+        lines.append(f"Checkpoints: {ckpt['skipped']} untouched, {ckpt['appended']} "
+                     f"resumed on appended bytes, {ckpt['parsed']} parsed in full")
+    if data.get("bounded"):
+        info = data["bounded"]
+        lines.append(f"Bounded: {info['patterns_tracked']}/{info['max_patterns']} patterns "
+                     f"tracked, {info['abandoned_sampled']} of {info['abandoned_total']} "
+                     "abandoned invocations sampled; counts are upper bounds, "
+                     "sessions estimated")
+    lines += [
         f"\n{'Skill invocations':-^64}",
     ]
     if data["skill_invocations"]:
@@ -345,6 +904,13 @@ def format_report(data: Dict[str, Any]) -> str:
             lines.append(f"  {c['occurrences']:>4}x `{c['pattern']}` "
                          f"-> covered by {c['covered_by']} (is it firing?)")
 
+    cov = data.get("coverage_stats")
+    if cov and cov["patterns_checked"]:
+        lines.append(f"\nCoverage check: {cov['patterns_checked']} patterns x {cov['skills']} "
+                     f"skills in {cov['seconds'] * 1000:.1f} ms via token index "
+                     f"({cov['regex_checks']} regex checks instead of up to "
+                     f"{cov['linear_scan_checks']}, {cov['check_reduction']}x fewer)")
+
     lines.append("\nNothing left this machine. Evidence written locally only.")
     lines.append("=" * 64 + "\n")
     return "\n".join(lines)
@@ -380,6 +946,9 @@ def main(argv: Optional[List[str]] = None) -> int:
 Examples:
   %(prog)s --consent
   %(prog)s --consent --days 14 --json
+  %(prog)s --consent --jobs 8          # many-GB transcript dirs
+  %(prog)s --consent --days 365 --bounded   # a year of history, fixed memory
+  %(prog)s --consent --days 1 --by-timestamp  # only today's entries
         """,
     )
     parser.add_argument("--consent", action="store_true",
@@ -392,6 +961,22 @@ Examples:
     parser.add_argument("--output", type=Path, default=DEFAULT_EVIDENCE_PATH,
                         help="Advisor evidence file (default: "
                              "~/.local/share/skillforge/friction.json)")
+    parser.add_argument("--jobs", type=int, default=1, metavar="N",
+                        help="Mine transcripts on N processes (default: 1, serial); "
+                             "output is identical to the serial run")
+    parser.add_argument("--by-timestamp", action="store_true",
+                        help="Window on each entry's timestamp, not just file mtime: "
+                             "seek past older entries in long-lived sessions "
+                             "(implies --no-checkpoints)")
+    parser.add_argument("--no-checkpoints", action="store_true",
+                        help="Re-read every transcript from byte zero and leave the "
+                             "checkpoint file alone")
+    parser.add_argument("--bounded", action="store_true",
+                        help="Aggregate in fixed memory: top-k pattern counts, "
+                             "estimated session counts, sampled abandoned invocations "
+                             "(implies --no-checkpoints)")
+    parser.add_argument("--max-patterns", type=int, default=BOUNDED_PATTERNS, metavar="N",
+                        help=f"Patterns tracked with --bounded (default: {BOUNDED_PATTERNS})")
     parser.add_argument("--min-sessions", type=int, default=3,
                         help="Sessions a pattern must span to be a candidate (default: 3)")
     parser.add_argument("--min-count", type=int, default=5,
@@ -401,6 +986,12 @@ Examples:
     if not args.consent:
         print(REFUSAL, file=sys.stderr)
         return 2
+    if args.jobs < 1:
+        print("Error: --jobs must be at least 1", file=sys.stderr)
+        return 2
+    if args.max_patterns < 1:
+        print("Error: --max-patterns must be at least 1", file=sys.stderr)
+        return 2
 
     projects_dir = args.projects_dir.expanduser().resolve()
     if not projects_dir.is_dir():
@@ -408,8 +999,14 @@ Examples:
         return 1
 
     try:
-        data = mine(projects_dir, args.days, args.min_sessions, args.min_count)
-        write_evidence(data, args.output.expanduser())
+        output = args.output.expanduser()
+        checkpoint_path = (None if args.no_checkpoints or args.by_timestamp or args.bounded
+                           else default_checkpoint_path(output))
+        data = mine(projects_dir, args.days, args.min_sessions, args.min_count,
+                    jobs=args.jobs, checkpoint_path=checkpoint_path,
+                    bounded=args.bounded, max_patterns=args.max_patterns,
+                    by_timestamp=args.by_timestamp)
+        write_evidence(data, output)
     except OSError as exc:
         print(f"Error: {exc}", file=sys.stderr)
         return 1
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+replay_triage.py - Triage regression replay against a frozen index snapshot.
+
+Replays a labeled corpus of queries through triage (triage_many(), the same
+routing as triage_request() with the roster prepared once) and reports:
+
+  - action accuracy and an expected -> actual action confusion table
+  - skill accuracy (the routed skill: target_skill, else the first
+    recommended skill / chain entry, else none)
+  - throughput (queries/second, best of --repeat runs) and p50/p95 latency
+
+A baseline file pins those numbers for one corpus + snapshot pair; later runs
+fail when accuracy drops or throughput falls further than the tolerances.
+
+Corpus (JSONL, one object per line):
+    {"query": "review this PR", "expected_action": "USE_EXISTING",
+     "expected_skill": "code-review", "id": "optional"}
+    expected_action / expected_skill are each optional; "expected_skill": null
+    asserts that no skill is routed.
+
+Usage:
+    python3 replay_triage.py --freeze snapshot.json          # pin the current index
+    python3 replay_triage.py corpus.jsonl --index snapshot.json
+    python3 replay_triage.py corpus.jsonl --index snapshot.json --baseline b.json --save-baseline
+    python3 replay_triage.py corpus.jsonl --index snapshot.json --baseline b.json
+
+Exit Codes:
+    0  - Replay ran, no regression against the baseline
+    1  - General failure (unreadable or empty corpus)
+    2  - Index snapshot not found (or bad arguments)
+    10 - Regression: accuracy or throughput below the baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import shutil
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    from common import get_index_path
+    from triage_skill_request import triage_many
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from common import get_index_path
+    from triage_skill_request import triage_many
+
+BASELINE_VERSION = 1
+# Throughput may fall this far below the baseline before the run fails;
+# wall-clock numbers are noisy, accuracy numbers are not.
+DEFAULT_SPEED_TOLERANCE = 0.30
+DEFAULT_ACCURACY_TOLERANCE = 0.0
+
+
+# ===========================================================================
+# CORPUS AND SNAPSHOT
+# ===========================================================================
+
+def load_corpus(path: Path) -> List[Dict[str, Any]]:
+    """Labeled cases from JSONL; raises ValueError on a malformed line."""
+    cases = []
+    for line_no, line in enumerate(path.read_text(encoding="utf-8").splitlines(), 1):
+        if not line.strip():
+            continue
+        try:
+            case = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"{path}:{line_no}: {exc.msg}") from exc
+        if not isinstance(case, dict) or not isinstance(case.get("query"), str):
+            raise ValueError(f"{path}:{line_no}: expected an object with a \"query\" string")
+        case.setdefault("id", f"line-{line_no}")
+        cases.append(case)
+    return cases
+
+
+def file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+
+
+def freeze_index(destination: Path, source: Optional[Path] = None) -> Path:
+    """Copy the live skill index to a snapshot file replays can pin."""
+    source = source or get_index_path()
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(source, destination)
+    return destination
+
+
+# ===========================================================================
+# REPLAY
+# ===========================================================================
+
+def routed_skill(data: Dict[str, Any]) -> Optional[str]:
+    """The skill a triage result sends the user to, if any."""
+    details = data.get("details", {})
+    if details.get("target_skill"):
+        return details["target_skill"]
+    for key in ("recommended_skills", "recommended_chain"):
+        if details.get(key):
+            return details[key][0]
+    return None
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def replay_once(cases: List[Dict[str, Any]], index_path: Path
+                ) -> Optional[Dict[str, Any]]:
+    """One timed pass: per-case outcomes plus latencies (None if no index).
+
+    The first latency includes loading the snapshot, as a cold hook call would.
+    """
+    outcomes: List[Dict[str, Any]] = []
+    latencies: List[float] = []
+    results = triage_many((case["query"] for case in cases), index_path)
+    start = last = time.perf_counter()
+    for case, result in zip(cases, results):
+        now = time.perf_counter()
+        if not result.success:
+            return None
+        latencies.append(now - last)
+        outcomes.append({
+            "id": case["id"],
+            "action": result.data["action"],
+            "skill": routed_skill(result.data),
+        })
+        last = time.perf_counter()
+    return {"outcomes": outcomes, "latencies": latencies,
+            "seconds": time.perf_counter() - start}
+
+
+def score_replay(cases: List[Dict[str, Any]], outcomes: List[Dict[str, Any]]
+                 ) -> Dict[str, Any]:
+    """Accuracy, confusion and mistakes for one pass's outcomes."""
+    confusion: Dict[str, Counter] = {}
+    action_total = action_hits = skill_total = skill_hits = 0
+    mistakes = []
+    for case, outcome in zip(cases, outcomes):
+        wrong = {}
+        if "expected_action" in case:
+            expected = str(case["expected_action"])
+            action_total += 1
+            confusion.setdefault(expected, Counter())[outcome["action"]] += 1
+            if outcome["action"] == expected:
+                action_hits += 1
+            else:
+                wrong["action"] = outcome["action"]
+        if "expected_skill" in case:
+            skill_total += 1
+            if outcome["skill"] == case["expected_skill"]:
+                skill_hits += 1
+            else:
+                wrong["skill"] = outcome["skill"]
+        if wrong:
+            mistakes.append({"id": case["id"], "query": case["query"][:120],
+                             "expected_action": case.get("expected_action"),
+                             "expected_skill": case.get("expected_skill"), "got": wrong})
+    return {
+        "action_accuracy": round(action_hits / action_total, 4) if action_total else None,
+        "skill_accuracy": round(skill_hits / skill_total, 4) if skill_total else None,
+        "labeled_actions": action_total,
+        "labeled_skills": skill_total,
+        "confusion": {exp: dict(row) for exp, row in sorted(confusion.items())},
+        "mistakes": mistakes,
+    }
+
+
+def replay(cases: List[Dict[str, Any]], index_path: Path, repeat: int = 3
+           ) -> Optional[Dict[str, Any]]:
+    """Replay the corpus repeat times; quality from the first pass, speed from the best."""
+    passes = []
+    for _ in range(max(1, repeat)):
+        run = replay_once(cases, index_path)
+        if run is None:
+            return None
+        passes.append(run)
+    report = score_replay(cases, passes[0]["outcomes"])
+    best = min(passes, key=lambda run: run["seconds"])
+    report.update({
+        "queries": len(cases),
+        "queries_per_second": round(len(cases) / best["seconds"], 1) if best["seconds"] else None,
+        "p50_ms": round(_percentile(best["latencies"], 0.50) * 1000, 3),
+        "p95_ms": round(_percentile(best["latencies"], 0.95) * 1000, 3),
+        "stable": all(run["outcomes"] == passes[0]["outcomes"] for run in passes),
+    })
+    return report
+
+
+# ===========================================================================
+# BASELINES
+# ===========================================================================
+
+def make_baseline(report: Dict[str, Any], corpus: Path, index_path: Path) -> Dict[str, Any]:
+    return {
+        "version": BASELINE_VERSION,
+        "corpus_digest": file_digest(corpus),
+        "index_digest": file_digest(index_path),
+        "queries": report["queries"],
+        "action_accuracy": report["action_accuracy"],
+        "skill_accuracy": report["skill_accuracy"],
+        "queries_per_second": report["queries_per_second"],
+    }
+
+
+def compare_to_baseline(report: Dict[str, Any], baseline: Dict[str, Any],
+                        current: Dict[str, Any],
+                        accuracy_tolerance: float = DEFAULT_ACCURACY_TOLERANCE,
+                        speed_tolerance: float = DEFAULT_SPEED_TOLERANCE
+                        ) -> Dict[str, List[str]]:
+    """{"regressions": [...], "warnings": [...]} for this run vs a stored baseline."""
+    regressions: List[str] = []
+    warnings: List[str] = []
+    for key in ("corpus_digest", "index_digest"):
+        if baseline.get(key) != current[key]:
+            warnings.append(f"{key.split('_')[0]} changed since the baseline was saved")
+    for key in ("action_accuracy", "skill_accuracy"):
+        then, now = baseline.get(key), report.get(key)
+        if then is not None and now is not None and now < then - accuracy_tolerance:
+            regressions.append(f"{key} fell from {then:.2%} to {now:.2%}")
+    then, now = baseline.get("queries_per_second"), report.get("queries_per_second")
+    if then and now and now < then * (1 - speed_tolerance):
+        regressions.append(f"throughput fell from {then} to {now} queries/s "
+                           f"(tolerance {speed_tolerance:.0%})")
+    return {"regressions": regressions, "warnings": warnings}
+
+
+# ===========================================================================
+# CLI
+# ===========================================================================
+
+def format_report(report: Dict[str, Any]) -> str:
+    def pct(value: Optional[float]) -> str:
+        return "n/a" if value is None else f"{value:.1%}"
+
+    lines = [
+        f"\n{'=' * 60}",
+        f"TRIAGE REPLAY: {report['queries']} queries",
+        f"{'=' * 60}",
+        f"Action accuracy: {pct(report['action_accuracy'])} "
+        f"({report['labeled_actions']} labeled)",
+        f"Skill accuracy:  {pct(report['skill_accuracy'])} "
+        f"({report['labeled_skills']} labeled)",
+        f"Throughput: {report['queries_per_second']} queries/s "
+        f"(p50 {report['p50_ms']} ms, p95 {report['p95_ms']} ms)",
+    ]
+    if not report["stable"]:
+        lines.append("WARNING: routing differed between repeated passes")
+    if report["confusion"]:
+        lines.append("\nExpected -> actual actions:")
+        for expected, row in report["confusion"].items():
+            cells = ", ".join(f"{action} {count}" for action, count in sorted(row.items()))
+            lines.append(f"  {expected:<18} {cells}")
+    if report["mistakes"]:
+        lines.append(f"\nMistakes ({len(report['mistakes'])}):")
+        for item in report["mistakes"][:20]:
+            lines.append(f"  [{item['id']}] {item['query']!r} -> {item['got']}")
+    baseline = report.get("baseline")
+    if baseline:
+        for warning in baseline["warnings"]:
+            lines.append(f"\nBaseline warning: {warning}")
+        if baseline["regressions"]:
+            lines.append("\nREGRESSIONS:")
+            lines.extend(f"  - {item}" for item in baseline["regressions"])
+        else:
+            lines.append("\nNo regression against the baseline.")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Replay a labeled query corpus through triage and track "
+                    "accuracy and throughput against a baseline",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s --freeze snapshots/index.json
+  %(prog)s corpus.jsonl --index snapshots/index.json
+  %(prog)s corpus.jsonl --index snapshots/index.json --baseline baseline.json --save-baseline
+  %(prog)s corpus.jsonl --index snapshots/index.json --baseline baseline.json --json
+        """,
+    )
+    parser.add_argument("corpus", type=Path, nargs="?", help="Labeled JSONL query corpus")
+    parser.add_argument("--index", type=Path, help="Frozen index snapshot to route against")
+    parser.add_argument("--freeze", type=Path, metavar="SNAPSHOT",
+                        help="Copy the live skill index to SNAPSHOT and exit")
+    parser.add_argument("--baseline", type=Path, help="Baseline file to compare against")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Write this run's numbers to --baseline instead of comparing")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Timed passes; throughput is the best (default: 3)")
+    parser.add_argument("--accuracy-tolerance", type=float, default=DEFAULT_ACCURACY_TOLERANCE,
+                        help="Allowed accuracy drop, as a fraction (default: 0)")
+    parser.add_argument("--speed-tolerance", type=float, default=DEFAULT_SPEED_TOLERANCE,
+                        help="Allowed throughput drop, as a fraction (default: 0.30)")
+    parser.add_argument("--json", action="store_true", help="Machine-readable JSON output")
+    args = parser.parse_args(argv)
+
+    if args.freeze:
+        try:
+            freeze_index(args.freeze)
+        except OSError as exc:
+            print(f"Error: cannot snapshot the skill index: {exc}", file=sys.stderr)
+            return 2
+        print(f"Index snapshot written to: {args.freeze}")
+        return 0
+    if args.corpus is None or args.index is None:
+        parser.print_usage(sys.stderr)
+        print("Error: a corpus and --index SNAPSHOT are required", file=sys.stderr)
+        return 2
+    if args.save_baseline and not args.baseline:
+        print("Error: --save-baseline needs --baseline FILE", file=sys.stderr)
+        return 2
+    if not args.index.is_file():
+        print(f"Error: index snapshot not found: {args.index}", file=sys.stderr)
+        return 2
+
+    try:
+        cases = load_corpus(args.corpus)
+    except (OSError, ValueError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    if not cases:
+        print(f"Error: no queries in {args.corpus}", file=sys.stderr)
+        return 1
+
+    report = replay(cases, args.index, args.repeat)
+    if report is None:
+        print(f"Error: index snapshot could not be loaded: {args.index}", file=sys.stderr)
+        return 2
+
+    current = make_baseline(report, args.corpus, args.index)
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+    elif args.baseline:
+        try:
+            stored = json.loads(args.baseline.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as exc:
+            print(f"Error: cannot read baseline {args.baseline}: {exc}", file=sys.stderr)
+            return 1
+        report["baseline"] = compare_to_baseline(
+            report, stored, current, args.accuracy_tolerance, args.speed_tolerance)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_report(report))
+        if args.save_baseline:
+            print(f"Baseline written to: {args.baseline}")
+    if report.get("baseline", {}).get("regressions"):
+        return 10
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
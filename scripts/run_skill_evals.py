@@ -19,73 +19,77 @@ Modes:
                         assertions judged by a second headless call; trigger
                         queries are routed live to measure recall/precision.
 
+Live runs go through a runner backend (eval_backends.py): `cli` (default,
+one `claude -p` subprocess per call), `process` (a persistent JSON-lines
+process), `http` (an endpoint), or `stub` (a deterministic local stand-in
+for load-testing and profiling the pipeline without the real CLI).
+
+--results FILE streams every check and every finished scenario run / trigger
+query to a JSONL file as it completes, and the final report is rendered from
+that file. --resume reuses the runs FILE already holds, so a long live run
+that dies at scenario 9 of 10 picks up at scenario 9.
+
+--roster evaluates every skill in the skill index that ships an evals/
+directory: static checks across a process pool (--jobs), live checks with at
+most --concurrency calls in flight and an optional wall-clock --budget, and
+one consolidated report with per-skill timing. --roster --confusion routes
+every roster trigger query through the local triage scorer and reports a
+skill x skill confusion matrix: routing collisions without model calls.
+
 Usage:
     python3 run_skill_evals.py <skill-dir>
     python3 run_skill_evals.py <skill-dir> --static --json
     python3 run_skill_evals.py <skill-dir> --live --max-turns 12 --timeout 300
+    python3 run_skill_evals.py <skill-dir> --live --backend stub --stub-latency 0.5
+    python3 run_skill_evals.py <skill-dir> --live --results runs.jsonl [--resume]
+    python3 run_skill_evals.py --roster [--live --concurrency 8 --budget 3600]
+    python3 run_skill_evals.py --roster --confusion --json
 
 Exit Codes:
     0  - All checks passed
     1  - General failure (bad path, unreadable skill)
     2  - Invalid arguments
     10 - One or more eval checks failed
-    11 - --live requested but the `claude` CLI is unavailable
+    11 - --live requested but the `claude` CLI (or chosen backend) is unavailable
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
-import shutil
-import subprocess
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 try:
-    from common import phrase_in_text
+    from _constants import WEAK_MATCH_THRESHOLD
+    from common import content_words, get_index_path, phrase_in_text
+    from eval_backends import BACKEND_NAMES, CliBackend, RunnerBackend, make_backend
     from frontmatter import parse_yaml_mapping, read_skill_frontmatter, split_frontmatter
+    from triage_skill_request import classify_input, find_matching_skills_many, load_skill_index
 except ImportError:
     sys.path.insert(0, str(Path(__file__).resolve().parent))
-    from common import phrase_in_text
+    from _constants import WEAK_MATCH_THRESHOLD
+    from common import content_words, get_index_path, phrase_in_text
+    from eval_backends import BACKEND_NAMES, CliBackend, RunnerBackend, make_backend
     from frontmatter import parse_yaml_mapping, read_skill_frontmatter, split_frontmatter
+    from triage_skill_request import classify_input, find_matching_skills_many, load_skill_index
 
 
 # ===========================================================================
-# TOKENIZATION (shared with skillforge_doctor.py - import from here)
+# PLACEHOLDERS
 # ===========================================================================
 
-# Function words carry no triggering signal; excluded from keyword matching.
-STOPWORDS = frozenset("""
-a about above after again all also am an and any are as at be because been
-before being below between both but by can cannot could did do does doing
-down during each few for from further get got had has have having he her
-here hers him his how i if in into is it its itself just like me more most
-my no nor not now of off on once only or other our ours out over own same
-she should so some such than that the their theirs them then there these
-they this those through to too under until up use used using very want was
-we were what when where which while who whom why will with would you your
-yours yourself
-""".split())
-
 # TODO placeholders (from init_skill.py scaffolds) are structurally valid but
 # carry no lintable keywords - they pass structure checks and skip the lint.
 _TODO_RE = re.compile(r"\btodo\b", re.IGNORECASE)
 
-_WORD_RE = re.compile(r"[a-z0-9]+(?:['-][a-z0-9]+)*")
-
-
-def content_words(text: str) -> set:
-    """Extract meaningful lowercase keywords (word-boundary, no stopwords)."""
-    words = set()
-    for token in _WORD_RE.findall(text.lower()):
-        if len(token) < 3 or token in STOPWORDS or token.isdigit():
-            continue
-        words.add(token)
-    return words
-
 
 def is_placeholder(query: str) -> bool:
     """A TODO placeholder query counts as structurally valid, unlinted."""
@@ -120,10 +124,38 @@ class EvalReport:
     mode: str
     checks: List[Check] = field(default_factory=list)
     scoreboard: Dict[str, Any] = field(default_factory=dict)
+    # Optional JSONL results stream; `unit` labels the checks being added.
+    stream: Optional["ResultStream"] = field(default=None, repr=False)
+    unit: str = "static"
 
     def add(self, target: str, name: str, passed: bool,
             message: str = "", evidence: str = "") -> None:
-        self.checks.append(Check(target, name, bool(passed), message, evidence))
+        check = Check(target, name, bool(passed), message, evidence)
+        self.checks.append(check)
+        if self.stream is not None:
+            self.stream.check(self.unit, check)
+
+    def replay(self, unit: str) -> Optional[Dict[str, Any]]:
+        """Reuse a live unit finished by an earlier streamed run (--resume).
+
+        Returns the unit record (its checks are re-added) or None when the
+        unit still has to run; None always without a stream. Also makes
+        `unit` the label for the checks that follow.
+        """
+        self.unit = unit
+        if self.stream is None:
+            return None
+        done = self.stream.completed.get(unit)
+        if done is None:
+            return None
+        record, checks = done
+        self.checks.extend(Check(**c) for c in checks)
+        return record
+
+    def complete(self, unit: str, record: Dict[str, Any]) -> None:
+        """Mark a live unit finished in the stream (the --resume checkpoint)."""
+        if self.stream is not None:
+            self.stream.complete(unit, record)
 
     @property
     def failures(self) -> List[Check]:
@@ -144,6 +176,136 @@ class EvalReport:
         }
 
 
+# ===========================================================================
+# RESULT STREAM (--results / --resume)
+# ===========================================================================
+# One JSON object per line, flushed as it happens, so a run that dies keeps
+# everything it finished:
+#   {"type": "start", "skill_dir", "mode", "resume", "at"}  per invocation
+#   {"type": "check", "unit", "target", "name", ...}    every recorded check
+#   {"type": "unit", "unit", "kind", ...}               a finished live unit
+#   {"type": "finish", "backend": {...}}                live runs only
+# A unit is one scenario run (judge included) or one trigger query. Checks
+# only count once their unit record exists; static checks come from the
+# latest start.
+
+class ResultStream:
+    """Append-only JSONL results file with resume bookkeeping."""
+
+    def __init__(self, path: Path, resume: bool = False) -> None:
+        self.path = path
+        self.completed: Dict[str, Tuple[Dict[str, Any], List[Dict[str, Any]]]] = {}
+        self.header: Optional[Dict[str, Any]] = None
+        if resume:
+            state = load_stream(path)
+            self.completed = state["completed"]
+            self.header = state["header"]
+            trim_torn_tail(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = path.open("a" if resume else "w", encoding="utf-8")
+
+    def emit(self, record: Dict[str, Any]) -> None:
+        self._handle.write(json.dumps(record) + "\n")
+        self._handle.flush()
+
+    def start(self, skill_dir: str, mode: str, resume: bool = False) -> None:
+        self.emit({"type": "start", "skill_dir": skill_dir, "mode": mode,
+                   "resume": resume, "at": datetime.now().isoformat()})
+
+    def check(self, unit: str, check: Check) -> None:
+        self.emit({"type": "check", "unit": unit, **check.to_dict()})
+
+    def complete(self, unit: str, record: Dict[str, Any]) -> None:
+        self.emit({"type": "unit", "unit": unit, **record})
+
+    def finish(self, backend: Dict[str, Any]) -> None:
+        self.emit({"type": "finish", "backend": backend})
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+def trim_torn_tail(path: Path) -> None:
+    """Cut a half-written last line, so appended records start on their own line."""
+    try:
+        with path.open("rb+") as handle:
+            data = handle.read()
+            if data and not data.endswith(b"\n"):
+                handle.truncate(data.rfind(b"\n") + 1)
+    except OSError:
+        pass
+
+
+def load_stream(path: Path) -> Dict[str, Any]:
+    """Fold a results file into static checks, finished units, and metadata.
+
+    Truncated or malformed lines (a run killed mid-write) are skipped.
+    """
+    state: Dict[str, Any] = {"header": None, "static": [], "completed": {},
+                             "order": [], "backend": None}
+    pending: Dict[str, List[Dict[str, Any]]] = {}
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return state
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(record, dict):
+            continue
+        kind = record.get("type")
+        if kind == "start":
+            state["header"] = record
+            state["static"] = []
+            pending = {}
+            if not record.get("resume"):
+                state["completed"], state["order"] = {}, []
+        elif kind == "check":
+            check = {k: record.get(k) for k in ("target", "name", "passed",
+                                                "message", "evidence")}
+            if record.get("unit") == "static":
+                state["static"].append(check)
+            else:
+                pending.setdefault(str(record.get("unit")), []).append(check)
+        elif kind == "unit":
+            unit = str(record.get("unit"))
+            if unit not in state["completed"]:
+                state["order"].append(unit)
+            state["completed"][unit] = (record, pending.pop(unit, []))
+        elif kind == "finish":
+            state["backend"] = record.get("backend")
+    return state
+
+
+def report_from_stream(path: Path) -> EvalReport:
+    """Rebuild the full EvalReport (checks + scoreboard) from a results file."""
+    state = load_stream(path)
+    header = state["header"] or {}
+    report = EvalReport(skill_dir=str(header.get("skill_dir", "")),
+                        mode=str(header.get("mode", "static")))
+    report.checks.extend(Check(**c) for c in state["static"])
+
+    scenarios: Dict[str, Any] = {}
+    outcomes: List[Tuple[str, Optional[bool]]] = []
+    for unit in state["order"]:
+        record, checks = state["completed"][unit]
+        report.checks.extend(Check(**c) for c in checks)
+        if record.get("kind") == "scenario_run":
+            scenarios.setdefault(record["scenario"], []).append(record["result"])
+        elif record.get("kind") == "trigger":
+            outcomes.append((record["group"], record["result"]))
+    if scenarios:
+        report.scoreboard["scenarios"] = {
+            name: scenario_entry(runs) for name, runs in scenarios.items()}
+    if outcomes:
+        report.scoreboard["triggers"] = trigger_scoreboard(outcomes)
+    if state["backend"]:
+        report.scoreboard["backend"] = state["backend"]
+    return report
+
+
 # ===========================================================================
 # STATIC MODE
 # ===========================================================================
@@ -321,39 +483,44 @@ To install: https://code.claude.com/docs (npm install -g @anthropic-ai/claude-co
 Then verify with: claude --version
 
 --static mode needs no CLI and is safe to run anywhere (including CI).
+To exercise the live pipeline without a model, use --backend stub.
 """
 
 
+# The backend every invoke_claude() call goes through; main() swaps it via
+# set_backend() according to --backend.
+_backend: RunnerBackend = CliBackend()
+
+
+def set_backend(backend: RunnerBackend) -> RunnerBackend:
+    """Install the runner backend for live calls. Returns the previous one."""
+    global _backend
+    previous, _backend = _backend, backend
+    return previous
+
+
+def get_backend() -> RunnerBackend:
+    return _backend
+
+
 def claude_available() -> bool:
     """Probe for a working `claude` CLI."""
-    if shutil.which("claude") is None:
-        return False
-    try:
-        probe = subprocess.run(
-            ["claude", "--version"], capture_output=True, text=True, timeout=20,
-        )
-    except (OSError, subprocess.TimeoutExpired):
-        return False
-    return probe.returncode == 0
+    return CliBackend().available()
+
+
+def backend_available(backend: RunnerBackend) -> bool:
+    """Readiness check; the CLI probe stays claude_available() for tests."""
+    if isinstance(backend, CliBackend):
+        return claude_available()
+    return backend.available()
 
 
 def invoke_claude(prompt: str, max_turns: int, timeout: int) -> Tuple[bool, str]:
-    """One headless `claude -p` run. Returns (completed, output).
+    """One headless run through the active backend. Returns (completed, output).
 
     Tests monkeypatch this function; keep the signature stable.
     """
-    try:
-        proc = subprocess.run(
-            ["claude", "-p", prompt, "--max-turns", str(max_turns)],
-            capture_output=True, text=True, timeout=timeout,
-        )
-    except subprocess.TimeoutExpired:
-        return False, f"timed out after {timeout}s"
-    except OSError as exc:
-        return False, f"failed to launch claude: {exc}"
-    if proc.returncode != 0:
-        return False, f"claude exited {proc.returncode}: {proc.stderr.strip()[:500]}"
-    return True, proc.stdout
+    return _backend.run(prompt, max_turns, timeout)
 
 
 def extract_json(text: str) -> Optional[Any]:
@@ -448,6 +615,14 @@ def judge_scenario_run(scenario: Dict[str, Any], output: str,
     return results
 
 
+def scenario_entry(run_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Scoreboard entry for one scenario's runs."""
+    return {
+        "runs": run_results,
+        "passed": bool(run_results) and all(r["passed"] for r in run_results),
+    }
+
+
 def run_live_scenarios(scenarios: List[Dict[str, Any]], report: EvalReport,
                        max_turns: int, timeout: int) -> Dict[str, Any]:
     """Execute every scenario headlessly and judge each run's assertions."""
@@ -456,32 +631,62 @@ def run_live_scenarios(scenarios: List[Dict[str, Any]], report: EvalReport,
         name = scenario["name"]
         run_results = []
         for run_index in range(scenario["runs"]):
+            unit = f"scenario:{name}#run{run_index + 1}"
+            done = report.replay(unit)
+            if done is not None:
+                run_results.append(done["result"])
+                continue
             completed, output = invoke_claude(scenario["task"], max_turns, timeout)
             if not completed:
                 report.add(f"scenario:{name}", f"run{run_index + 1}", False,
                            "scenario run did not complete", evidence=output)
-                run_results.append({"run": run_index + 1, "passed": False,
-                                    "verdicts": [], "error": output})
-                continue
-            verdicts = judge_scenario_run(scenario, output, 1, timeout)
-            run_passed = all(v["pass"] for v in verdicts)
-            for verdict in verdicts:
-                report.add(
-                    f"scenario:{name}",
-                    f"run{run_index + 1}: {verdict['assertion']}",
-                    verdict["pass"],
-                    "" if verdict["pass"] else "assertion failed",
-                    evidence=verdict["evidence"],
-                )
-            run_results.append({"run": run_index + 1, "passed": run_passed,
-                                "verdicts": verdicts})
-        board[name] = {
-            "runs": run_results,
-            "passed": bool(run_results) and all(r["passed"] for r in run_results),
-        }
+                result = {"run": run_index + 1, "passed": False,
+                          "verdicts": [], "error": output}
+            else:
+                verdicts = judge_scenario_run(scenario, output, 1, timeout)
+                for verdict in verdicts:
+                    report.add(
+                        f"scenario:{name}",
+                        f"run{run_index + 1}: {verdict['assertion']}",
+                        verdict["pass"],
+                        "" if verdict["pass"] else "assertion failed",
+                        evidence=verdict["evidence"],
+                    )
+                result = {"run": run_index + 1,
+                          "passed": all(v["pass"] for v in verdicts),
+                          "verdicts": verdicts}
+            run_results.append(result)
+            report.complete(unit, {"kind": "scenario_run", "scenario": name,
+                                   "result": result})
+        board[name] = scenario_entry(run_results)
     return board
 
 
+def trigger_scoreboard(outcomes: List[Tuple[str, Optional[bool]]]) -> Dict[str, Any]:
+    """Tally (group, fired) trigger outcomes into recall/precision.
+
+    group is "positive" (positives + holdout) or "near_miss"; fired is None
+    when the router call failed.
+    """
+    positives = [fired for group, fired in outcomes if group == "positive"]
+    near_misses = [fired for group, fired in outcomes if group == "near_miss"]
+    true_pos = sum(1 for fired in positives if fired is True)
+    false_neg = sum(1 for fired in positives if fired is False)
+    false_pos = sum(1 for fired in near_misses if fired is True)
+    true_neg = sum(1 for fired in near_misses if fired is False)
+    errors = sum(1 for _group, fired in outcomes if fired is None)
+
+    recall = true_pos / len(positives) if positives else None
+    fired_count = true_pos + false_pos
+    precision = true_pos / fired_count if fired_count else None
+    return {
+        "positives": len(positives), "near_misses": len(near_misses),
+        "true_positive": true_pos, "false_negative": false_neg,
+        "false_positive": false_pos, "true_negative": true_neg,
+        "errors": errors, "recall": recall, "precision": precision,
+    }
+
+
 def run_live_triggers(triggers: Dict[str, List[str]], name: str, description: str,
                       report: EvalReport, timeout: int) -> Dict[str, Any]:
     """Live trigger routing: recall on positives+holdout, precision vs near-misses."""
@@ -499,43 +704,297 @@ def run_live_triggers(triggers: Dict[str, List[str]], name: str, description: st
                  if not is_placeholder(q)]
     near_misses = [q for q in triggers["near_miss"] if not is_placeholder(q)]
 
-    true_pos = false_neg = false_pos = true_neg = errors = 0
-    for query in positives:
-        result = fire(query)
-        if result is None:
-            errors += 1
-            report.add(f"trigger:{query!r}", "live_routing", False,
-                       "router call failed or returned no JSON verdict")
-        elif result:
-            true_pos += 1
-            report.add(f"trigger:{query!r}", "live_routing", True, "triggered (expected)")
-        else:
-            false_neg += 1
-            report.add(f"trigger:{query!r}", "live_routing", False,
-                       "positive query did NOT trigger the skill")
-    for query in near_misses:
-        result = fire(query)
-        if result is None:
-            errors += 1
-            report.add(f"trigger:{query!r}", "live_routing", False,
-                       "router call failed or returned no JSON verdict")
-        elif result:
-            false_pos += 1
-            report.add(f"trigger:{query!r}", "live_routing", False,
-                       "near-miss query INCORRECTLY triggered the skill")
+    outcomes: List[Tuple[str, Optional[bool]]] = []
+    for group, queries in (("positive", positives), ("near_miss", near_misses)):
+        for query in queries:
+            unit = f"trigger:{group}:{query!r}"
+            done = report.replay(unit)
+            if done is not None:
+                outcomes.append((group, done["result"]))
+                continue
+            result = fire(query)
+            target = f"trigger:{query!r}"
+            if result is None:
+                report.add(target, "live_routing", False,
+                           "router call failed or returned no JSON verdict")
+            elif group == "positive":
+                report.add(target, "live_routing", result,
+                           "triggered (expected)" if result else
+                           "positive query did NOT trigger the skill")
+            else:
+                report.add(target, "live_routing", not result,
+                           "near-miss query INCORRECTLY triggered the skill"
+                           if result else "not triggered (expected)")
+            outcomes.append((group, result))
+            report.complete(unit, {"kind": "trigger", "group": group,
+                                   "query": query, "result": result})
+    return trigger_scoreboard(outcomes)
+
+
+# ===========================================================================
+# ROSTER MODE
+# ===========================================================================
+# Every skill in the index that ships an evals/ directory. Static checks are
+# CPU/parse work and fan out over a process pool; live checks are waits on
+# the runner backend and share one thread pool (the global concurrency cap)
+# and one wall-clock budget.
+
+BUDGET_EXHAUSTED = "roster time budget exhausted"
+
+
+class DeadlineBackend(RunnerBackend):
+    """Wrap a backend so no call starts, or outlives, a shared deadline."""
+
+    def __init__(self, inner: RunnerBackend, deadline: Optional[float]) -> None:
+        super().__init__()
+        self.inner = inner
+        self.name = inner.name
+        self.deadline = deadline
+
+    def remaining(self) -> Optional[float]:
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def available(self) -> bool:
+        return self.inner.available()
+
+    def invoke(self, prompt: str, max_turns: int, timeout: int) -> Tuple[bool, str]:
+        remaining = self.remaining()
+        if remaining is not None:
+            if remaining <= 0:
+                return False, BUDGET_EXHAUSTED
+            timeout = max(1, min(timeout, int(remaining)))
+        return self.inner.invoke(prompt, max_turns, timeout)
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+def roster_skill_dirs(index: Dict[str, Any]) -> List[Path]:
+    """Skill directories from the index that ship an evals/ directory."""
+    dirs = set()
+    for skill in index.get("skills", []):
+        path = skill.get("path") if isinstance(skill, dict) else None
+        if not path:
+            continue
+        skill_dir = Path(path).parent
+        if (skill_dir / "evals").is_dir():
+            dirs.add(skill_dir)
+    return sorted(dirs)
+
+
+def evaluate_static(skill_dir: str) -> Dict[str, Any]:
+    """Static checks for one skill (process-pool worker; plain data out)."""
+    started = time.monotonic()
+    report = EvalReport(skill_dir=skill_dir, mode="static")
+    triggers, scenarios = run_static(Path(skill_dir), report)
+    frontmatter, _err = read_skill_frontmatter(Path(skill_dir))
+    return {
+        "skill_dir": skill_dir,
+        "name": str(frontmatter.get("name") or Path(skill_dir).name),
+        "description": str(frontmatter.get("description") or ""),
+        "checks": [c.to_dict() for c in report.checks],
+        "triggers": triggers,
+        "scenarios": scenarios,
+        "static_seconds": time.monotonic() - started,
+    }
+
+
+def run_roster_static(skill_dirs: List[Path], jobs: int) -> List[Dict[str, Any]]:
+    """Static checks for every skill, in input order."""
+    names = [str(d) for d in skill_dirs]
+    if jobs <= 1 or len(names) <= 1:
+        return [evaluate_static(name) for name in names]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(evaluate_static, names))
+
+
+def run_roster_live(entry: Dict[str, Any], backend: DeadlineBackend,
+                    max_turns: int, timeout: int) -> None:
+    """Live scenario + trigger runs for one roster skill (thread worker)."""
+    report: EvalReport = entry["report"]
+    remaining = backend.remaining()
+    if remaining is not None and remaining <= 0:
+        report.add("live", "budget", False,
+                   f"{BUDGET_EXHAUSTED} before live runs started")
+        entry["live_skipped"] = True
+        return
+    started = time.monotonic()
+    report.scoreboard["scenarios"] = run_live_scenarios(
+        entry["scenarios"], report, max_turns, timeout)
+    if entry["triggers"] is not None:
+        report.scoreboard["triggers"] = run_live_triggers(
+            entry["triggers"], entry["name"], entry["description"], report, timeout)
+    entry["live_seconds"] = time.monotonic() - started
+
+
+def run_roster(skill_dirs: List[Path], live: bool, backend: RunnerBackend,
+               jobs: int, concurrency: int, budget: Optional[float],
+               max_turns: int, timeout: int) -> Dict[str, Any]:
+    """Evaluate a whole roster; returns the consolidated report data."""
+    started = time.monotonic()
+    deadline = started + budget if budget is not None else None
+    entries = run_roster_static(skill_dirs, jobs)
+    for entry in entries:
+        entry["report"] = EvalReport(
+            skill_dir=entry["skill_dir"], mode="live" if live else "static",
+            checks=[Check(**c) for c in entry["checks"]])
+        entry["live_seconds"] = 0.0
+        entry["live_skipped"] = False
+    static_seconds = time.monotonic() - started
+
+    runner = DeadlineBackend(backend, deadline)
+    if live:
+        ready = [e for e in entries if e["report"].passed]
+        previous = set_backend(runner)
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+                futures = [pool.submit(run_roster_live, e, runner, max_turns, timeout)
+                           for e in ready]
+                for future in futures:
+                    future.result()
+        finally:
+            set_backend(previous)
+            runner.close()
+
+    skills = []
+    for entry in entries:
+        report: EvalReport = entry["report"]
+        skills.append({
+            "name": entry["name"],
+            "skill_dir": entry["skill_dir"],
+            "passed": report.passed,
+            "checks": len(report.checks),
+            "failures": len(report.failures),
+            "static_seconds": round(entry["static_seconds"], 3),
+            "live_seconds": round(entry["live_seconds"], 3),
+            "live_skipped": entry["live_skipped"],
+            "report": report.to_dict(),
+        })
+    remaining = runner.remaining()
+    return {
+        "mode": "live" if live else "static",
+        "passed": all(s["passed"] for s in skills),
+        "skill_count": len(skills),
+        "failed_count": sum(1 for s in skills if not s["passed"]),
+        "static_seconds": round(static_seconds, 3),
+        "total_seconds": round(time.monotonic() - started, 3),
+        "budget_seconds": budget,
+        "budget_exhausted": remaining is not None and remaining <= 0,
+        "backend": runner.stats() if live else None,
+        "skills": skills,
+    }
+
+
+# ===========================================================================
+# ROSTER TRIGGER CONFUSION
+# ===========================================================================
+# run_live_triggers() asks a model about one description in isolation. This
+# routes every roster query against the FULL roster with the local triage
+# scorer instead, so collisions between skills show up without model calls.
+
+NO_ROUTE = "(none)"
+
+
+def load_roster_triggers(index: Dict[str, Any]) -> Dict[str, Dict[str, List[str]]]:
+    """triggers.json of every indexed skill that has a well-formed one."""
+    roster: Dict[str, Dict[str, List[str]]] = {}
+    for skill in index.get("skills", []):
+        if not isinstance(skill, dict) or not skill.get("path"):
+            continue
+        evals_dir = Path(skill["path"]).parent / "evals"
+        if not (evals_dir / "triggers.json").is_file():
+            continue
+        scratch = EvalReport(skill_dir=str(evals_dir.parent), mode="static")
+        triggers = load_triggers(evals_dir, scratch)
+        if triggers is not None:
+            roster[str(skill.get("name"))] = triggers
+    return roster
+
+
+def route_queries(queries: List[str], skills: List[Dict[str, Any]]) -> List[str]:
+    """Top-1 triage route per query (NO_ROUTE below the weak-match band)."""
+    batch = [(query, 1, classify_input(query)[1]) for query in queries]
+    routes = []
+    for matches in find_matching_skills_many(batch, skills):
+        if matches and matches[0]["score"] >= WEAK_MATCH_THRESHOLD:
+            routes.append(str(matches[0]["name"]))
         else:
-            true_neg += 1
-            report.add(f"trigger:{query!r}", "live_routing", True,
-                       "not triggered (expected)")
+            routes.append(NO_ROUTE)
+    return routes
 
-    recall = true_pos / len(positives) if positives else None
-    fired = true_pos + false_pos
-    precision = true_pos / fired if fired else None
+
+def trigger_confusion(index: Dict[str, Any]) -> Dict[str, Any]:
+    """Skill x skill confusion of roster trigger queries under triage routing.
+
+    Rows are the skill that owns a positive/holdout query, columns the skill
+    it routed to. Off-diagonal cells are routing collisions. Near-miss
+    queries are tallied separately: routing one to its own skill is a false
+    fire.
+    """
+    skills = [s for s in index.get("skills", []) if isinstance(s, dict)]
+    roster = load_roster_triggers(index)
+
+    owners: List[str] = []
+    groups: List[str] = []
+    queries: List[str] = []
+    for owner, triggers in sorted(roster.items()):
+        for group, keys in (("positive", ("positive", "holdout")), ("near_miss", ("near_miss",))):
+            for key in keys:
+                for query in triggers[key]:
+                    if is_placeholder(query):
+                        continue
+                    owners.append(owner)
+                    groups.append(group)
+                    queries.append(query)
+
+    routes = route_queries(queries, skills)
+
+    matrix: Dict[str, Dict[str, int]] = {}
+    per_skill: Dict[str, Dict[str, Any]] = {
+        owner: {"queries": 0, "correct": 0, "near_misses": 0, "near_miss_fired": 0}
+        for owner in sorted(roster)
+    }
+    misroutes: List[Dict[str, str]] = []
+    for owner, group, query, routed in zip(owners, groups, queries, routes):
+        entry = per_skill[owner]
+        if group == "near_miss":
+            entry["near_misses"] += 1
+            if routed == owner:
+                entry["near_miss_fired"] += 1
+                misroutes.append({"query": query, "owner": owner, "routed": routed,
+                                  "kind": "near_miss_fired"})
+            continue
+        row = matrix.setdefault(owner, {})
+        row[routed] = row.get(routed, 0) + 1
+        entry["queries"] += 1
+        if routed == owner:
+            entry["correct"] += 1
+        else:
+            misroutes.append({"query": query, "owner": owner, "routed": routed,
+                              "kind": "missed" if routed == NO_ROUTE else "collision"})
+
+    collisions = sorted(
+        ({"owner": owner, "routed": routed, "count": count}
+         for owner, row in matrix.items() for routed, count in row.items()
+         if routed not in (owner, NO_ROUTE)),
+        key=lambda c: (-c["count"], c["owner"], c["routed"]),
+    )
+    total = sum(e["queries"] for e in per_skill.values())
+    correct = sum(e["correct"] for e in per_skill.values())
+    for entry in per_skill.values():
+        entry["accuracy"] = entry["correct"] / entry["queries"] if entry["queries"] else None
     return {
-        "positives": len(positives), "near_misses": len(near_misses),
-        "true_positive": true_pos, "false_negative": false_neg,
-        "false_positive": false_pos, "true_negative": true_neg,
-        "errors": errors, "recall": recall, "precision": precision,
+        "skill_count": len(skills),
+        "skills_with_triggers": len(roster),
+        "queries": len(queries),
+        "accuracy": correct / total if total else None,
+        "matrix": matrix,
+        "collisions": collisions,
+        "misroutes": misroutes,
+        "per_skill": per_skill,
+        "passed": not misroutes,
     }
 
 
@@ -575,6 +1034,10 @@ def format_report(report: EvalReport) -> str:
                          f"({trig['true_positive']}/{trig['positives']} positives fired)")
             lines.append(f"  trigger precision: {precision} "
                          f"({trig['false_positive']} near-miss false fire(s))")
+        runner = report.scoreboard.get("backend")
+        if runner:
+            lines.append(f"  backend {runner['backend']}: {runner['calls']} call(s) "
+                         f"in {runner['seconds']:.2f}s")
 
     passed = len(report.checks) - len(report.failures)
     lines.append(f"\nChecks: {passed}/{len(report.checks)} passed")
@@ -583,6 +1046,72 @@ def format_report(report: EvalReport) -> str:
     return "\n".join(lines)
 
 
+def format_roster_report(data: Dict[str, Any]) -> str:
+    lines = [
+        f"\n{'=' * 64}",
+        f"Roster Evals ({data['mode']}): {data['skill_count']} skill(s) with evals/",
+        f"{'=' * 64}",
+    ]
+    for skill in data["skills"]:
+        mark = "PASS" if skill["passed"] else "FAIL"
+        passed = skill["checks"] - skill["failures"]
+        timing = f"static {skill['static_seconds']:.2f}s"
+        if data["mode"] == "live":
+            timing += (", live skipped (budget)" if skill["live_skipped"]
+                       else f", live {skill['live_seconds']:.2f}s")
+        lines.append(f"  [{mark}] {skill['name']}: {passed}/{skill['checks']} checks "
+                     f"({timing})")
+        for check in skill["report"]["checks"]:
+            if not check["passed"]:
+                lines.append(f"         {check['target']} {check['name']}: {check['message']}")
+
+    lines.append("")
+    lines.append(f"Skills: {data['skill_count'] - data['failed_count']}/"
+                 f"{data['skill_count']} passed in {data['total_seconds']:.2f}s "
+                 f"(static phase {data['static_seconds']:.2f}s)")
+    if data["budget_seconds"] is not None:
+        state = "EXHAUSTED" if data["budget_exhausted"] else "ok"
+        lines.append(f"Time budget: {data['budget_seconds']:g}s ({state})")
+    runner = data.get("backend")
+    if runner:
+        lines.append(f"Backend {runner['backend']}: {runner['calls']} call(s) "
+                     f"in {runner['seconds']:.2f}s")
+    lines.append("RESULT: " + ("PASS" if data["passed"] else "FAIL"))
+    lines.append("=" * 64 + "\n")
+    return "\n".join(lines)
+
+
+def format_confusion_report(data: Dict[str, Any]) -> str:
+    accuracy = "n/a" if data["accuracy"] is None else f"{data['accuracy']:.0%}"
+    lines = [
+        f"\n{'=' * 64}",
+        f"Trigger Confusion: {data['queries']} queries from "
+        f"{data['skills_with_triggers']} skill(s), routed across {data['skill_count']}",
+        f"{'=' * 64}",
+    ]
+    for name, entry in data["per_skill"].items():
+        acc = "n/a" if entry["accuracy"] is None else f"{entry['accuracy']:.0%}"
+        row = data["matrix"].get(name, {})
+        elsewhere = ", ".join(f"{routed} x{count}" for routed, count in sorted(row.items())
+                              if routed != name)
+        lines.append(f"  {name}: {entry['correct']}/{entry['queries']} routed home ({acc})"
+                     + (f"; elsewhere: {elsewhere}" if elsewhere else ""))
+        if entry["near_miss_fired"]:
+            lines.append(f"      {entry['near_miss_fired']}/{entry['near_misses']} "
+                         "near-miss(es) routed to this skill")
+
+    lines.append(f"\n{'Collisions (owner -> routed)':-^64}")
+    if data["collisions"]:
+        for c in data["collisions"][:20]:
+            lines.append(f"  {c['count']:>4}  {c['owner']} -> {c['routed']}")
+    else:
+        lines.append("  (none)")
+    lines.append(f"\nRouting accuracy: {accuracy}")
+    lines.append("RESULT: " + ("PASS" if data["passed"] else "FAIL"))
+    lines.append("=" * 64 + "\n")
+    return "\n".join(lines)
+
+
 # ===========================================================================
 # CLI
 # ===========================================================================
@@ -596,9 +1125,28 @@ Examples:
   %(prog)s ~/.claude/skills/my-skill                # static (default)
   %(prog)s ~/.claude/skills/my-skill --static --json
   %(prog)s ~/.claude/skills/my-skill --live --max-turns 12
+  %(prog)s ~/.claude/skills/my-skill --live --backend stub --stub-latency 0.2
+  %(prog)s ~/.claude/skills/my-skill --live --backend http --backend-url http://127.0.0.1:8765/
+  %(prog)s --roster --json                          # static, every indexed skill
+  %(prog)s --roster --live --concurrency 8 --budget 3600
+  %(prog)s --roster --confusion                     # cross-skill routing collisions
         """,
     )
-    parser.add_argument("skill_dir", type=Path, help="Skill directory containing SKILL.md and evals/")
+    parser.add_argument("skill_dir", type=Path, nargs="?",
+                        help="Skill directory containing SKILL.md and evals/")
+    parser.add_argument("--roster", action="store_true",
+                        help="Evaluate every indexed skill that ships an evals/ directory")
+    parser.add_argument("--index", type=Path, metavar="FILE",
+                        help="Skill index for --roster (default: the shared index)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="--roster: worker processes for static checks (default: CPU count)")
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="--roster: live calls in flight across all skills (default: 4)")
+    parser.add_argument("--budget", type=float, metavar="SECONDS",
+                        help="--roster: wall-clock budget; live calls stop when it is spent")
+    parser.add_argument("--confusion", action="store_true",
+                        help="--roster: route every roster trigger query with the local "
+                             "triage scorer and report a skill x skill confusion matrix")
     mode = parser.add_mutually_exclusive_group()
     mode.add_argument("--static", action="store_true",
                       help="Structure + trigger keyword lint only (default; CI-safe)")
@@ -609,7 +1157,37 @@ Examples:
                         help="Turn cap per headless scenario run (default: 12)")
     parser.add_argument("--timeout", type=int, default=300,
                         help="Seconds before a headless run is killed (default: 300)")
+    parser.add_argument("--backend", choices=BACKEND_NAMES, default="cli",
+                        help="Runner backend for --live calls (default: cli)")
+    parser.add_argument("--backend-command", metavar="CMD",
+                        help="Command line for --backend process (JSON lines on stdin/stdout)")
+    parser.add_argument("--backend-url", metavar="URL",
+                        help="Endpoint for --backend http")
+    parser.add_argument("--stub-latency", type=float, default=0.0, metavar="SECONDS",
+                        help="Simulated per-call latency for --backend stub (default: 0)")
+    parser.add_argument("--results", type=Path, metavar="FILE",
+                        help="Stream every check and finished run to this JSONL file "
+                             "as it completes; the final report is rendered from it")
+    parser.add_argument("--resume", action="store_true",
+                        help="With --results: skip runs already finished in FILE")
     args = parser.parse_args(argv)
+    if args.resume and not args.results:
+        parser.error("--resume requires --results FILE")
+    if args.roster and (args.skill_dir or args.results):
+        parser.error("--roster takes no skill_dir and does not support --results")
+    if not args.roster and args.skill_dir is None:
+        parser.error("a skill_dir is required (or use --roster)")
+    if args.confusion and (not args.roster or args.live):
+        parser.error("--confusion needs --roster and makes no live calls")
+
+    try:
+        backend = make_backend(args.backend, command=args.backend_command,
+                               url=args.backend_url, latency=args.stub_latency)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    if args.roster:
+        return main_roster(args, backend)
 
     skill_dir = args.skill_dir.expanduser().resolve()
     if not skill_dir.is_dir():
@@ -619,25 +1197,57 @@ Examples:
     live = bool(args.live)
     report = EvalReport(skill_dir=str(skill_dir), mode="live" if live else "static")
 
-    if live and not claude_available():
-        print(CLAUDE_MISSING_HELP, file=sys.stderr)
+    if live and not backend_available(backend):
+        if isinstance(backend, CliBackend):
+            print(CLAUDE_MISSING_HELP, file=sys.stderr)
+        else:
+            print(f"The {backend.name} backend is unavailable; cannot run --live.",
+                  file=sys.stderr)
+        backend.close()
         return 11
 
+    stream: Optional[ResultStream] = None
+    if args.results:
+        results_path = args.results.expanduser().resolve()
+        stream = ResultStream(results_path, resume=args.resume)
+        previous_dir = (stream.header or {}).get("skill_dir")
+        if previous_dir and previous_dir != str(skill_dir):
+            stream.close()
+            backend.close()
+            print(f"Error: {results_path} holds results for {previous_dir}, "
+                  f"not {skill_dir}", file=sys.stderr)
+            return 2
+        stream.start(report.skill_dir, report.mode, resume=args.resume)
+        report.stream = stream
+
     triggers, scenarios = run_static(skill_dir, report)
 
     if live and report.passed:
         frontmatter, _err = read_skill_frontmatter(skill_dir)
         name = str(frontmatter.get("name") or skill_dir.name)
         description = str(frontmatter.get("description") or "")
-        report.scoreboard["scenarios"] = run_live_scenarios(
-            scenarios, report, args.max_turns, args.timeout)
-        if triggers is not None:
-            report.scoreboard["triggers"] = run_live_triggers(
-                triggers, name, description, report, args.timeout)
+        previous = set_backend(backend)
+        try:
+            report.scoreboard["scenarios"] = run_live_scenarios(
+                scenarios, report, args.max_turns, args.timeout)
+            if triggers is not None:
+                report.scoreboard["triggers"] = run_live_triggers(
+                    triggers, name, description, report, args.timeout)
+        finally:
+            set_backend(previous)
+            backend.close()
+        report.scoreboard["backend"] = backend.stats()
     elif live:
+        backend.close()
         print("Static checks failed; skipping live runs (fix structure first).",
               file=sys.stderr)
 
+    if stream is not None:
+        if "backend" in report.scoreboard:
+            stream.finish(report.scoreboard["backend"])
+        stream.close()
+        report = report_from_stream(stream.path)
+
     if args.json:
         print(json.dumps(report.to_dict(), indent=2))
     else:
@@ -645,5 +1255,43 @@ Examples:
     return 0 if report.passed else 10
 
 
+def main_roster(args: argparse.Namespace, backend: RunnerBackend) -> int:
+    """--roster: evaluate every indexed skill with evals/."""
+    index_path = args.index.expanduser() if args.index else get_index_path()
+    index = load_skill_index(index_path)
+    if not index:
+        print(f"Error: skill index not found: {index_path} "
+              "(run discover_skills.py first)", file=sys.stderr)
+        return 1
+    if args.confusion:
+        data = trigger_confusion(index)
+        if args.json:
+            print(json.dumps(data, indent=2))
+        else:
+            print(format_confusion_report(data))
+        return 0 if data["passed"] else 10
+
+    skill_dirs = roster_skill_dirs(index)
+    if not skill_dirs:
+        print(f"Error: no indexed skill ships an evals/ directory ({index_path})",
+              file=sys.stderr)
+        return 1
+
+    if args.live and not backend_available(backend):
+        print(CLAUDE_MISSING_HELP if isinstance(backend, CliBackend) else
+              f"The {backend.name} backend is unavailable; cannot run --live.",
+              file=sys.stderr)
+        backend.close()
+        return 11
+
+    data = run_roster(skill_dirs, bool(args.live), backend, args.jobs,
+                      args.concurrency, args.budget, args.max_turns, args.timeout)
+    if args.json:
+        print(json.dumps(data, indent=2))
+    else:
+        print(format_roster_report(data))
+    return 0 if data["passed"] else 10
+
+
 if __name__ == "__main__":
     sys.exit(main())
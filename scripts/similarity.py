@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+similarity.py - Shared TF-IDF description-similarity engine.
+
+Turns a skill roster into sparse, L2-normalised TF-IDF rows (sublinear term
+frequency, smoothed IDF over the same content words the doctor and the eval
+linter use) and answers two questions in one batched pass each:
+
+  - query(text, k): the k skills most similar to an arbitrary text
+    (triage uses this to show the closest existing skills before CREATE_NEW)
+  - top_k_all(k): the k nearest neighbours of EVERY skill
+    (the doctor lists each skill's closest description from it)
+
+Rows live in array('i')/array('d') postings, so the stdlib path is a sparse
+matrix product driven by the inverted index. When NumPy is importable,
+top_k_all() multiplies a dense block over only the terms shared by two or
+more skills (a term in one row cannot contribute to any pair) and falls back
+to the sparse path when that block would be too large. NumPy is optional;
+results agree to rounding either way.
+
+Usage:
+    python3 similarity.py                      # nearest neighbours, shared index
+    python3 similarity.py --query "merge pdf files" -k 3
+    python3 similarity.py --json
+
+Exit Codes:
+    0 - Success
+    1 - General failure
+    2 - Skill index not found (run discover_skills.py first)
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import math
+import sys
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional accelerator; the stdlib path is complete
+    np = None
+
+try:
+    from common import content_tokens
+    from triage_skill_request import load_skill_index
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from common import content_tokens
+    from triage_skill_request import load_skill_index
+
+# Largest dense block (skills x shared terms) the NumPy path will allocate.
+DENSE_CELL_LIMIT = 20_000_000
+# Rows multiplied per NumPy block; bounds the n x BLOCK_ROWS score matrix.
+BLOCK_ROWS = 256
+
+
+def skill_text(skill: Dict[str, Any]) -> str:
+    """The text a skill is compared on: its description plus its name words."""
+    name = str(skill.get("name") or "").replace("-", " ").replace("_", " ")
+    return f"{name} {skill.get('description') or ''}"
+
+
+class SimilarityIndex:
+    """Sparse TF-IDF rows for a roster, with batched cosine top-k."""
+
+    def __init__(self, names: Sequence[str], texts: Sequence[str]) -> None:
+        self.names = [str(n) for n in names]
+        counts = [Counter(content_tokens(t)) for t in texts]
+        doc_freq: Counter = Counter()
+        for row in counts:
+            doc_freq.update(row.keys())
+        self.vocabulary: Dict[str, int] = {
+            term: col for col, term in enumerate(sorted(doc_freq))
+        }
+        n = len(counts)
+        self.idf = array("d", (
+            math.log((1 + n) / (1 + doc_freq[term])) + 1.0
+            for term in sorted(doc_freq)
+        ))
+        # Row-major sparse rows and column-major postings over the same data.
+        self.rows: List[Tuple[array, array]] = []
+        self.postings: List[Tuple[array, array]] = [
+            (array("i"), array("d")) for _ in self.vocabulary
+        ]
+        for i, row in enumerate(counts):
+            cols, weights = self._weigh(row)
+            self.rows.append((cols, weights))
+            for col, weight in zip(cols, weights):
+                post_rows, post_weights = self.postings[col]
+                post_rows.append(i)
+                post_weights.append(weight)
+
+    @classmethod
+    def from_skills(cls, skills: Sequence[Dict[str, Any]]) -> "SimilarityIndex":
+        return cls([s.get("name") for s in skills], [skill_text(s) for s in skills])
+
+    @property
+    def backend(self) -> str:
+        return "stdlib" if np is None else "numpy"
+
+    def _weigh(self, counts: Dict[str, int]) -> Tuple[array, array]:
+        """Sublinear TF x IDF over known terms, L2-normalised, sorted by column."""
+        entries = sorted(
+            (self.vocabulary[term], (1.0 + math.log(tf)) * self.idf[self.vocabulary[term]])
+            for term, tf in counts.items() if term in self.vocabulary
+        )
+        norm = math.sqrt(sum(w * w for _c, w in entries)) or 1.0
+        return (array("i", (c for c, _w in entries)),
+                array("d", (w / norm for _c, w in entries)))
+
+    def _ranked(self, scores: Dict[int, float], k: int, min_score: float,
+                exclude: int = -1) -> List[Tuple[str, float]]:
+        best = heapq.nsmallest(
+            k,
+            ((-score, self.names[j], j) for j, score in scores.items()
+             if j != exclude and score > min_score),
+        )
+        return [(name, round(-neg, 4)) for neg, name, _j in best]
+
+    def _sparse_scores(self, cols: array, weights: array) -> Dict[int, float]:
+        scores: Dict[int, float] = {}
+        for col, weight in zip(cols, weights):
+            post_rows, post_weights = self.postings[col]
+            for j, other in zip(post_rows, post_weights):
+                scores[j] = scores.get(j, 0.0) + weight * other
+        return scores
+
+    def query(self, text: str, k: int = 5, min_score: float = 0.0
+              ) -> List[Tuple[str, float]]:
+        """The k rows most similar to text, as (name, cosine), best first."""
+        cols, weights = self._weigh(Counter(content_tokens(text)))
+        return self._ranked(self._sparse_scores(cols, weights), k, min_score)
+
+    def similarity(self, a: int, b: int) -> float:
+        """Cosine between rows a and b (by position)."""
+        cols_a, weights_a = self.rows[a]
+        lookup = dict(zip(*self.rows[b]))
+        return round(sum(w * lookup.get(c, 0.0) for c, w in zip(cols_a, weights_a)), 4)
+
+    def top_k_all(self, k: int = 5, min_score: float = 0.0
+                  ) -> Dict[str, List[Tuple[str, float]]]:
+        """Nearest k neighbours of every row in one batched product."""
+        if np is not None:
+            dense = self._top_k_dense(k, min_score)
+            if dense is not None:
+                return dense
+        return {
+            self.names[i]: self._ranked(self._sparse_scores(*self.rows[i]), k, min_score, exclude=i)
+            for i in range(len(self.rows))
+        }
+
+    def _top_k_dense(self, k: int, min_score: float
+                     ) -> Optional[Dict[str, List[Tuple[str, float]]]]:
+        shared = [col for col, (post_rows, _w) in enumerate(self.postings) if len(post_rows) > 1]
+        n = len(self.rows)
+        if not shared or n * len(shared) > DENSE_CELL_LIMIT:
+            return None
+        position = {col: i for i, col in enumerate(shared)}
+        matrix = np.zeros((n, len(shared)), dtype=np.float64)
+        for i, (cols, weights) in enumerate(self.rows):
+            for col, weight in zip(cols, weights):
+                if col in position:
+                    matrix[i, position[col]] = weight
+        result: Dict[str, List[Tuple[str, float]]] = {}
+        for start in range(0, n, BLOCK_ROWS):
+            block = matrix[start:start + BLOCK_ROWS] @ matrix.T
+            for offset, row in enumerate(block):
+                i = start + offset
+                candidates = np.flatnonzero(row > min_score)
+                scores = {int(j): float(row[j]) for j in candidates}
+                result[self.names[i]] = self._ranked(scores, k, min_score, exclude=i)
+        return result
+
+
+# ===========================================================================
+# CLI
+# ===========================================================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="TF-IDF description similarity across the skill roster",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                          # 5 nearest neighbours of every skill
+  %(prog)s --query "merge pdf files" -k 3
+  %(prog)s --min-score 0.3 --json   # only strong overlaps, machine output
+        """,
+    )
+    parser.add_argument("--query", help="Rank the roster against this text instead")
+    parser.add_argument("-k", type=int, default=5, help="Neighbours per skill (default: 5)")
+    parser.add_argument("--min-score", type=float, default=0.0,
+                        help="Drop neighbours at or below this cosine (default: 0.0)")
+    parser.add_argument("--index", type=Path, help="Skill index (default: shared cache)")
+    parser.add_argument("--json", action="store_true", help="Machine-readable JSON output")
+    args = parser.parse_args(argv)
+
+    index = load_skill_index(args.index)
+    if not index:
+        print("Error: skill index not found. Run discover_skills.py first.", file=sys.stderr)
+        return 2
+    skills = [s for s in index.get("skills", []) if isinstance(s, dict)]
+    engine = SimilarityIndex.from_skills(skills)
+
+    if args.query is not None:
+        payload: Any = [{"name": name, "similarity": score}
+                        for name, score in engine.query(args.query, args.k, args.min_score)]
+    else:
+        payload = {name: [{"name": other, "similarity": score} for other, score in neighbours]
+                   for name, neighbours in engine.top_k_all(args.k, args.min_score).items()}
+
+    if args.json:
+        print(json.dumps({"backend": engine.backend, "results": payload}, indent=2))
+    elif args.query is not None:
+        for entry in payload:
+            print(f"  {entry['similarity']:.3f}  {entry['name']}")
+    else:
+        for name, neighbours in payload.items():
+            listed = ", ".join(f"{n['name']} {n['similarity']:.2f}" for n in neighbours)
+            print(f"{name}: {listed or '(none)'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
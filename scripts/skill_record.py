@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+skill_record.py - Compact in-memory form of one skill index entry.
+
+The index JSON parses into one dict per skill, each with its own copies of
+the same source names, domain names, keywords and version strings. Long-
+lived readers (triage, the advisor and its hooks) hold SkillRecords instead:
+
+  - a __slots__ object, no per-record dict for the routing fields
+  - names, sources, domains, keywords, triggers and versions interned, so
+    a string shared by many skills exists once per process
+  - keyword/trigger/domain lists stored as tuples, shared (not copied) by
+    every match built from the record
+  - everything else (facts, domain_terms, advisor_terms, ...) compacted the
+    same way - lists become tuples, short strings are interned
+
+A SkillRecord is a read-only Mapping, so code written against index dicts
+(skill.get("keywords", []), skill["name"], dict(skill)) works unchanged.
+Writers (discovery, the doctor) keep plain dicts, since they mutate and
+re-save entries.
+
+Usage:
+    python3 skill_record.py                  # memory per 10k skills, dicts vs records
+    python3 skill_record.py --skills 20000 --json
+
+Exit Codes:
+    0 - Success
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import sys
+import tracemalloc
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+try:
+    from _constants import DOMAIN_VOCABULARY
+    from common import DOMAIN_MATCHER
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from _constants import DOMAIN_VOCABULARY
+    from common import DOMAIN_MATCHER
+
+# Strings up to this length are interned when compacting nested values;
+# longer ones (descriptions, paths) are almost never shared.
+INTERN_MAX_LEN = 64
+
+_MISSING = object()
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _tuple_of_strings(value: Any) -> Any:
+    """A list of strings as a tuple of interned strings (anything else as is)."""
+    if isinstance(value, (list, tuple)) and all(isinstance(v, str) for v in value):
+        return tuple(sys.intern(v) for v in value)
+    return value
+
+
+def compact(value: Any) -> Any:
+    """Lists as tuples and short strings interned, recursively."""
+    if isinstance(value, str):
+        return sys.intern(value) if len(value) <= INTERN_MAX_LEN else value
+    if isinstance(value, (list, tuple)):
+        return tuple(compact(v) for v in value)
+    if isinstance(value, dict):
+        return {sys.intern(str(k)): compact(v) for k, v in value.items()}
+    return value
+
+
+class SkillRecord(Mapping):
+    """One index entry as a slotted, read-only mapping."""
+
+    __slots__ = ("name", "source", "path", "priority", "description", "version",
+                 "triggers", "keywords", "domains", "extra")
+    FIELDS = __slots__[:-1]
+
+    def __init__(self, entry: Mapping[str, Any]) -> None:
+        get = entry.get
+        self.name = _intern(get("name", _MISSING))
+        self.source = _intern(get("source", _MISSING))
+        self.path = get("path", _MISSING)
+        self.priority = get("priority", _MISSING)
+        self.description = get("description", _MISSING)
+        self.version = _intern(get("version", _MISSING))
+        self.triggers = _tuple_of_strings(get("triggers", _MISSING))
+        self.keywords = _tuple_of_strings(get("keywords", _MISSING))
+        self.domains = _tuple_of_strings(get("domains", _MISSING))
+        extra = {k: v for k, v in entry.items() if k not in self.FIELDS}
+        self.extra = compact(extra) if extra else None
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.FIELDS:
+            value = getattr(self, key)
+            if value is not _MISSING:
+                return value
+        elif self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for field in self.FIELDS:
+            if getattr(self, field) is not _MISSING:
+                yield field
+        if self.extra is not None:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"SkillRecord({self.get('name')!r})"
+
+
+def skill_records(entries: Iterable[Any]) -> List[SkillRecord]:
+    """SkillRecords for the dict entries of an index's "skills" list."""
+    return [SkillRecord(entry) for entry in entries if isinstance(entry, dict)]
+
+
+# ===========================================================================
+# MEMORY MEASUREMENT
+# ===========================================================================
+
+def synthetic_index(count: int, seed: int = 11) -> str:
+    """An index JSON shaped like discovery's output, for measurement only."""
+    rng = random.Random(seed)
+    domains = list(DOMAIN_VOCABULARY)
+    vocabulary = [term for terms in DOMAIN_VOCABULARY.values() for term in terms]
+    skills = []
+    for i in range(count):
+        picked = rng.sample(domains, 2)
+        words = rng.sample(vocabulary, 12)
+        skills.append({
+            "name": f"skill-{i}", "source": rng.choice(["user", "project", "plugin"]),
+            "path": f"/home/dev/.claude/skills/skill-{i}/SKILL.md", "priority": rng.randint(1, 4),
+            "description": "Use when " + " ".join(words) + ".",
+            "triggers": words[:2], "keywords": words[2:9], "domains": picked,
+            "version": rng.choice(["1.0.0", "0.1.0", "2.0.0"]),
+            "facts": {"description": "Use when " + " ".join(words) + ".", "model": None,
+                      "body_words": rng.randint(100, 900), "refs": ["references/guide.md"]},
+            "domain_terms": {"signature": DOMAIN_MATCHER.signature,
+                             "matches": {d: rng.sample(DOMAIN_VOCABULARY[d], 2) for d in picked},
+                             "description": sorted(words[:6])},
+            "advisor_terms": {"version": 1, "terms": sorted(set(words))},
+        })
+    return json.dumps({"skills": skills})
+
+
+def measure(count: int) -> Dict[str, Any]:
+    """Traced heap of the parsed roster: plain dicts vs SkillRecords."""
+    text = synthetic_index(count)
+
+    def traced(build) -> int:
+        gc.collect()
+        tracemalloc.start()
+        kept = build()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del kept
+        return size
+
+    dicts = traced(lambda: json.loads(text)["skills"])
+    # The parsed dicts are transient here, as in load_skills(): only the
+    # records stay alive.
+    records = traced(lambda: skill_records(json.loads(text)["skills"]))
+    return {
+        "skills": count,
+        "dict_bytes": dicts,
+        "record_bytes": records,
+        "dict_bytes_per_skill": round(dicts / count),
+        "record_bytes_per_skill": round(records / count),
+        "reduction": round(1 - records / dicts, 3) if dicts else None,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Measure the in-memory roster as index dicts vs SkillRecords",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s
+  %(prog)s --skills 20000 --json
+        """,
+    )
+    parser.add_argument("--skills", type=int, default=10_000,
+                        help="Synthetic skills to load (default: 10000)")
+    parser.add_argument("--json", action="store_true", help="Machine-readable JSON output")
+    args = parser.parse_args(argv)
+
+    result = measure(max(1, args.skills))
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"{result['skills']:,} skills")
+        print(f"  index dicts:  {result['dict_bytes'] / 1e6:.1f} MB "
+              f"({result['dict_bytes_per_skill']:,} B/skill)")
+        print(f"  SkillRecords: {result['record_bytes'] / 1e6:.1f} MB "
+              f"({result['record_bytes_per_skill']:,} B/skill, "
+              f"{result['reduction']:.0%} smaller)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
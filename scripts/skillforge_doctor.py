@@ -3,10 +3,16 @@
 skillforge_doctor.py - Ecosystem health report for the whole skill roster.
 
 Scans every skill source (same sources as discover_skills.py), refreshes the
-skill index when stale, and reports:
+skill index when stale, and reports on one parsed record per SKILL.md copy.
+Files whose index entry is unchanged (same mtime and size) are not re-read.
+It reports:
 
   (a) trigger collisions - skill pairs whose descriptions overlap heavily
-      (word-boundary Jaccard on content words); worst pairs reported
+      (word-boundary Jaccard on content words); worst pairs reported.
+      Candidate pairs come from a prefix-filtered inverted index, so only
+      pairs that can reach half the threshold are scored (--exact scores
+      every pair); each reported pair also carries its TF-IDF cosine, and
+      every skill's nearest description by cosine is listed alongside
   (b) exact/near-duplicate skill names across sources
   (c) stale skills - SKILL.md referencing references/, scripts/, or assets/
       files that do not exist
@@ -23,6 +29,9 @@ Usage:
     python3 skillforge_doctor.py --json
     python3 skillforge_doctor.py --strict          # exit 10 when errors found
     python3 skillforge_doctor.py --sources DIR...  # scan only these roots
+    python3 skillforge_doctor.py --exact           # brute-force collision pairs
+    python3 skillforge_doctor.py --jobs 8          # parallel parse + per-skill checks
+    python3 skillforge_doctor.py --incremental     # re-check only changed skills
 
 Exit Codes:
     0  - Report produced (healthy, or warnings only, or errors without --strict)
@@ -34,47 +43,52 @@ Exit Codes:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import math
+import os
 import re
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from itertools import combinations
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
 try:
     from _constants import (
         DESCRIPTION_MAX_LENGTH, INDEX_MAX_AGE_HOURS, PINNED_MODEL_REGEX,
         TRIGGER_LANGUAGE_MARKERS, BODY_WORDS_ERROR,
     )
-    from common import Result, get_index_path
+    from common import Result, content_words, get_index_path
     from discover_skills import (
-        SKILL_SOURCES, dedupe_skills, find_skill_files, index_age_hours,
-        parse_skill_file, save_index,
+        SKILL_SOURCES, build_domain_index, dedupe_skills, find_skill_files,
+        index_age_hours, parse_skill_file, save_index,
     )
-    from frontmatter import parse_frontmatter, split_frontmatter
-    from run_skill_evals import content_words
+    from similarity import SimilarityIndex
+    from triage_skill_request import load_skill_index
 except ImportError:
     sys.path.insert(0, str(Path(__file__).resolve().parent))
     from _constants import (
         DESCRIPTION_MAX_LENGTH, INDEX_MAX_AGE_HOURS, PINNED_MODEL_REGEX,
         TRIGGER_LANGUAGE_MARKERS, BODY_WORDS_ERROR,
     )
-    from common import Result, get_index_path
+    from common import Result, content_words, get_index_path
     from discover_skills import (
-        SKILL_SOURCES, dedupe_skills, find_skill_files, index_age_hours,
-        parse_skill_file, save_index,
+        SKILL_SOURCES, build_domain_index, dedupe_skills, find_skill_files,
+        index_age_hours, parse_skill_file, save_index,
     )
-    from frontmatter import parse_frontmatter, split_frontmatter
-    from run_skill_evals import content_words
+    from similarity import SimilarityIndex
+    from triage_skill_request import load_skill_index
 
 DEFAULT_COLLISION_THRESHOLD = 0.4
 TOP_N = 10
-
-# Relative references/scripts/assets paths mentioned in a SKILL.md body.
-_REL_PATH_RE = re.compile(r"(?<![\w/.-])((?:references|scripts|assets)/[\w][\w\-./]*)")
-# Mentions containing template placeholders are not real paths.
-_PLACEHOLDER_RE = re.compile(r"\{\{|[<>*$]|TODO", re.IGNORECASE)
+# The indexed collision pass scores only pairs that can reach this fraction
+# of --threshold; weaker overlap is not worth listing among the worst pairs.
+WORST_PAIR_FLOOR_RATIO = 0.5
+# Nearest-description pairs below this TF-IDF cosine are not worth listing.
+NEAREST_MIN_COSINE = 0.3
 
 
 @dataclass
@@ -93,18 +107,75 @@ class Issue:
 # COLLECTION
 # ===========================================================================
 
-def scan_raw_skills(sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Scan sources WITHOUT dedupe (duplicate detection needs every copy)."""
-    skills: List[Dict[str, Any]] = []
+def pool_map(fn: Callable[..., Any], items: Sequence[Any], jobs: int, threads: bool,
+             extra: Tuple[Sequence[Any], ...] = ()) -> List[Any]:
+    """fn over items (plus parallel extra argument lists) in input order.
+
+    jobs <= 1, or fewer than two items, runs serially in-process. Threads
+    suit stat/exists-bound work; processes suit parsing (fn must be a
+    module-level function).
+    """
+    if jobs <= 1 or len(items) < 2:
+        return [fn(*args) for args in zip(items, *extra)]
+    executor = ThreadPoolExecutor if threads else ProcessPoolExecutor
+    with executor(max_workers=min(jobs, len(items))) as pool:
+        chunksize = 1 if threads else max(1, len(items) // (jobs * 4))
+        return list(pool.map(fn, items, *extra, chunksize=chunksize))
+
+
+def reusable_entry(entry: Optional[Dict[str, Any]], skill_file: Path,
+                   source: Dict[str, Any]) -> bool:
+    """True when an index entry still describes skill_file byte for byte
+    (same source, priority, mtime_ns and size) and carries doctor facts."""
+    if not entry or "facts" not in entry or "mtime_ns" not in entry:
+        return False
+    if entry.get("source") != source["name"] or entry.get("priority") != source["priority"]:
+        return False
+    try:
+        stat = skill_file.stat()
+    except OSError:
+        return False
+    return entry["mtime_ns"] == stat.st_mtime_ns and entry.get("size") == stat.st_size
+
+
+def scan_raw_skills(sources: List[Dict[str, Any]],
+                    index: Optional[Dict[str, Any]] = None, jobs: int = 1
+                    ) -> Tuple[List[Dict[str, Any]], int]:
+    """Scan sources WITHOUT dedupe (duplicate detection needs every copy).
+
+    Every SKILL.md is read and parsed at most once into a record that all
+    checks consume. Files whose index entry is still current are not read
+    at all. With jobs > 1 the unchanged-entry stats run on a thread pool and
+    the remaining files are parsed on a process pool (parsing is regex-bound).
+    Records keep scan order either way. Returns (records, reused_count).
+    """
+    cached = {
+        entry.get("path"): entry
+        for entry in (index or {}).get("skills", [])
+        if isinstance(entry, dict)
+    }
+    found: List[Tuple[Path, Dict[str, Any]]] = []
     for source in sources:
         source_path = Path(source["path"])
         if not source_path.exists():
             continue
         for skill_file in find_skill_files(source_path, source["recursive"]):
-            data = parse_skill_file(skill_file, source["name"], source["priority"])
-            if data:
-                skills.append(data)
-    return skills
+            found.append((skill_file, source))
+
+    def reuse(item: Tuple[Path, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        skill_file, source = item
+        entry = cached.get(str(skill_file))
+        return entry if reusable_entry(entry, skill_file, source) else None
+
+    slots: List[Optional[Dict[str, Any]]] = list(pool_map(reuse, found, jobs, threads=True))
+    reused = sum(1 for slot in slots if slot is not None)
+    pending = [i for i, slot in enumerate(slots) if slot is None]
+    parsed = pool_map(parse_skill_file, [found[i][0] for i in pending], jobs, threads=False,
+                      extra=([found[i][1]["name"] for i in pending],
+                             [found[i][1]["priority"] for i in pending]))
+    for i, data in zip(pending, parsed):
+        slots[i] = data
+    return [slot for slot in slots if slot], reused
 
 
 def sources_from_dirs(dirs: List[Path]) -> List[Dict[str, Any]]:
@@ -124,16 +195,12 @@ def refresh_index_if_stale(deduped: List[Dict[str, Any]]) -> Optional[str]:
     age = index_age_hours()
     if age is not None and age <= INDEX_MAX_AGE_HOURS:
         return None
-    domain_index: Dict[str, List[str]] = {}
-    for skill in deduped:
-        for domain in skill.get("domains", []):
-            domain_index.setdefault(domain, []).append(skill["name"])
     result = Result(
         success=True,
         message="rebuilt by skillforge_doctor",
         data={
             "skills": deduped,
-            "domains": domain_index,
+            "domains": build_domain_index(deduped),
             "sources": {s["name"]: str(s["path"]) for s in SKILL_SOURCES},
             "total_count": len(deduped),
         },
@@ -150,30 +217,82 @@ def refresh_index_if_stale(deduped: List[Dict[str, Any]]) -> Optional[str]:
 # CHECKS
 # ===========================================================================
 
-def check_collisions(skills: List[Dict[str, Any]], threshold: float
-                     ) -> Tuple[List[Issue], List[Dict[str, Any]]]:
-    """(a) Pairwise description keyword overlap (word-boundary Jaccard)."""
-    issues: List[Issue] = []
-    keyword_sets = {
+def collision_candidates(keyword_sets: Dict[str, Set[str]], floor: float
+                         ) -> Iterator[Tuple[str, str]]:
+    """Name pairs that can reach Jaccard >= floor (prefix filtering).
+
+    Tokens are ordered rarest first. Two sets with Jaccard >= t share a token
+    within the first |x| - ceil(t*|x|) + 1 tokens of each, so only those
+    prefixes go into the inverted index; sets are visited smallest first so
+    a partner shorter than t*|x| can be skipped outright. floor <= 0 degrades
+    to "every pair sharing a word", which is exact for the report.
+    """
+    doc_freq = Counter(word for words in keyword_sets.values() for word in words)
+    postings: Dict[str, List[str]] = {}
+    for name in sorted((n for n, w in keyword_sets.items() if w),
+                       key=lambda n: (len(keyword_sets[n]), n)):
+        tokens = sorted(keyword_sets[name], key=lambda w: (doc_freq[w], w))
+        size = len(tokens)
+        # epsilon guards 0.4 * 5 == 2.0000000000000004 from shrinking the prefix
+        prefix = size - max(0, math.ceil(floor * size - 1e-9)) + 1
+        min_partner = floor * size - 1e-9
+        seen: Set[str] = set()
+        for token in tokens[:prefix]:
+            for other in postings.get(token, ()):
+                if other not in seen and len(keyword_sets[other]) >= min_partner:
+                    seen.add(other)
+                    yield (other, name) if other < name else (name, other)
+            postings.setdefault(token, []).append(name)
+
+
+def description_keywords(skills: List[Dict[str, Any]]) -> Dict[str, Set[str]]:
+    return {
         s["name"]: content_words(str(s.get("description") or ""))
         for s in skills
     }
+
+
+def score_pairs(keyword_sets: Dict[str, Set[str]],
+                candidates: Iterable[Tuple[str, str]], floor: float
+                ) -> Tuple[List[Dict[str, Any]], int]:
+    """Exact Jaccard for candidate pairs; keeps pairs at or above floor.
+
+    Returns (pairs, number of candidates scored).
+    """
     pairs: List[Dict[str, Any]] = []
-    for a, b in combinations(sorted(keyword_sets), 2):
+    scored = 0
+    for a, b in candidates:
+        scored += 1
         wa, wb = keyword_sets[a], keyword_sets[b]
         union = wa | wb
         if not union:
             continue
         shared = wa & wb
         jaccard = len(shared) / len(union)
-        if jaccard > 0:
+        if jaccard > 0 and jaccard >= floor:
             pairs.append({
                 "skills": [a, b],
                 "jaccard": round(jaccard, 3),
                 "shared_keywords": sorted(shared)[:12],
             })
-    pairs.sort(key=lambda p: p["jaccard"], reverse=True)
-    worst = pairs[:TOP_N]
+    return pairs, scored
+
+
+def collision_issues(pairs: List[Dict[str, Any]], skills: List[Dict[str, Any]],
+                     threshold: float, engine: Optional[SimilarityIndex] = None
+                     ) -> Tuple[List[Issue], List[Dict[str, Any]]]:
+    """Rank scored pairs; returns (issues, worst TOP_N pairs with cosine)."""
+    ranked = sorted(pairs, key=lambda p: (-p["jaccard"], p["skills"]))
+    worst = [dict(pair) for pair in ranked[:TOP_N]]
+    if worst:
+        # Jaccard treats "pdf" and "use" alike; the IDF-weighted cosine shows
+        # whether the overlap is in rare, routing-relevant words.
+        engine = engine or SimilarityIndex.from_skills(skills)
+        row = {name: i for i, name in enumerate(engine.names)}
+        for pair in worst:
+            a, b = pair["skills"]
+            pair["cosine"] = engine.similarity(row[a], row[b])
+    issues: List[Issue] = []
     for pair in worst:
         if pair["jaccard"] > threshold:
             issues.append(Issue(
@@ -185,6 +304,47 @@ def check_collisions(skills: List[Dict[str, Any]], threshold: float
     return issues, worst
 
 
+def nearest_pairs(engine: SimilarityIndex) -> List[Dict[str, Any]]:
+    """Each skill's nearest description by TF-IDF cosine, as TOP_N unique pairs.
+
+    One batched top_k_all() pass. Unlike the Jaccard pairs, this surfaces
+    skills that share a few rare routing words among many different ones.
+    """
+    best: Dict[Tuple[str, str], float] = {}
+    for name, neighbours in engine.top_k_all(k=1, min_score=NEAREST_MIN_COSINE).items():
+        for other, score in neighbours:
+            best[(min(name, other), max(name, other))] = score
+    ranked = sorted(best.items(), key=lambda item: (-item[1], item[0]))
+    return [{"skills": list(pair), "cosine": score} for pair, score in ranked[:TOP_N]]
+
+
+def check_collisions(skills: List[Dict[str, Any]], threshold: float,
+                     exact: bool = False, engine: Optional[SimilarityIndex] = None
+                     ) -> Tuple[List[Issue], List[Dict[str, Any]], Dict[str, Any]]:
+    """(a) Pairwise description keyword overlap (word-boundary Jaccard).
+
+    Returns (issues, worst pairs, stats). By default only candidate pairs
+    from collision_candidates() are scored, which finds every pair at or
+    above WORST_PAIR_FLOOR_RATIO * threshold; exact=True scores all pairs.
+    """
+    keyword_sets = description_keywords(skills)
+    floor = 0.0 if exact else threshold * WORST_PAIR_FLOOR_RATIO
+    if exact:
+        candidates: Iterator[Tuple[str, str]] = combinations(sorted(keyword_sets), 2)
+    else:
+        candidates = collision_candidates(keyword_sets, floor)
+    pairs, scored = score_pairs(keyword_sets, candidates, floor)
+    issues, worst = collision_issues(pairs, skills, threshold, engine)
+    n = len(keyword_sets)
+    stats = {
+        "mode": "exact" if exact else "indexed",
+        "pairs_scored": scored,
+        "total_pairs": n * (n - 1) // 2,
+        "floor": round(floor, 3),
+    }
+    return issues, worst, stats
+
+
 def _normalized_name(name: str) -> str:
     return re.sub(r"[^a-z0-9]", "", name.lower())
 
@@ -219,82 +379,209 @@ def check_duplicate_names(raw_skills: List[Dict[str, Any]]) -> List[Issue]:
     return issues
 
 
-def extract_relative_refs(body: str) -> List[str]:
-    """Relative references/scripts/assets paths mentioned in a SKILL.md body."""
-    refs = []
-    for match in _REL_PATH_RE.finditer(body):
-        ref = match.group(1).rstrip(".,:;)")
-        if _PLACEHOLDER_RE.search(ref):
-            continue
-        refs.append(ref)
-    return sorted(set(refs))
-
-
-def check_skill_files(skills: List[Dict[str, Any]]
+def check_skill_files(skills: List[Dict[str, Any]], jobs: int = 1
                       ) -> Tuple[List[Issue], List[Dict[str, Any]]]:
-    """(c)(d)(e)(f) Per-skill file checks. Returns (issues, word_counts)."""
+    """(c)(d)(e)(f) Per-skill checks over parsed records (no file reads).
+
+    With jobs > 1 the records are checked on a thread pool - the stale-ref
+    exists() calls dominate on network-mounted homes - and issues are
+    merged in record order, so output matches the serial run.
+    Returns (issues, word_counts).
+    """
     issues: List[Issue] = []
     word_counts: List[Dict[str, Any]] = []
-    for skill in skills:
-        name = skill["name"]
-        path = Path(skill["path"])
-        try:
-            text = path.read_text(encoding="utf-8")
-        except OSError as exc:
-            issues.append(Issue("stale_ref", "error", name,
-                                f"SKILL.md unreadable: {exc}"))
-            continue
-        frontmatter, _err = parse_frontmatter(text)
-        _fm_text, body = split_frontmatter(text)
-
-        # (c) stale relative references
-        skill_dir = path.parent
-        for ref in extract_relative_refs(body):
-            if not (skill_dir / ref).exists():
-                issues.append(Issue(
-                    "stale_ref", "error", name,
-                    f"SKILL.md references missing file: {ref}",
-                ))
-
-        # (d) description lint
-        description = str(frontmatter.get("description") or "").strip()
-        if not description:
-            issues.append(Issue("description", "error", name,
-                                "missing or empty description"))
-        else:
-            if len(description) > DESCRIPTION_MAX_LENGTH:
-                issues.append(Issue(
-                    "description", "error", name,
-                    f"description is {len(description)} chars "
-                    f"(max {DESCRIPTION_MAX_LENGTH} for portability)",
-                ))
-            desc_lower = description.lower()
-            if not any(marker in desc_lower for marker in TRIGGER_LANGUAGE_MARKERS):
-                issues.append(Issue(
-                    "description", "warning", name,
-                    "description has no trigger-condition language "
-                    "('Use when ...') - weak triggering surface",
-                ))
-
-        # (e) token budget
-        words = len(body.split())
-        word_counts.append({"name": name, "path": str(path), "words": words})
-        if words > BODY_WORDS_ERROR:
+    for skill_issues, word_count in pool_map(check_skill_record, skills, jobs, threads=True):
+        issues.extend(skill_issues)
+        word_counts.append(word_count)
+    word_counts.sort(key=lambda w: w["words"], reverse=True)
+    return issues, word_counts
+
+
+def check_skill_record(skill: Dict[str, Any]) -> Tuple[List[Issue], Dict[str, Any]]:
+    """(c)(d)(e)(f) for one record. Returns (issues, word_count entry)."""
+    issues: List[Issue] = []
+    name = skill["name"]
+    path = Path(skill["path"])
+    facts = skill["facts"]
+
+    # (c) stale relative references
+    skill_dir = path.parent
+    for ref in facts["refs"]:
+        if not (skill_dir / ref).exists():
             issues.append(Issue(
-                "token_budget", "warning", name,
-                f"SKILL.md body is {words} words (over the {BODY_WORDS_ERROR} "
-                "hard budget) - the whole body loads on every invocation",
+                "stale_ref", "error", name,
+                f"SKILL.md references missing file: {ref}",
             ))
 
-        # (f) pinned dated model IDs
-        model = frontmatter.get("model")
-        if model and re.search(PINNED_MODEL_REGEX, str(model)):
+    # (d) description lint
+    description = facts["description"]
+    if not description:
+        issues.append(Issue("description", "error", name,
+                            "missing or empty description"))
+    else:
+        if len(description) > DESCRIPTION_MAX_LENGTH:
             issues.append(Issue(
-                "model_pin", "error", name,
-                f"pinned dated model ID: {model} - pin a family alias or omit",
+                "description", "error", name,
+                f"description is {len(description)} chars "
+                f"(max {DESCRIPTION_MAX_LENGTH} for portability)",
             ))
+        desc_lower = description.lower()
+        if not any(marker in desc_lower for marker in TRIGGER_LANGUAGE_MARKERS):
+            issues.append(Issue(
+                "description", "warning", name,
+                "description has no trigger-condition language "
+                "('Use when ...') - weak triggering surface",
+            ))
+
+    # (e) token budget
+    words = facts["body_words"]
+    word_count = {"name": name, "path": str(path), "words": words}
+    if words > BODY_WORDS_ERROR:
+        issues.append(Issue(
+            "token_budget", "warning", name,
+            f"SKILL.md body is {words} words (over the {BODY_WORDS_ERROR} "
+            "hard budget) - the whole body loads on every invocation",
+        ))
+
+    # (f) pinned dated model IDs
+    model = facts["model"]
+    if model and re.search(PINNED_MODEL_REGEX, model):
+        issues.append(Issue(
+            "model_pin", "error", name,
+            f"pinned dated model ID: {model} - pin a family alias or omit",
+        ))
+    return issues, word_count
+
+
+# ===========================================================================
+# INCREMENTAL CACHE
+# ===========================================================================
+# --incremental persists, per skill, a content hash of everything its checks
+# read plus the resulting issues, and every collision pair at or above the
+# floor. The next run re-checks only skills whose hash changed and re-scores
+# only pairs touching a changed description; the rest of the report is
+# assembled from the cache, so it matches a full run.
+
+DOCTOR_CACHE_VERSION = 1
+# Changed x roster comparisons below which changed descriptions are compared
+# directly; above it (first run, mass edits) the prefix-filtered candidates
+# are generated for the whole roster and filtered to changed skills.
+DIRECT_COMPARE_LIMIT = 250_000
+
+
+def default_cache_path() -> Path:
+    return get_index_path().parent / "doctor_cache.json"
+
+
+def load_doctor_cache(path: Path) -> Dict[str, Any]:
+    """Cached results, or an empty cache when missing/corrupt/outdated."""
+    try:
+        cache = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != DOCTOR_CACHE_VERSION:
+        return {}
+    return cache
+
+
+def save_doctor_cache(path: Path, cache: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(cache), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _digest(payload: Any) -> str:
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def skill_check_key(skill: Dict[str, Any]) -> str:
+    """Hash of every input to check_skill_record(), including which refs exist."""
+    skill_dir = Path(skill["path"]).parent
+    facts = skill["facts"]
+    return _digest({
+        "name": skill["name"],
+        "path": skill["path"],
+        "facts": facts,
+        "refs_present": [(skill_dir / ref).exists() for ref in facts["refs"]],
+    })
+
+
+def check_collisions_incremental(skills: List[Dict[str, Any]], threshold: float,
+                                 cache: Dict[str, Any],
+                                 engine: Optional[SimilarityIndex] = None
+                                 ) -> Tuple[List[Issue], List[Dict[str, Any]],
+                                            Dict[str, Any], List[Dict[str, Any]],
+                                            Dict[str, str]]:
+    """(a) with cached pairs: re-score only pairs touching a changed description.
+
+    Returns (issues, worst, stats, all pairs >= floor, description hashes).
+    """
+    keyword_sets = description_keywords(skills)
+    floor = threshold * WORST_PAIR_FLOOR_RATIO
+    hashes = {name: _digest(sorted(words)) for name, words in keyword_sets.items()}
+    previous = cache.get("skills", {}) if cache.get("floor") == floor else {}
+    unchanged = {name for name, h in hashes.items()
+                 if previous.get(name, {}).get("words") == h}
+    changed = set(hashes) - unchanged
+
+    pairs = [pair for pair in cache.get("pairs", []) if previous
+             and pair["skills"][0] in unchanged and pair["skills"][1] in unchanged]
+    names = sorted(keyword_sets)
+    if len(changed) * len(names) <= DIRECT_COMPARE_LIMIT:
+        candidates: Iterable[Tuple[str, str]] = (
+            (min(c, o), max(c, o))
+            for c in sorted(changed) for o in names
+            if o != c and not (o in changed and o < c)
+        )
+    else:
+        candidates = (pair for pair in collision_candidates(keyword_sets, floor)
+                      if pair[0] in changed or pair[1] in changed)
+    fresh, scored = score_pairs(keyword_sets, candidates, floor)
+    pairs.extend(fresh)
+    issues, worst = collision_issues(pairs, skills, threshold, engine)
+    n = len(names)
+    stats = {
+        "mode": "incremental",
+        "pairs_scored": scored,
+        "total_pairs": n * (n - 1) // 2,
+        "floor": round(floor, 3),
+        "changed_descriptions": len(changed),
+    }
+    return issues, worst, stats, pairs, hashes
+
+
+def check_skill_files_incremental(skills: List[Dict[str, Any]], cache: Dict[str, Any],
+                                  jobs: int = 1
+                                  ) -> Tuple[List[Issue], List[Dict[str, Any]],
+                                             Dict[str, Dict[str, Any]], int]:
+    """(c)-(f) reusing cached issues for skills whose check key is unchanged.
+
+    Returns (issues, word_counts, cache entries by name, rechecked count).
+    """
+    previous = cache.get("skills", {})
+
+    def run(skill: Dict[str, Any]) -> Tuple[List[Issue], Dict[str, Any], str, bool]:
+        key = skill_check_key(skill)
+        entry = previous.get(skill["name"])
+        if entry and entry.get("key") == key:
+            return [Issue(**d) for d in entry["issues"]], entry["word_count"], key, False
+        skill_issues, word_count = check_skill_record(skill)
+        return skill_issues, word_count, key, True
+
+    issues: List[Issue] = []
+    word_counts: List[Dict[str, Any]] = []
+    entries: Dict[str, Dict[str, Any]] = {}
+    rechecked = 0
+    for skill, (skill_issues, word_count, key, fresh) in zip(
+            skills, pool_map(run, skills, jobs, threads=True)):
+        issues.extend(skill_issues)
+        word_counts.append(word_count)
+        entries[skill["name"]] = {"key": key, "issues": [i.to_dict() for i in skill_issues],
+                                  "word_count": word_count}
+        rechecked += fresh
     word_counts.sort(key=lambda w: w["words"], reverse=True)
-    return issues, word_counts
+    return issues, word_counts, entries, rechecked
 
 
 # ===========================================================================
@@ -302,18 +589,41 @@ def check_skill_files(skills: List[Dict[str, Any]]
 # ===========================================================================
 
 def run_doctor(sources: List[Dict[str, Any]], threshold: float,
-               manage_index: bool) -> Dict[str, Any]:
-    raw = scan_raw_skills(sources)
+               manage_index: bool, exact: bool = False, jobs: int = 1,
+               cache_path: Optional[Path] = None) -> Dict[str, Any]:
+    """Full report; with cache_path, only changed skills are re-evaluated."""
+    index = load_skill_index() if manage_index else None
+    raw, reused = scan_raw_skills(sources, index, jobs=jobs)
     deduped = dedupe_skills(raw)
 
     index_note = refresh_index_if_stale(deduped) if manage_index else None
 
     issues: List[Issue] = []
     dup_issues = check_duplicate_names(raw)
-    collision_issues, worst_pairs = check_collisions(deduped, threshold)
-    file_issues, word_counts = check_skill_files(deduped)
+    engine = SimilarityIndex.from_skills(deduped)
+    incremental = None
+    if cache_path is None:
+        pair_issues, worst_pairs, collision_stats = check_collisions(
+            deduped, threshold, exact=exact, engine=engine)
+        file_issues, word_counts = check_skill_files(deduped, jobs=jobs)
+    else:
+        cache = load_doctor_cache(cache_path)
+        pair_issues, worst_pairs, collision_stats, pairs, hashes = \
+            check_collisions_incremental(deduped, threshold, cache, engine)
+        file_issues, word_counts, entries, rechecked = check_skill_files_incremental(
+            deduped, cache, jobs=jobs)
+        for name, entry in entries.items():
+            entry["words"] = hashes[name]
+        save_doctor_cache(cache_path, {
+            "version": DOCTOR_CACHE_VERSION,
+            "floor": threshold * WORST_PAIR_FLOOR_RATIO,
+            "skills": entries,
+            "pairs": pairs,
+        })
+        incremental = {"cache": str(cache_path), "rechecked": rechecked,
+                       "changed_descriptions": collision_stats["changed_descriptions"]}
     issues.extend(dup_issues)
-    issues.extend(collision_issues)
+    issues.extend(pair_issues)
     issues.extend(file_issues)
 
     errors = [i for i in issues if i.severity == "error"]
@@ -321,9 +631,13 @@ def run_doctor(sources: List[Dict[str, Any]], threshold: float,
     return {
         "skill_count": len(deduped),
         "raw_count": len(raw),
+        "reused_count": reused,
         "index_note": index_note,
         "issues": issues,
         "worst_collision_pairs": worst_pairs,
+        "collision_stats": collision_stats,
+        "nearest_description_pairs": nearest_pairs(engine),
+        "incremental": incremental,
         "heaviest_skills": word_counts[:TOP_N],
         "total_words": sum(w["words"] for w in word_counts),
         "error_count": len(errors),
@@ -340,18 +654,37 @@ def format_report(data: Dict[str, Any], threshold: float) -> str:
         f"({data['raw_count']} copies across sources); "
         f"total SKILL.md load: {data['total_words']:,} words",
     ]
+    if data["reused_count"]:
+        lines.append(f"Reused {data['reused_count']} unchanged index entries "
+                     f"(parsed {data['raw_count'] - data['reused_count']} SKILL.md file(s))")
     if data["index_note"]:
         lines.append(f"Index: {data['index_note']}")
+    if data["incremental"]:
+        inc = data["incremental"]
+        lines.append(f"Incremental: re-checked {inc['rechecked']} of {data['skill_count']} "
+                     f"skill(s), {inc['changed_descriptions']} changed description(s); "
+                     f"cache {inc['cache']}")
 
     lines.append(f"\n{'Worst trigger-collision pairs':-^64}")
+    stats = data["collision_stats"]
+    if stats["mode"] in ("indexed", "incremental"):
+        lines.append(f"  (indexed: scored {stats['pairs_scored']:,} of "
+                     f"{stats['total_pairs']:,} pairs; Jaccard >= {stats['floor']} listed)")
     if data["worst_collision_pairs"]:
         for pair in data["worst_collision_pairs"]:
             flag = "  <-- over threshold" if pair["jaccard"] > threshold else ""
             lines.append(f"  {pair['jaccard']:.2f}  {pair['skills'][0]} + "
-                         f"{pair['skills'][1]}{flag}")
+                         f"{pair['skills'][1]} (tf-idf {pair['cosine']:.2f}){flag}")
     else:
         lines.append("  (no description overlap found)")
 
+    lines.append(f"\n{'Closest descriptions (TF-IDF nearest neighbour)':-^64}")
+    if data["nearest_description_pairs"]:
+        for pair in data["nearest_description_pairs"]:
+            lines.append(f"  {pair['cosine']:.2f}  {pair['skills'][0]} + {pair['skills'][1]}")
+    else:
+        lines.append(f"  (no pair above cosine {NEAREST_MIN_COSINE})")
+
     lines.append(f"\n{'Top-10 heaviest SKILL.md files (body words)':-^64}")
     for entry in data["heaviest_skills"]:
         lines.append(f"  {entry['words']:>6}  {entry['name']}")
@@ -390,6 +723,9 @@ Examples:
   %(prog)s                    # scan all standard sources
   %(prog)s --json --strict    # CI: machine output, exit 10 on errors
   %(prog)s --sources ./skills # scan only an ad-hoc directory
+  %(prog)s --exact            # score every skill pair (verifies the indexed pass)
+  %(prog)s --jobs 8           # parallel parsing and ref checks (network homes)
+  %(prog)s --incremental --json --strict   # CI: re-check only changed skills
         """,
     )
     parser.add_argument("--json", action="store_true", help="Machine-readable JSON output")
@@ -397,10 +733,31 @@ Examples:
                         help="Exit 10 when errors are found (default: always 0)")
     parser.add_argument("--threshold", type=float, default=DEFAULT_COLLISION_THRESHOLD,
                         help=f"Collision Jaccard threshold (default: {DEFAULT_COLLISION_THRESHOLD})")
+    parser.add_argument("--exact", action="store_true",
+                        help="Score every skill pair for collisions instead of only "
+                             "indexed candidates (O(n^2); for verification)")
+    parser.add_argument("--jobs", type=int, default=1, metavar="N",
+                        help="Parse SKILL.md files on N processes and run per-skill "
+                             "checks on N threads (default: 1, serial)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Re-evaluate only skills whose content changed since the "
+                             "last incremental run; assemble the rest from the cache")
+    parser.add_argument("--cache", type=Path, metavar="FILE",
+                        help="Incremental results cache (implies --incremental; "
+                             "default: doctor_cache.json next to the skill index)")
     parser.add_argument("--sources", nargs="+", type=Path, metavar="DIR",
                         help="Scan only these directories (each holds <skill>/SKILL.md); "
                              "skips the shared index entirely")
     args = parser.parse_args(argv)
+    if args.jobs < 1:
+        print("Error: --jobs must be at least 1", file=sys.stderr)
+        return 2
+    cache_path = None
+    if args.incremental or args.cache:
+        if args.exact:
+            print("Error: --exact scores every pair; it cannot be incremental", file=sys.stderr)
+            return 2
+        cache_path = (args.cache or default_cache_path()).expanduser()
 
     if args.sources:
         dirs = [d.expanduser().resolve() for d in args.sources]
@@ -415,7 +772,8 @@ Examples:
         manage_index = True
 
     try:
-        data = run_doctor(sources, args.threshold, manage_index)
+        data = run_doctor(sources, args.threshold, manage_index,
+                          exact=args.exact, jobs=args.jobs, cache_path=cache_path)
     except OSError as exc:
         print(f"Error: {exc}", file=sys.stderr)
         return 1
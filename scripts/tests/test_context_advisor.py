@@ -5,6 +5,7 @@ Regression tests for proactive Context Skill Advisor primitives.
 
 from __future__ import annotations
 
+import json
 import sys
 import tempfile
 import unittest
@@ -17,6 +18,7 @@ SCRIPTS_DIR = Path(__file__).resolve().parents[1]
 if str(SCRIPTS_DIR) not in sys.path:
     sys.path.insert(0, str(SCRIPTS_DIR))
 
+import advisor_scoring  # noqa: E402
 import context_advisor  # noqa: E402
 import skillforge_config  # noqa: E402
 from advisor_scoring import Suggestion, build_suggestions  # noqa: E402
@@ -478,5 +480,55 @@ class ContextAdvisorTest(unittest.TestCase):
         self.assertEqual(evidence, [])
 
 
+class AdvisorTermMatcherTest(unittest.TestCase):
+    SKILL = {
+        "name": "pdf-tools",
+        "description": "Merge and split PDF files; fill pdf-forms",
+        "triggers": ["merge pdf"],
+        "keywords": ["pdf", "merge", "split"],
+        "domains": ["documents", "spreadsheet"],
+    }
+
+    def test_compiled_matcher_agrees_with_per_term_search(self) -> None:
+        terms = advisor_scoring.relevant_terms(self.SKILL)
+        matcher = advisor_scoring.skill_term_matcher(self.SKILL)
+        texts = ["please merge these", "pdf-formsx here", "the pdf-forms tool",
+                 "xlsx export", "excel2 sheet", "nothing relevant", "mergepdf", "SPLIT it"]
+        for text in texts:
+            with self.subTest(text=text):
+                expected = any(advisor_scoring.term_in_text(term, text) for term in terms)
+                self.assertEqual(matcher.search(text.lower()) is not None, expected)
+                self.assertEqual(advisor_scoring.any_term_in_text(terms, text), expected)
+
+    def test_matcher_is_cached_across_calls(self) -> None:
+        first = advisor_scoring.skill_term_matcher(dict(self.SKILL))
+        second = advisor_scoring.skill_term_matcher(dict(self.SKILL))
+        self.assertIs(first, second)
+        self.assertIsNone(advisor_scoring.compile_terms(frozenset()))
+
+    def test_terms_persisted_on_the_index_are_used(self) -> None:
+        skills = [dict(self.SKILL)]
+        advisor_scoring.annotate_advisor_terms(skills)
+        persisted = skills[0]["advisor_terms"]
+        self.assertEqual(persisted["version"], advisor_scoring.ADVISOR_TERMS_VERSION)
+        self.assertEqual(set(persisted["terms"]), advisor_scoring.relevant_terms(self.SKILL))
+        stale = dict(self.SKILL, advisor_terms={"version": -1, "terms": ["bogus"]})
+        self.assertNotIn("bogus", advisor_scoring.relevant_terms(stale))
+        pinned = dict(self.SKILL, advisor_terms={"version": persisted["version"], "terms": ["zzz"]})
+        self.assertEqual(advisor_scoring.relevant_terms(pinned), {"zzz"})
+
+    def test_rebuilt_index_carries_advisor_terms(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            index_path = Path(tmp) / "skill_index.json"
+            result = SimpleNamespace(data={"skills": [dict(self.SKILL)], "domains": {},
+                                           "sources": [], "total_count": 1})
+            with patch.object(context_advisor, "get_index_path", return_value=index_path), \
+                    patch.object(context_advisor, "index_age_hours", return_value=None), \
+                    patch.object(context_advisor, "discover_skills", return_value=result), \
+                    patch.object(context_advisor, "load_skill_index",
+                                 side_effect=lambda: json.loads(index_path.read_text())):
+                index = context_advisor.ensure_skill_index()
+        self.assertIn("advisor_terms", index["skills"][0])
+
 if __name__ == "__main__":
     unittest.main()
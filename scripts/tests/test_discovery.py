@@ -7,6 +7,9 @@ and index staleness helpers.
 
 from __future__ import annotations
 
+import contextlib
+import io
+import json
 import sys
 import tempfile
 import time
@@ -18,7 +21,9 @@ SCRIPTS_DIR = Path(__file__).resolve().parents[1]
 if str(SCRIPTS_DIR) not in sys.path:
     sys.path.insert(0, str(SCRIPTS_DIR))
 
+import advisor_scoring  # noqa: E402
 import discover_skills  # noqa: E402
+from common import DOMAIN_MATCHER, TermMatcher, phrase_in_text  # noqa: E402
 from discover_skills import (  # noqa: E402
     classify_domain,
     dedupe_skills,
@@ -138,6 +143,27 @@ class DiscoveryEndToEndTest(unittest.TestCase):
             self.assertEqual(result.data["duplicates_removed"], 1)
             self.assertEqual(result.data["missing_sources"], 1)
 
+    def test_saved_index_and_json_carry_advisor_terms(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="skillforge-test-") as tmp:
+            root = Path(tmp)
+            write_skill(root, "personal/pdf", "pdf-tools", "Use when merging pdf documents.")
+            output = root / "index.json"
+            buffer = io.StringIO()
+            with mock.patch.object(discover_skills, "SKILL_SOURCES", self._sources(root)), \
+                    mock.patch.object(sys, "argv", ["discover_skills.py", "--json",
+                                                    "--output", str(output)]), \
+                    contextlib.redirect_stdout(buffer), self.assertRaises(SystemExit):
+                discover_skills.main()
+            printed = json.loads(buffer.getvalue())["data"]["skills"]
+            saved = json.loads(output.read_text(encoding="utf-8"))["skills"]
+        for skills in (printed, saved):
+            terms = skills[0]["advisor_terms"]
+            self.assertEqual(terms["version"], advisor_scoring.ADVISOR_TERMS_VERSION)
+            self.assertIn("merging", terms["terms"])
+        self.assertEqual(advisor_scoring.skill_terms(saved[0]),
+                         advisor_scoring.skill_terms({k: v for k, v in saved[0].items()
+                                                      if k != "advisor_terms"}))
+
     def test_all_sources_missing_reported(self) -> None:
         with tempfile.TemporaryDirectory(prefix="skillforge-test-") as tmp:
             root = Path(tmp)
@@ -181,6 +207,34 @@ class ClassifyDomainTest(unittest.TestCase):
         self.assertIn("code_quality", domains)
 
 
+class DomainMatcherTest(unittest.TestCase):
+    def test_one_pass_agrees_with_per_phrase_search(self) -> None:
+        text = ("Export PDF and api docs; a code review via pr review on a pull "
+                "request. Not email, not html. Sign in, then sign up for AI/ML.")
+        found = DOMAIN_MATCHER.found(text)
+        for phrase in DOMAIN_MATCHER.phrases:
+            self.assertEqual(phrase in found, phrase_in_text(phrase, text), phrase)
+        # Overlapping and nested phrases are all reported.
+        self.assertTrue({"api docs", "api", "docs", "code review", "pr review",
+                         "review", "export pdf", "pdf"} <= found)
+
+    def test_term_matcher_handles_empty_inputs(self) -> None:
+        self.assertEqual(TermMatcher([]).found("anything"), set())
+        self.assertEqual(TermMatcher(["x"]).found(""), set())
+
+    def test_parsed_record_persists_domain_hits(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = write_skill(Path(tmp), "code-review", "code-review",
+                               "Use when running a code review or pr review.")
+            record = discover_skills.parse_skill_file(path, "test", 1)
+        persisted = record["domain_terms"]
+        self.assertEqual(persisted["signature"], DOMAIN_MATCHER.signature)
+        self.assertIn("code_quality", record["domains"])
+        self.assertGreaterEqual(len(persisted["matches"]["code_quality"]), 2)
+        self.assertIn("code review", persisted["description"])
+        self.assertIn("code quality", DOMAIN_MATCHER.phrases)
+
+
 class IndexAgeTest(unittest.TestCase):
     def test_missing_index_age_is_none(self) -> None:
         with tempfile.TemporaryDirectory(prefix="skillforge-test-") as tmp:
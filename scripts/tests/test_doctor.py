@@ -8,16 +8,19 @@ codes. All fixtures are tmp-dir skill roots fed through --sources plumbing.
 from __future__ import annotations
 
 import json
+import random
 import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 SCRIPTS_DIR = Path(__file__).resolve().parents[1]
 if str(SCRIPTS_DIR) not in sys.path:
     sys.path.insert(0, str(SCRIPTS_DIR))
 
 import skillforge_doctor as doctor  # noqa: E402
+from discover_skills import extract_relative_refs  # noqa: E402
 
 
 def write_skill(root: Path, name: str, description: str = "",
@@ -74,6 +77,65 @@ class CollisionTest(unittest.TestCase):
             self.assertEqual(issues_of(data, "collision"), [])
 
 
+class NearestDescriptionTest(unittest.TestCase):
+    def test_closest_pair_listed_without_a_collision(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            write_skill(root, "heic-thumbs", "Use when turning heic images into webp thumbnails")
+            write_skill(root, "gallery-export",
+                        "Use when exporting albums with heic webp thumbnails, tagging "
+                        "people, and printing")
+            write_skill(root, "sourdough", "Use when baking sourdough bread loaves")
+            write_skill(root, "flamegraph", "Use when profiling cpu flamegraphs")
+            write_skill(root, "changelog", "Use when drafting release changelogs")
+            import similarity
+            with mock.patch.object(similarity.SimilarityIndex, "from_skills",
+                                   wraps=similarity.SimilarityIndex.from_skills) as built:
+                data = run_on([root])
+            text = doctor.format_report(data, doctor.DEFAULT_COLLISION_THRESHOLD)
+        self.assertEqual(built.call_count, 1)
+        self.assertEqual(issues_of(data, "collision"), [])
+        nearest = data["nearest_description_pairs"]
+        self.assertEqual([p["skills"] for p in nearest], [["gallery-export", "heic-thumbs"]])
+        self.assertGreaterEqual(nearest[0]["cosine"], doctor.NEAREST_MIN_COSINE)
+        self.assertIn("gallery-export + heic-thumbs", text)
+
+
+class IndexedCollisionTest(unittest.TestCase):
+    VOCAB = ["pdf", "docx", "merge", "split", "deploy", "rollout", "schema",
+             "query", "index", "cache", "widget", "render", "audit", "lint",
+             "review", "token", "budget", "trace", "profile", "bench"]
+
+    def _roster(self, count: int, seed: int):
+        rng = random.Random(seed)
+        return [{"name": f"skill-{i:03d}",
+                 "description": "Use when " + " ".join(rng.sample(self.VOCAB, rng.randint(2, 7)))}
+                for i in range(count)]
+
+    def test_indexed_matches_exact_above_floor(self) -> None:
+        threshold = doctor.DEFAULT_COLLISION_THRESHOLD
+        floor = threshold * doctor.WORST_PAIR_FLOOR_RATIO
+        for seed in range(5):
+            skills = self._roster(60, seed)
+            exact_issues, exact_worst, _ = doctor.check_collisions(skills, threshold, exact=True)
+            issues, worst, stats = doctor.check_collisions(skills, threshold)
+            self.assertEqual([i.to_dict() for i in issues],
+                             [i.to_dict() for i in exact_issues])
+            self.assertEqual(worst, [p for p in exact_worst if p["jaccard"] >= floor])
+            self.assertLess(stats["pairs_scored"], stats["total_pairs"])
+
+    def test_exact_flag_scores_every_pair(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for i, desc in enumerate(("pdf merge", "pdf split", "sourdough bread")):
+                write_skill(root, f"skill-{i}", f"Use when {desc}")
+            sources = doctor.sources_from_dirs([root])
+            data = doctor.run_doctor(sources, doctor.DEFAULT_COLLISION_THRESHOLD,
+                                     manage_index=False, exact=True)
+        self.assertEqual(data["collision_stats"]["mode"], "exact")
+        self.assertEqual(data["collision_stats"]["pairs_scored"], 3)
+
+
 class DuplicateNameTest(unittest.TestCase):
     def test_exact_duplicate_across_sources(self) -> None:
         with tempfile.TemporaryDirectory() as a, tempfile.TemporaryDirectory() as b:
@@ -140,7 +202,7 @@ class StaleRefTest(unittest.TestCase):
     def test_extract_relative_refs(self) -> None:
         body = ("Run `python3 scripts/foo.py` then read "
                 "[x](references/deep/file.md). Skip references/{{tpl}}.md.")
-        refs = doctor.extract_relative_refs(body)
+        refs = extract_relative_refs(body)
         self.assertIn("scripts/foo.py", refs)
         self.assertIn("references/deep/file.md", refs)
         self.assertEqual(len(refs), 2)
@@ -220,6 +282,141 @@ class ModelPinTest(unittest.TestCase):
             self.assertEqual(issues_of(data, "model_pin"), [])
 
 
+class SinglePassTest(unittest.TestCase):
+    def _index_for(self, root: Path) -> dict:
+        sources = doctor.sources_from_dirs([root])
+        raw, reused = doctor.scan_raw_skills(sources)
+        self.assertEqual(reused, 0)
+        return {"skills": raw}
+
+    def test_each_file_read_once(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            write_skill(root, "one", "Use when testing single reads")
+            write_skill(root, "two", "Use when testing single reads twice")
+            with mock.patch.object(Path, "read_text", autospec=True,
+                                   side_effect=Path.read_text) as reads:
+                run_on([root])
+            skill_reads = [c for c in reads.call_args_list if c.args[0].name == "SKILL.md"]
+            self.assertEqual(len(skill_reads), 2)
+
+    def test_unchanged_index_entries_skip_parsing(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            write_skill(root, "cached", "Use when testing cached records",
+                        extra_fm="model: claude-sonnet-4-20250514\n")
+            index = self._index_for(root)
+            sources = doctor.sources_from_dirs([root])
+            with mock.patch.object(doctor, "parse_skill_file",
+                                   side_effect=AssertionError("re-parsed")):
+                raw, reused = doctor.scan_raw_skills(sources, index)
+            self.assertEqual(reused, 1)
+            file_issues, _counts = doctor.check_skill_files(raw)
+            self.assertEqual([i.check for i in file_issues], ["model_pin"])
+
+    def test_edited_file_is_reparsed(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            skill_dir = write_skill(root, "edited", "Use when testing edits")
+            index = self._index_for(root)
+            (skill_dir / "SKILL.md").write_text(
+                "---\nname: edited\n---\n# longer body now\n", encoding="utf-8")
+            raw, reused = doctor.scan_raw_skills(doctor.sources_from_dirs([root]), index)
+            self.assertEqual(reused, 0)
+            self.assertEqual(raw[0]["facts"]["description"], "")
+
+
+class ParallelTest(unittest.TestCase):
+    def test_jobs_output_matches_serial(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for i in range(6):
+                body = f"# S\n\nsee references/missing-{i}.md\n" if i % 2 else "# S\n"
+                write_skill(root, f"skill-{i}", f"Use when handling widgets batch {i}",
+                            body=body, extra_fm="" if i % 3 else "model: claude-opus-4-20250514\n")
+            sources = doctor.sources_from_dirs([root])
+            serial = doctor.run_doctor(sources, doctor.DEFAULT_COLLISION_THRESHOLD,
+                                       manage_index=False)
+            parallel = doctor.run_doctor(sources, doctor.DEFAULT_COLLISION_THRESHOLD,
+                                         manage_index=False, jobs=3)
+        self.assertEqual(doctor.to_json(parallel), doctor.to_json(serial))
+        self.assertEqual(len(issues_of(serial, "stale_ref")), 3)
+
+    def test_zero_jobs_rejected(self) -> None:
+        with mock.patch("sys.stderr"):
+            self.assertEqual(doctor.main(["--jobs", "0"]), 2)
+
+
+class IncrementalTest(unittest.TestCase):
+    def _roster(self, root: Path) -> None:
+        write_skill(root, "pdf-tool", "Use when converting extracting merging pdf documents")
+        write_skill(root, "pdf-helper", "Use when converting extracting merging pdf files")
+        write_skill(root, "db-tuner", "Use when tuning database queries and indexes",
+                    body="# S\n\nsee references/guide.md\n")
+        (root / "db-tuner" / "references").mkdir()
+        (root / "db-tuner" / "references" / "guide.md").write_text("x", encoding="utf-8")
+
+    def _run(self, root: Path, cache: Path) -> dict:
+        return doctor.run_doctor(doctor.sources_from_dirs([root]),
+                                 doctor.DEFAULT_COLLISION_THRESHOLD,
+                                 manage_index=False, cache_path=cache)
+
+    def _comparable(self, data: dict) -> dict:
+        payload = json.loads(doctor.to_json(data))
+        for key in ("collision_stats", "incremental"):
+            payload.pop(key)
+        return payload
+
+    def test_unchanged_roster_served_from_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root, cache = Path(tmp) / "skills", Path(tmp) / "cache.json"
+            self._roster(root)
+            first = self._run(root, cache)
+            second = self._run(root, cache)
+            full = run_on([root])
+        self.assertEqual(first["incremental"]["rechecked"], 3)
+        self.assertEqual(second["incremental"]["rechecked"], 0)
+        self.assertEqual(second["collision_stats"]["pairs_scored"], 0)
+        self.assertEqual(self._comparable(second), self._comparable(full))
+
+    def test_only_changed_skill_rescored(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root, cache = Path(tmp) / "skills", Path(tmp) / "cache.json"
+            self._roster(root)
+            self._run(root, cache)
+            (root / "pdf-helper" / "SKILL.md").write_text(
+                '---\nname: pdf-helper\ndescription: "Use when tuning database queries"\n---\n',
+                encoding="utf-8")
+            data = self._run(root, cache)
+            full = run_on([root])
+        self.assertEqual(data["incremental"]["rechecked"], 1)
+        self.assertEqual(data["incremental"]["changed_descriptions"], 1)
+        self.assertEqual(data["collision_stats"]["pairs_scored"], 2)
+        self.assertEqual(self._comparable(data), self._comparable(full))
+
+    def test_deleted_reference_invalidates_cached_issues(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root, cache = Path(tmp) / "skills", Path(tmp) / "cache.json"
+            self._roster(root)
+            self.assertEqual(issues_of(self._run(root, cache), "stale_ref"), [])
+            (root / "db-tuner" / "references" / "guide.md").unlink()
+            data = self._run(root, cache)
+        self.assertEqual(len(issues_of(data, "stale_ref")), 1)
+        self.assertEqual(data["incremental"]["rechecked"], 1)
+
+    def test_corrupt_cache_falls_back_to_full_run(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root, cache = Path(tmp) / "skills", Path(tmp) / "cache.json"
+            self._roster(root)
+            cache.write_text("{not json", encoding="utf-8")
+            data = self._run(root, cache)
+        self.assertEqual(data["incremental"]["rechecked"], 3)
+
+    def test_exact_cannot_be_incremental(self) -> None:
+        with mock.patch("sys.stderr"):
+            self.assertEqual(doctor.main(["--incremental", "--exact"]), 2)
+
+
 class CliTest(unittest.TestCase):
     def _healthy_root(self, tmp: str) -> Path:
         root = Path(tmp)
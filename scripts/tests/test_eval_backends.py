@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Tests for eval_backends.py - the deterministic stub responder, the
+persistent-process and HTTP backends driven against the local stub server,
+and run_skill_evals.py --live end to end through --backend stub.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1]
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+TESTS_DIR = Path(__file__).resolve().parent
+if str(TESTS_DIR) not in sys.path:
+    sys.path.insert(0, str(TESTS_DIR))
+
+import eval_backends as eb  # noqa: E402
+import run_skill_evals as rse  # noqa: E402
+from test_run_skill_evals import build_skill  # noqa: E402
+
+
+def judge_prompt(assertions) -> str:
+    return rse.JUDGE_PROMPT.format(
+        task="do it", output="done",
+        assertions="\n".join(f"- {a}" for a in assertions))
+
+
+def trigger_prompt(query: str) -> str:
+    return rse.TRIGGER_PROMPT.format(
+        name="deploy-checker",
+        description="Use when verifying a deploy or checking rollout health.",
+        query=query)
+
+
+class StubResponderTest(unittest.TestCase):
+    def test_judge_prompt_passes_every_assertion(self) -> None:
+        assertions = ["Output quotes the status: ok", "No success without evidence"]
+        parsed = rse.extract_json(eb.stub_respond(judge_prompt(assertions)))
+        self.assertEqual([v["assertion"] for v in parsed["verdicts"]], assertions)
+        self.assertTrue(all(v["pass"] for v in parsed["verdicts"]))
+
+    def test_trigger_prompt_uses_keyword_overlap(self) -> None:
+        fired = rse.extract_json(eb.stub_respond(trigger_prompt("check rollout health")))
+        quiet = rse.extract_json(eb.stub_respond(trigger_prompt("bake sourdough bread")))
+        self.assertEqual(fired, {"triggered": True})
+        self.assertEqual(quiet, {"triggered": False})
+
+    def test_scenario_task_is_deterministic(self) -> None:
+        self.assertEqual(eb.stub_respond("Deploy X"), eb.stub_respond("Deploy X"))
+
+    def test_stub_backend_counts_calls(self) -> None:
+        backend = eb.StubBackend()
+        for _ in range(3):
+            self.assertTrue(backend.run("task", 1, 5)[0])
+        self.assertEqual(backend.stats()["calls"], 3)
+
+    def test_stub_latency_over_timeout_times_out(self) -> None:
+        completed, output = eb.StubBackend(latency=0.2).run("task", 1, 0)
+        self.assertFalse(completed)
+        self.assertIn("timed out", output)
+
+
+class MakeBackendTest(unittest.TestCase):
+    def test_process_requires_command(self) -> None:
+        with self.assertRaises(ValueError):
+            eb.make_backend("process")
+
+    def test_http_requires_url(self) -> None:
+        with self.assertRaises(ValueError):
+            eb.make_backend("http")
+
+    def test_unknown_name_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            eb.make_backend("carrier-pigeon")
+
+    def test_base_backend_is_abstract(self) -> None:
+        with self.assertRaises(TypeError):
+            eb.RunnerBackend()
+
+    def test_parse_response_rejects_garbage(self) -> None:
+        self.assertFalse(eb.parse_response("not json")[0])
+        self.assertFalse(eb.parse_response('{"output": "x"}')[0])
+        self.assertEqual(eb.parse_response('{"completed": true, "output": "x"}'),
+                         (True, "x"))
+
+
+class ServedBackendTest(unittest.TestCase):
+    def test_process_backend_against_stdio_stub(self) -> None:
+        command = f'"{sys.executable}" "{SCRIPTS_DIR / "eval_backends.py"}" serve --stdio'
+        backend = eb.make_backend("process", command=command)
+        try:
+            self.assertTrue(backend.available())
+            first = backend.run(trigger_prompt("verify the deploy"), 1, 30)
+            second = backend.run("Deploy X", 1, 30)
+        finally:
+            backend.close()
+        self.assertEqual(first, (True, json.dumps({"triggered": True})))
+        self.assertEqual(second, (True, eb.stub_respond("Deploy X")))
+
+    def test_http_backend_against_stub_server(self) -> None:
+        server = eb.make_stub_server(0, latency=0.0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            host, port = server.server_address[:2]
+            backend = eb.HttpBackend(f"http://{host}:{port}/")
+            completed, output = backend.run(judge_prompt(["it works"]), 1, 30)
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertTrue(completed)
+        self.assertTrue(rse.extract_json(output)["verdicts"][0]["pass"])
+
+    def test_http_backend_unreachable_fails_cleanly(self) -> None:
+        completed, output = eb.HttpBackend("http://127.0.0.1:9/").run("x", 1, 5)
+        self.assertFalse(completed)
+        self.assertIn("failed", output)
+
+
+class LiveStubEndToEndTest(unittest.TestCase):
+    def test_live_run_through_stub_backend(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_dir = build_skill(tmp)
+            buffer = io.StringIO()
+            with contextlib.redirect_stdout(buffer):
+                code = rse.main([str(skill_dir), "--live", "--backend", "stub", "--json"])
+            payload = json.loads(buffer.getvalue())
+        board = payload["scoreboard"]
+        self.assertTrue(board["scenarios"]["01-example.md"]["passed"])
+        # The keyword-overlap stub fires on the "release" near-miss: a real,
+        # deterministic precision failure, so the run exits 10.
+        self.assertEqual(board["triggers"]["false_positive"], 1)
+        self.assertEqual(code, 10)
+        self.assertEqual(board["backend"]["backend"], "stub")
+        # 1 scenario run + 1 judge + 4 trigger queries
+        self.assertEqual(board["backend"]["calls"], 6)
+        self.assertIsInstance(rse.get_backend(), eb.CliBackend)  # restored
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,7 +10,9 @@ from __future__ import annotations
 import json
 import sys
 import tempfile
+import time
 import unittest
+from datetime import datetime, timezone
 from pathlib import Path
 from unittest import mock
 
@@ -201,6 +203,36 @@ class BashClusteringTest(unittest.TestCase):
             covered = [c["pattern"] for c in data["covered_patterns"]]
             self.assertIn("ffmpeg", covered)
 
+    def test_coverage_index_agrees_with_linear_scan(self) -> None:
+        skills = [
+            {"name": "media-tools", "description": "Wraps ffmpeg and docker-compose up"},
+            {"name": "ffmpeg-encoder", "description": "Use when running ffmpeg encode jobs"},
+            {"name": "infra", "description": "terraform plan/apply, ./build.sh helpers"},
+            {"name": "mailer", "description": "Send e-mail digests"},
+        ]
+        index = msf.CoverageIndex(skills)
+        prefixes = ["ffmpeg", "ffmpeg encode", "docker-compose up", "docker compose",
+                    "terraform plan", "terraform apply", "./build.sh", "build",
+                    "mail", "e-mail", "-", "jq", "media", "FFmpeg"]
+        for prefix in prefixes:
+            with self.subTest(prefix=prefix):
+                self.assertEqual(index.covering(prefix), msf.covered_by_skill(prefix, skills))
+        stats = index.stats()
+        self.assertEqual(stats["patterns_checked"], len(prefixes))
+        self.assertLess(stats["regex_checks"], stats["linear_scan_checks"])
+
+    def test_coverage_stats_reported(self) -> None:
+        index = [{"name": "ffmpeg-encoder", "description": "Use when running ffmpeg"}]
+        with tempfile.TemporaryDirectory() as tmp:
+            projects = Path(tmp)
+            write_corpus(projects)
+            with mock.patch.object(msf, "load_skill_index", return_value=index):
+                data = run_mine(projects)
+        stats = data["coverage_stats"]
+        self.assertEqual(stats["skills"], 1)
+        self.assertGreater(stats["patterns_checked"], 0)
+        self.assertIn("Coverage check:", msf.format_report(data))
+
     def test_normalize_command(self) -> None:
         self.assertEqual(msf.normalize_command("cd /x && ffmpeg -i a b"), "ffmpeg")
         self.assertEqual(msf.normalize_command("FOO=1 terraform plan"),
@@ -222,6 +254,309 @@ class BashClusteringTest(unittest.TestCase):
             self.assertEqual(data["candidate_patterns"], [])  # one session only
 
 
+def write_corpus(projects: Path, sessions: int = 8) -> None:
+    """Mixed sessions: skills, corrections, repeated and trivial Bash."""
+    for i in range(sessions):
+        write_session(projects, f"proj-{i % 3}", f"s{i:02d}", [
+            assistant_tool_use("Skill", {"skill": f"skill-{i % 4}"}),
+            user_message("no, that's not it" if i % 3 == 0 else "great"),
+            assistant_tool_use("Bash", {"command": f"ffmpeg -i in{i}.mov out.mp4"}),
+            user_tool_result(),
+            assistant_tool_use("Bash", {"command": f"terraform plan -var n={i}"}),
+            assistant_tool_use("Bash", {"command": "ls -la"}),
+            assistant_tool_use("Bash", {"command": f"jq '.{i}' f.json"}),
+        ])
+
+
+class ParallelMiningTest(unittest.TestCase):
+    def test_jobs_output_identical_to_serial(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            projects = Path(tmp)
+            write_corpus(projects)
+            with mock.patch.object(msf, "load_skill_index", return_value=[]):
+                serial = run_mine(projects)
+                parallel = run_mine(projects, jobs=3)
+        for data in (serial, parallel):
+            data.pop("generated_at")
+            data["coverage_stats"].pop("seconds")
+        self.assertEqual(parallel, serial)
+        self.assertEqual(len(serial["abandoned"]), 3)
+        self.assertEqual(serial["transcripts_scanned"], 8)
+
+    def test_partials_fold_like_mine_session(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            projects = Path(tmp)
+            write_corpus(projects, sessions=3)
+            paths = sorted(projects.glob("*/*.jsonl"))
+            direct = msf.new_stats()
+            for path in paths:
+                msf.mine_session(path, direct)
+            folded = msf.new_stats()
+            for partial in msf.mine_partials(paths, jobs=2):
+                msf.merge_partial(folded, partial)
+        self.assertEqual(dict(folded["bash_clusters"]), dict(direct["bash_clusters"]))
+        self.assertEqual(dict(folded["invocations"]), dict(direct["invocations"]))
+
+    def test_zero_jobs_rejected(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp, mock.patch("sys.stderr"):
+            code = msf.main(["--consent", "--jobs", "0", "--projects-dir", tmp])
+        self.assertEqual(code, 2)
+
+
+class CheckpointTest(unittest.TestCase):
+    def _mine(self, projects: Path, checkpoints=None) -> dict:
+        with mock.patch.object(msf, "load_skill_index", return_value=[]):
+            data = run_mine(projects, checkpoint_path=checkpoints)
+        data.pop("generated_at")
+        data["coverage_stats"].pop("seconds")
+        return data
+
+    def _append(self, path: Path, *entries, raw: str = "") -> None:
+        with path.open("a", encoding="utf-8") as handle:
+            for entry in entries:
+                handle.write(json.dumps(entry) + "\n")
+            handle.write(raw)
+
+    def _same_as_full_scan(self, projects: Path, incremental: dict) -> None:
+        full = self._mine(projects)
+        incremental = dict(incremental, checkpoints=None)
+        self.assertEqual(incremental, full)
+
+    def test_appended_bytes_resume_pending_skill(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            projects, ckpt = Path(tmp) / "projects", Path(tmp) / "ckpt.json"
+            write_corpus(projects, sessions=3)
+            growing = write_session(projects, "proj-x", "live", [
+                assistant_tool_use("Bash", {"command": "ffmpeg -i a.mov b.mp4"}),
+                assistant_tool_use("Skill", {"skill": "video-encoder"}),
+            ])
+            first = self._mine(projects, ckpt)
+            self.assertEqual(first["checkpoints"], {"skipped": 0, "appended": 0, "parsed": 4})
+            # The correction lands after the checkpoint: the pending skill
+            # must survive the run boundary.
+            self._append(growing, user_message("no, stop"),
+                         assistant_tool_use("Bash", {"command": "ffmpeg -i c.mov d.mp4"}))
+            second = self._mine(projects, ckpt)
+            self.assertEqual(second["checkpoints"], {"skipped": 3, "appended": 1, "parsed": 0})
+            self.assertIn("video-encoder", [a["skill"] for a in second["abandoned"]])
+            self._same_as_full_scan(projects, second)
+
+    def test_untouched_transcripts_are_not_read(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            projects, ckpt = Path(tmp) / "projects", Path(tmp) / "ckpt.json"
+            write_corpus(projects, sessions=3)
+            first = self._mine(projects, ckpt)
+            with mock.patch.object(msf, "mine_partial",
+                                   side_effect=AssertionError("re-read")):
+                second = self._mine(projects, ckpt)
+        self.assertEqual(second["checkpoints"]["skipped"], 3)
+        self.assertEqual(dict(second, checkpoints=None), dict(first, checkpoints=None))
+
+    def test_rewritten_transcript_parsed_in_full(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            projects, ckpt = Path(tmp) / "projects", Path(tmp) / "ckpt.json"
+            path = write_session(projects, "proj-a", "s1", [
+                assistant_tool_use("Skill", {"skill": "old-skill"})])
+            self._mine(projects, ckpt)
+            path.write_text(json.dumps(assistant_tool_use("Skill", {"skill": "new-skill"}))
+                            + "\n" + "x" * 400 + "\n", encoding="utf-8")
+            data = self._mine(projects, ckpt)
+        self.assertEqual(data["checkpoints"]["parsed"], 1)
+        self.assertEqual(data["skill_invocations"], {"new-skill": 1})
+
+    def test_torn_last_line_is_reread_when_complete(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            projects, ckpt = Path(tmp) / "projects", Path(tmp) / "ckpt.json"
+            path = write_session(projects, "proj-a", "s1", [
+                assistant_tool_use("Skill", {"skill": "first"})])
+            line = json.dumps(assistant_tool_use("Skill", {"skill": "second"}))
+            self._append(path, raw=line[:20])
+            self.assertEqual(self._mine(projects, ckpt)["skill_invocations"], {"first": 1})
+            self._append(path, raw=line[20:] + "\n")
+            data = self._mine(projects, ckpt)
+        self.assertEqual(data["checkpoints"]["appended"], 1)
+        self.assertEqual(data["skill_invocations"], {"first": 1, "second": 1})
+
+    def test_cli_writes_checkpoints_beside_evidence(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            projects = Path(tmp) / "projects"
+            write_corpus(projects, sessions=2)
+            out = Path(tmp) / "evidence" / "friction.json"
+            with mock.patch("sys.stdout"):
+                msf.main(["--consent", "--projects-dir", str(projects), "--output", str(out)])
+            self.assertTrue((out.parent / "friction_checkpoints.json").exists())
+
+
+class PrefilterTest(unittest.TestCase):
+    def test_relevant_line_keeps_every_line_the_miner_uses(self) -> None:
+        keep = [assistant_tool_use("Skill", {"skill": "x"}),
+                assistant_tool_use("Bash", {"command": "ls"}),
+                user_message("no, stop"),
+                {"type": "user", "message": {"content": [
+                    {"type": "tool_result", "content": "ok"},
+                    {"type": "text", "text": "wrong file"}]}}]
+        drop = [assistant_tool_use("Read", {"file_path": "/a.py"}),
+                user_tool_result(),
+                {"type": "summary", "summary": "Bash and Skill notes"}]
+        for entry in keep:
+            self.assertTrue(msf.relevant_line(json.dumps(entry).encode()), entry)
+        for entry in drop:
+            self.assertFalse(msf.relevant_line(json.dumps(entry).encode()), entry)
+
+    def test_prefilter_does_not_change_partials(self) -> None:
+        big_result = {"type": "user", "message": {"content": [
+            {"type": "tool_result", "content": '"Skill" "Bash" no, stop\n' * 2000}]}}
+        with tempfile.TemporaryDirectory() as tmp:
+            projects = Path(tmp)
+            write_corpus(projects, sessions=4)
+            path = write_session(projects, "proj-big", "big", [
+                assistant_tool_use("Skill", {"skill": "pdf-tools"}),
+                big_result,
+                assistant_tool_use("Read", {"file_path": "/x.pdf"}),
+                user_message("that's wrong"),
+                assistant_tool_use("Bash", {"command": "qpdf --split a.pdf"}),
+            ])
+            paths = sorted(projects.glob("*/*.jsonl"))
+            filtered = [msf.mine_partial(p) for p in paths]
+            full = [msf.mine_partial(p, prefilter=False) for p in paths]
+            self.assertEqual(filtered, full)
+            self.assertEqual(msf.mine_partial(path)["offset"], path.stat().st_size)
+
+
+class BoundedAggregationTest(unittest.TestCase):
+    def test_hyperloglog_estimates_distinct_sessions(self) -> None:
+        small, large = msf.HyperLogLog(), msf.HyperLogLog()
+        for i in range(5):
+            small.add(f"s{i}")
+            small.add(f"s{i}")  # duplicates do not count
+        for i in range(5000):
+            large.add(f"session-{i}")
+        self.assertEqual(len(small), 5)
+        self.assertLess(abs(len(large) - 5000), 5000 * 0.2)
+        self.assertEqual(len(large.registers), 1 << msf.HLL_PRECISION)
+
+    def test_space_saving_keeps_heavy_hitters_with_upper_bounds(self) -> None:
+        table = msf.SpaceSaving(capacity=3)
+        stream = ["terraform plan"] * 50 + [f"tool{i}" for i in range(40)] + ["ffmpeg"] * 30
+        for prefix in stream:
+            table[prefix]["count"] += 1
+        self.assertEqual(len(table), 3)
+        clusters = dict(table.items())
+        self.assertEqual(clusters["terraform plan"]["count"], 50)
+        ffmpeg = clusters["ffmpeg"]
+        self.assertGreaterEqual(ffmpeg["count"], 30)
+        self.assertLessEqual(ffmpeg["count"] - ffmpeg["overcount"], 30)
+
+    def test_reservoir_is_bounded_and_deterministic(self) -> None:
+        first, second = msf.Reservoir(size=10), msf.Reservoir(size=10)
+        first.extend(range(1000))
+        second.extend(range(1000))
+        self.assertEqual(len(first), 10)
+        self.assertEqual(first.seen, 1000)
+        self.assertEqual(list(first), list(second))
+
+    def test_bounded_mine_matches_exact_when_under_capacity(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            projects = Path(tmp)
+            write_corpus(projects)
+            with mock.patch.object(msf, "load_skill_index", return_value=[]):
+                exact = run_mine(projects)
+                bounded = run_mine(projects, bounded=True)
+        self.assertEqual(bounded["candidate_patterns"], exact["candidate_patterns"])
+        self.assertEqual(bounded["abandoned"], exact["abandoned"])
+        self.assertIsNone(exact["bounded"])
+        self.assertEqual(bounded["bounded"]["abandoned_total"], 3)
+
+    def test_bounded_cli_writes_no_checkpoints(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            projects = Path(tmp) / "projects"
+            write_corpus(projects, sessions=2)
+            out = Path(tmp) / "evidence" / "friction.json"
+            with mock.patch("sys.stdout"):
+                code = msf.main(["--consent", "--bounded", "--projects-dir", str(projects),
+                                 "--output", str(out)])
+            self.assertEqual(code, 0)
+            self.assertTrue(out.exists())
+            self.assertFalse((out.parent / "friction_checkpoints.json").exists())
+            # mine() itself ignores a checkpoint path in bounded mode
+            with mock.patch.object(msf, "load_skill_index", return_value=[]):
+                data = run_mine(projects, bounded=True, checkpoint_path=Path(tmp) / "c.json")
+            self.assertIsNone(data["checkpoints"])
+            self.assertFalse((Path(tmp) / "c.json").exists())
+
+    def test_bounded_mine_evicts_beyond_capacity(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            projects = Path(tmp)
+            write_corpus(projects)
+            with mock.patch.object(msf, "load_skill_index", return_value=[]):
+                data = run_mine(projects, bounded=True, max_patterns=1)
+        self.assertEqual(data["bounded"]["patterns_tracked"], 1)
+        self.assertLessEqual(len(data["candidate_patterns"]), 1)
+
+    def test_bad_max_patterns_rejected(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp, mock.patch("sys.stderr"):
+            code = msf.main(["--consent", "--bounded", "--max-patterns", "0",
+                             "--projects-dir", tmp])
+        self.assertEqual(code, 2)
+
+
+def stamped(entry: dict, when: float) -> dict:
+    moment = datetime.fromtimestamp(when, tz=timezone.utc)
+    return dict(entry, timestamp=moment.strftime("%Y-%m-%dT%H:%M:%S.000Z"))
+
+
+class TimestampWindowTest(unittest.TestCase):
+    def _long_session(self, projects: Path, now: float) -> Path:
+        entries = []
+        for day in range(30, -1, -1):  # one skill + correction per day, oldest first
+            when = now - day * 86400
+            entries += [stamped(assistant_tool_use("Skill", {"skill": f"day-{day}"}), when),
+                        stamped(user_message("no, wrong"), when + 1),
+                        {"type": "summary", "summary": "unstamped"}]
+        return write_session(projects, "proj-a", "long", entries)
+
+    def test_seek_lands_after_last_old_entry(self) -> None:
+        now = time.time()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = self._long_session(Path(tmp), now)
+            self.assertEqual(msf.seek_to_time(path, now - 100 * 86400), 0)
+            offset = msf.seek_to_time(path, now - 2.5 * 86400)
+            data = path.read_bytes()
+            self.assertEqual(data[offset - 1:offset], b"\n")
+            first = json.loads(data[offset:].split(b"\n", 1)[0])
+            self.assertEqual(first["type"], "summary")  # unstamped line after day-3
+            tail = data[msf.seek_to_time(path, now + 86400):]
+            self.assertEqual(json.loads(tail), {"type": "summary", "summary": "unstamped"})
+
+    def test_seek_matches_filtered_full_scan(self) -> None:
+        now = time.time()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = self._long_session(Path(tmp), now)
+            for days in (0.5, 1.5, 7, 29.5, 60):
+                since = now - days * 86400
+                with self.subTest(days=days):
+                    windowed = msf.mine_since(path, since)
+                    full = msf.mine_partial(path, since=since)
+                    self.assertEqual(windowed, full)
+            self.assertEqual(msf.mine_since(path, now - 1.5 * 86400)["invocations"],
+                             {"day-1": 1, "day-0": 1})
+
+    def test_by_timestamp_drops_old_entries_of_live_session(self) -> None:
+        now = time.time()
+        with tempfile.TemporaryDirectory() as tmp:
+            projects = Path(tmp)
+            self._long_session(projects, now)
+            with mock.patch.object(msf, "load_skill_index", return_value=[]):
+                mtime = run_mine(projects, days=2)
+                entries = run_mine(projects, days=2, by_timestamp=True,
+                                   checkpoint_path=Path(tmp) / "unused.json")
+        self.assertEqual(len(mtime["skill_invocations"]), 31)
+        self.assertEqual(set(entries["skill_invocations"]), {"day-0", "day-1"})
+        self.assertEqual(entries["window"], "entry timestamps")
+        self.assertIsNone(entries["checkpoints"])
+        self.assertFalse((Path(tmp) / "unused.json").exists())
+
+
 class RedactionTest(unittest.TestCase):
     def test_key_value_secrets_redacted(self) -> None:
         redacted = msf.redact("export API_KEY=sk_live_abcdef123456 && run")
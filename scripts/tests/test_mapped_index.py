@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests for mapped_index.py - sidecar round-trips, staleness and corruption
+fallback, and that triage reads the same roster from the sidecar as from
+the JSON.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1]
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import mapped_index  # noqa: E402
+from common import Result  # noqa: E402
+from discover_skills import save_index  # noqa: E402
+from mapped_index import MappedIndex, mapped_path, open_mapped_index, write_mapped_index  # noqa: E402
+from triage_skill_request import load_skills, triage_request  # noqa: E402
+
+SKILLS = [
+    {"name": "code-review", "source": "user", "path": "/s/code-review/SKILL.md", "priority": 1,
+     "description": "Use when running a code review or pr review.",
+     "triggers": ["code review"], "keywords": ["code", "review"], "domains": ["code_quality"],
+     "version": "1.0.0", "facts": {"model": None, "refs": []}},
+    {"name": "pdf-tools", "source": "user", "path": "/s/pdf-tools/SKILL.md", "priority": 2,
+     "description": "Merge and split pdf documents. Ünïcode ok.", "triggers": [],
+     "keywords": ["pdf"], "domains": ["pdf", "document"], "version": "2.1.0",
+     "custom": {"nested": [1, 2]}},
+    {"name": "bare"},
+]
+
+
+def write_json_index(tmp: Path, skills=SKILLS) -> Path:
+    path = tmp / "skill_index.json"
+    path.write_text(json.dumps({"version": "2.0.0", "skills": skills}), encoding="utf-8")
+    return path
+
+
+class RoundTripTest(unittest.TestCase):
+    def test_records_read_back_identically(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            index_path = write_json_index(Path(tmp))
+            write_mapped_index(SKILLS, index_path)
+            mapped = open_mapped_index(index_path)
+            self.assertIsInstance(mapped, MappedIndex)
+            self.assertEqual([dict(skill) for skill in mapped], SKILLS)
+            self.assertEqual(mapped[-1]["name"], "bare")
+            self.assertEqual([s["name"] for s in mapped[:2]], ["code-review", "pdf-tools"])
+            self.assertIsNone(mapped[2].get("description"))
+            self.assertNotIn("custom", mapped[0])
+            self.assertEqual(mapped[1]["custom"], {"nested": [1, 2]})
+            with self.assertRaises(IndexError):
+                mapped[3]
+
+    def test_repeated_strings_are_pooled_once(self) -> None:
+        twins = [dict(SKILLS[0], name=f"copy-{i}") for i in range(50)]
+        with tempfile.TemporaryDirectory() as tmp:
+            index_path = write_json_index(Path(tmp), twins)
+            data = write_mapped_index(twins, index_path).read_bytes()
+        self.assertEqual(data.count(SKILLS[0]["description"].encode("utf-8")), 1)
+        self.assertEqual(data.count(b"copy-49"), 1)
+
+
+class FallbackTest(unittest.TestCase):
+    def test_stale_sidecar_is_ignored(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            index_path = write_json_index(Path(tmp))
+            write_mapped_index(SKILLS, index_path)
+            write_json_index(Path(tmp), SKILLS[:1])
+            stat = index_path.stat()
+            os.utime(index_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            self.assertIsNone(open_mapped_index(index_path))
+            skills = load_skills(index_path)
+        self.assertIsInstance(skills, list)
+        self.assertEqual([s["name"] for s in skills], ["code-review"])
+
+    def test_corrupt_or_missing_sidecar_is_ignored(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            index_path = write_json_index(Path(tmp))
+            self.assertIsNone(open_mapped_index(index_path))
+            mapped_path(index_path).write_bytes(b"")
+            self.assertIsNone(open_mapped_index(index_path))
+            mapped_path(index_path).write_bytes(b"NOTINDEX" + bytes(64))
+            self.assertIsNone(open_mapped_index(index_path))
+            self.assertEqual(len(load_skills(index_path)), len(SKILLS))
+            self.assertIsNone(load_skills(Path(tmp) / "missing.json"))
+
+
+class SaveIndexTest(unittest.TestCase):
+    def test_save_index_writes_sidecar_triage_reads_it(self) -> None:
+        result = Result(True, "", {"skills": SKILLS[:2], "domains": {}, "sources": {},
+                                   "total_count": 2})
+        query = "do I have a skill for code review?"
+        with tempfile.TemporaryDirectory() as tmp:
+            index_path = Path(tmp) / "skill_index.json"
+            save_index(result, index_path)
+            self.assertIsInstance(load_skills(index_path), MappedIndex)
+            mapped = triage_request(query, index_path=index_path).data
+            mapped_path(index_path).unlink()
+            self.assertIsInstance(load_skills(index_path), list)
+            parsed = triage_request(query, index_path=index_path).data
+        # Records hand out tuples where the sidecar decodes lists; the JSON
+        # triage emits is identical.
+        self.assertEqual(json.dumps(mapped, sort_keys=True), json.dumps(parsed, sort_keys=True))
+        self.assertEqual(mapped["top_matches"][0]["name"], "code-review")
+
+    def test_cli_rebuilds_sidecar(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            index_path = write_json_index(Path(tmp))
+            with mock.patch("sys.stdout"):
+                code = mapped_index.main(["--index", str(index_path), "--json"])
+            self.assertEqual(code, 0)
+            self.assertIsNotNone(open_mapped_index(index_path))
+            with mock.patch("sys.stderr"):
+                self.assertEqual(mapped_index.main(["--index", str(Path(tmp) / "no.json")]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Tests for replay_triage.py - corpus loading, accuracy and confusion scoring
+against a frozen snapshot, and baseline save/compare exit codes.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1]
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+TESTS_DIR = Path(__file__).resolve().parent
+if str(TESTS_DIR) not in sys.path:
+    sys.path.insert(0, str(TESTS_DIR))
+
+import replay_triage as rt  # noqa: E402
+from test_triage import skill, write_index  # noqa: E402
+
+SKILLS = [
+    skill("code-review", "Use when running a code review or pr review.",
+          ["code_quality"], keywords=["code", "review"], triggers=["code review"]),
+    skill("pdf-tools", "Merge and split pdf documents.", ["documents"]),
+]
+CASES = [
+    {"query": "do I have a skill for code review?", "expected_action": "USE_EXISTING",
+     "expected_skill": "code-review"},
+    {"query": "create a skill for baking bread", "expected_action": "CREATE_NEW",
+     "expected_skill": None},
+    {"query": "bake bread", "expected_action": "USE_EXISTING"},  # deliberately wrong
+    {"query": "unlabeled query"},
+]
+
+
+def write_corpus(tmp: Path, cases=CASES) -> Path:
+    path = tmp / "corpus.jsonl"
+    path.write_text("\n".join(json.dumps(c) for c in cases) + "\n\n", encoding="utf-8")
+    return path
+
+
+def run_main(argv) -> tuple:
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer), mock.patch("sys.stderr"):
+        code = rt.main(argv)
+    return code, buffer.getvalue()
+
+
+class ReplayScoringTest(unittest.TestCase):
+    def test_accuracy_confusion_and_mistakes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            index = write_index(Path(tmp), SKILLS)
+            cases = rt.load_corpus(write_corpus(Path(tmp)))
+            report = rt.replay(cases, index, repeat=2)
+        self.assertEqual(report["queries"], 4)
+        self.assertEqual(report["labeled_actions"], 3)
+        self.assertEqual(report["action_accuracy"], round(2 / 3, 4))
+        self.assertEqual(report["skill_accuracy"], 1.0)
+        self.assertEqual(report["confusion"]["CREATE_NEW"], {"CREATE_NEW": 1})
+        self.assertEqual([m["id"] for m in report["mistakes"]], ["line-3"])
+        self.assertTrue(report["stable"])
+        self.assertGreater(report["queries_per_second"], 0)
+
+    def test_missing_snapshot_returns_none(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertIsNone(rt.replay([{"id": "x", "query": "q"}], Path(tmp) / "no.json"))
+
+    def test_malformed_corpus_line_rejected(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "bad.jsonl"
+            path.write_text('{"query": "ok"}\n{"nope": 1}\n', encoding="utf-8")
+            with self.assertRaises(ValueError):
+                rt.load_corpus(path)
+
+
+class BaselineTest(unittest.TestCase):
+    def test_save_then_compare_passes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            index = write_index(Path(tmp), SKILLS)
+            corpus = write_corpus(Path(tmp))
+            baseline = Path(tmp) / "baseline.json"
+            argv = [str(corpus), "--index", str(index), "--baseline", str(baseline),
+                    "--repeat", "1", "--speed-tolerance", "1.0"]
+            self.assertEqual(run_main(argv + ["--save-baseline"])[0], 0)
+            stored = json.loads(baseline.read_text())
+            code, out = run_main(argv + ["--json"])
+        self.assertEqual(stored["version"], rt.BASELINE_VERSION)
+        self.assertEqual(code, 0)
+        self.assertEqual(json.loads(out)["baseline"]["regressions"], [])
+
+    def test_accuracy_drop_fails_with_10(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            index = write_index(Path(tmp), SKILLS)
+            corpus = write_corpus(Path(tmp))
+            baseline = Path(tmp) / "baseline.json"
+            baseline.write_text(json.dumps({
+                "version": 1, "corpus_digest": rt.file_digest(corpus),
+                "index_digest": "stale", "action_accuracy": 1.0,
+                "skill_accuracy": 1.0, "queries_per_second": 1.0,
+            }))
+            code, out = run_main([str(corpus), "--index", str(index), "--baseline",
+                                  str(baseline), "--repeat", "1"])
+        self.assertEqual(code, 10)
+        self.assertIn("action_accuracy fell", out)
+        self.assertIn("index changed", out)
+
+    def test_throughput_regression_detected(self) -> None:
+        report = {"action_accuracy": 1.0, "skill_accuracy": None, "queries_per_second": 50.0}
+        current = {"corpus_digest": "a", "index_digest": "b"}
+        baseline = dict(current, action_accuracy=1.0, queries_per_second=100.0)
+        verdict = rt.compare_to_baseline(report, baseline, current, speed_tolerance=0.3)
+        self.assertEqual(len(verdict["regressions"]), 1)
+        self.assertIn("throughput", verdict["regressions"][0])
+        self.assertEqual(rt.compare_to_baseline(report, baseline, current,
+                                                speed_tolerance=0.6)["regressions"], [])
+
+    def test_freeze_copies_live_index(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            live = write_index(Path(tmp), SKILLS)
+            snapshot = Path(tmp) / "snap" / "index.json"
+            with mock.patch.object(rt, "get_index_path", return_value=live):
+                code, _out = run_main(["--freeze", str(snapshot)])
+            self.assertEqual(code, 0)
+            self.assertEqual(snapshot.read_bytes(), live.read_bytes())
+
+    def test_missing_index_exits_2(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            corpus = write_corpus(Path(tmp))
+            code, _out = run_main([str(corpus), "--index", str(Path(tmp) / "none.json")])
+        self.assertEqual(code, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
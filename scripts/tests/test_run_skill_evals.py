@@ -7,11 +7,14 @@ codes.
 
 from __future__ import annotations
 
+import contextlib
+import io
 import json
 import sys
 import tempfile
 import unittest
 from pathlib import Path
+from typing import Dict
 from unittest import mock
 
 SCRIPTS_DIR = Path(__file__).resolve().parents[1]
@@ -19,6 +22,7 @@ if str(SCRIPTS_DIR) not in sys.path:
     sys.path.insert(0, str(SCRIPTS_DIR))
 
 import run_skill_evals as rse  # noqa: E402
+import triage_skill_request as triage  # noqa: E402
 
 
 GOOD_SKILL_MD = """---
@@ -381,5 +385,250 @@ class JsonOutputTest(unittest.TestCase):
             self.assertIn("target", payload["checks"][0])
 
 
+class StreamingResultsTest(unittest.TestCase):
+    VERDICTS = [
+        {"assertion": "Output includes a rollout health check: status must be quoted",
+         "pass": True, "evidence": "quoted status"},
+        {"assertion": "Output does not declare success without evidence",
+         "pass": True, "evidence": "evidence shown"},
+    ]
+    TRIGGERED = {
+        "verify the deploy went out": True,
+        "check rollout health for the api": True,
+        "why did my release fail to deploy": True,
+        "write a blog post about our release process": False,
+    }
+
+    def _main(self, argv, fake):
+        with mock.patch.object(rse, "claude_available", return_value=True), \
+             mock.patch.object(rse, "invoke_claude", side_effect=fake), \
+             mock.patch("sys.stdout"):
+            return rse.main(argv)
+
+    def test_results_file_streams_checks_and_units(self) -> None:
+        fake = fake_claude_factory("agent output", self.VERDICTS, self.TRIGGERED)
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_dir = build_skill(tmp)
+            results = Path(tmp) / "runs.jsonl"
+            code = self._main([str(skill_dir), "--live", "--json",
+                               "--results", str(results)], fake)
+            records = [json.loads(line) for line in
+                       results.read_text(encoding="utf-8").splitlines()]
+            report = rse.report_from_stream(results)
+        self.assertEqual(code, 0)
+        self.assertEqual(records[0]["type"], "start")
+        units = [r for r in records if r["type"] == "unit"]
+        self.assertEqual(len(units), 5)  # 1 scenario run + 4 trigger queries
+        self.assertTrue(report.passed)
+        self.assertEqual(report.scoreboard["triggers"]["recall"], 1.0)
+        self.assertTrue(report.scoreboard["scenarios"]["01-example.md"]["passed"])
+
+    def test_resume_skips_finished_runs(self) -> None:
+        calls = []
+        good = fake_claude_factory("agent output", self.VERDICTS, self.TRIGGERED)
+
+        def dies_at_triggers(prompt, max_turns, timeout):
+            if "deciding whether to load a skill" in prompt:
+                raise KeyboardInterrupt("killed mid-run")
+            return good(prompt, max_turns, timeout)
+
+        def counting(prompt, max_turns, timeout):
+            calls.append(prompt)
+            return good(prompt, max_turns, timeout)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_dir = build_skill(tmp)
+            results = Path(tmp) / "runs.jsonl"
+            argv = [str(skill_dir), "--live", "--json", "--results", str(results)]
+            with self.assertRaises(KeyboardInterrupt):
+                self._main(argv, dies_at_triggers)
+            with results.open("a", encoding="utf-8") as handle:
+                handle.write('{"type": "check", "unit": "trunc')  # torn last line
+            code = self._main(argv + ["--resume"], counting)
+            report = rse.report_from_stream(results)
+        self.assertEqual(code, 0)
+        # Only the four trigger queries ran again; scenario + judge were reused.
+        self.assertEqual(len(calls), 4)
+        self.assertTrue(all("deciding whether to load a skill" in c for c in calls))
+        self.assertEqual(report.scoreboard["triggers"]["positives"], 3)
+        self.assertEqual(len(report.scoreboard["scenarios"]["01-example.md"]["runs"]), 1)
+
+    def test_resume_after_torn_tail_keeps_one_set_of_static_checks(self) -> None:
+        fake = fake_claude_factory("agent output", self.VERDICTS, self.TRIGGERED)
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_dir = build_skill(tmp)
+            results = Path(tmp) / "runs.jsonl"
+            argv = [str(skill_dir), "--live", "--json", "--results", str(results)]
+            self._main(argv, fake)
+            expected = len(rse.load_stream(results)["static"])
+            for _ in range(2):
+                with results.open("a", encoding="utf-8") as handle:
+                    handle.write('{"type": "check", "unit": "stat')  # killed mid-write
+                self.assertEqual(self._main(argv + ["--resume"], fake), 0)
+            lines = results.read_text(encoding="utf-8").splitlines()
+            state = rse.load_stream(results)
+        self.assertGreater(expected, 0)
+        self.assertTrue(all(json.loads(line) for line in lines))
+        self.assertEqual(len(state["static"]), expected)
+        self.assertTrue(state["header"]["resume"])
+
+    def test_fresh_run_truncates_previous_results(self) -> None:
+        fake = fake_claude_factory("agent output", self.VERDICTS, self.TRIGGERED)
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_dir = build_skill(tmp)
+            results = Path(tmp) / "runs.jsonl"
+            argv = [str(skill_dir), "--live", "--json", "--results", str(results)]
+            self._main(argv, fake)
+            self._main(argv, fake)
+            starts = [line for line in results.read_text(encoding="utf-8").splitlines()
+                      if '"type": "start"' in line]
+        self.assertEqual(len(starts), 1)
+
+    def test_resume_rejects_other_skills_results(self) -> None:
+        fake = fake_claude_factory("agent output", self.VERDICTS, self.TRIGGERED)
+        with tempfile.TemporaryDirectory() as tmp, tempfile.TemporaryDirectory() as other:
+            results = Path(tmp) / "runs.jsonl"
+            self._main([str(build_skill(tmp)), "--static", "--json",
+                        "--results", str(results)], fake)
+            code = self._main([str(build_skill(other)), "--static", "--json",
+                               "--results", str(results), "--resume"], fake)
+        self.assertEqual(code, 2)
+
+    def test_resume_requires_results(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_dir = build_skill(tmp)
+            with self.assertRaises(SystemExit), mock.patch("sys.stderr"):
+                rse.main([str(skill_dir), "--resume"])
+
+
+class RosterTest(unittest.TestCase):
+    def _roster(self, tmp: str) -> Path:
+        """Index with a passing skill, a broken skill, and one without evals/."""
+        root = Path(tmp)
+        good = build_skill(str(root / "a"))
+        broken = build_skill(str(root / "b"), triggers=None)
+        bare = root / "c" / "no-evals"
+        bare.mkdir(parents=True)
+        (bare / "SKILL.md").write_text(GOOD_SKILL_MD, encoding="utf-8")
+        index = {"skills": [{"name": f"s{i}", "path": str(d / "SKILL.md")}
+                            for i, d in enumerate((good, broken, bare))]}
+        index_path = root / "index.json"
+        index_path.write_text(json.dumps(index), encoding="utf-8")
+        return index_path
+
+    def _run(self, argv):
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            code = rse.main(argv)
+        return code, json.loads(buffer.getvalue())
+
+    def test_roster_skips_skills_without_evals(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            index_path = self._roster(tmp)
+            dirs = rse.roster_skill_dirs(json.loads(index_path.read_text()))
+        self.assertEqual(len(dirs), 2)
+
+    def test_static_roster_in_process_pool(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            index_path = self._roster(tmp)
+            code, data = self._run(["--roster", "--index", str(index_path),
+                                    "--jobs", "2", "--json"])
+        self.assertEqual(code, 10)
+        self.assertEqual(data["skill_count"], 2)
+        self.assertEqual(data["failed_count"], 1)
+        self.assertEqual([s["passed"] for s in data["skills"]], [True, False])
+        self.assertIn("static_seconds", data["skills"][0])
+
+    def test_live_roster_runs_only_statically_clean_skills(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            index_path = self._roster(tmp)
+            _code, data = self._run(["--roster", "--index", str(index_path), "--live",
+                                     "--backend", "stub", "--jobs", "1",
+                                     "--concurrency", "2", "--json"])
+        # 1 scenario run + 1 judge + 4 trigger queries, for the clean skill only
+        self.assertEqual(data["backend"]["calls"], 6)
+        self.assertIn("scenarios", data["skills"][0]["report"]["scoreboard"])
+        self.assertEqual(data["skills"][1]["report"]["scoreboard"], {})
+
+    def test_spent_budget_skips_live_runs_and_fails(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            index_path = self._roster(tmp)
+            code, data = self._run(["--roster", "--index", str(index_path), "--live",
+                                    "--backend", "stub", "--jobs", "1",
+                                    "--budget", "0", "--json"])
+        self.assertEqual(code, 10)
+        self.assertTrue(data["budget_exhausted"])
+        self.assertTrue(data["skills"][0]["live_skipped"])
+        self.assertEqual(data["backend"]["calls"], 0)
+
+    def test_deadline_backend_refuses_calls_after_deadline(self) -> None:
+        from eval_backends import StubBackend
+        runner = rse.DeadlineBackend(StubBackend(), deadline=0.0)
+        self.assertEqual(runner.run("task", 1, 5), (False, rse.BUDGET_EXHAUSTED))
+
+    def test_missing_index_exits_1(self) -> None:
+        with mock.patch("sys.stderr"):
+            code = rse.main(["--roster", "--index", "/nonexistent/index.json"])
+        self.assertEqual(code, 1)
+
+
+class TriggerConfusionTest(unittest.TestCase):
+    def _index(self, tmp: str) -> Dict:
+        """deploy-checker ships triggers; rollout-monitor only competes for them."""
+        skill_dir = build_skill(tmp)
+        return {"skills": [
+            {"name": "deploy-checker", "path": str(skill_dir / "SKILL.md"),
+             "description": "Use when verifying a deploy or debugging a failed release.",
+             "keywords": ["deploy", "release"], "triggers": ["verify the deploy"],
+             "domains": ["devops"]},
+            {"name": "rollout-monitor", "path": str(Path(tmp) / "elsewhere" / "SKILL.md"),
+             "description": "Use when checking rollout health.",
+             "keywords": ["rollout", "health"], "triggers": ["check rollout health"],
+             "domains": ["devops"]},
+        ]}
+
+    def test_matrix_records_collision_with_rival_skill(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            data = rse.trigger_confusion(self._index(tmp))
+        self.assertEqual(data["skills_with_triggers"], 1)
+        self.assertEqual(data["queries"], 4)  # 2 positive + 1 holdout + 1 near-miss
+        row = data["matrix"]["deploy-checker"]
+        self.assertEqual(row.get("rollout-monitor"), 1)
+        self.assertEqual(data["collisions"],
+                         [{"owner": "deploy-checker", "routed": "rollout-monitor", "count": 1}])
+        self.assertFalse(data["passed"])
+
+    def test_routing_prepares_each_skill_once(self) -> None:
+        queries = ["verify the deploy", "check rollout health", "write a poem"]
+        with tempfile.TemporaryDirectory() as tmp:
+            skills = self._index(tmp)["skills"]
+            expected = []
+            for query in queries:
+                matches = triage.find_matching_skills(
+                    query, skills, limit=1, signals=triage.classify_input(query)[1])
+                ok = matches and matches[0]["score"] >= rse.WEAK_MATCH_THRESHOLD
+                expected.append(matches[0]["name"] if ok else rse.NO_ROUTE)
+            with mock.patch.object(triage, "skill_features",
+                                   wraps=triage.skill_features) as prepared:
+                routes = rse.route_queries(queries, skills)
+        self.assertEqual(routes, expected)
+        self.assertEqual(prepared.call_count, len(skills))
+
+    def test_cli_exits_10_on_misroutes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            index_path = Path(tmp) / "index.json"
+            index_path.write_text(json.dumps(self._index(tmp)), encoding="utf-8")
+            buffer = io.StringIO()
+            with contextlib.redirect_stdout(buffer):
+                code = rse.main(["--roster", "--confusion", "--index", str(index_path)])
+        self.assertEqual(code, 10)
+        self.assertIn("deploy-checker -> rollout-monitor", buffer.getvalue())
+
+    def test_confusion_requires_roster(self) -> None:
+        with mock.patch("sys.stderr"), self.assertRaises(SystemExit) as ctx:
+            rse.main(["some-dir", "--confusion"])
+        self.assertEqual(ctx.exception.code, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for similarity.py - TF-IDF weighting, batched top-k against a
+brute-force cosine, the NumPy and stdlib paths agreeing, and the triage
+CREATE_NEW hook that lists the closest existing descriptions.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1]
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import similarity  # noqa: E402
+from similarity import SimilarityIndex  # noqa: E402
+from triage_skill_request import triage_request  # noqa: E402
+
+VOCAB = ["pdf", "docx", "merge", "split", "deploy", "rollout", "schema", "query",
+         "index", "cache", "widget", "render", "audit", "lint", "review", "token"]
+
+
+def random_roster(count: int, seed: int):
+    rng = random.Random(seed)
+    return [{"name": f"skill-{i:03d}",
+             "description": " ".join(rng.choice(VOCAB) for _ in range(rng.randint(2, 9)))}
+            for i in range(count)]
+
+
+def brute_force(engine: SimilarityIndex, k: int):
+    """Dense cosine over every pair, straight from the stored rows."""
+    dense = [dict(zip(*row)) for row in engine.rows]
+    result = {}
+    for i, row in enumerate(dense):
+        scored = []
+        for j, other in enumerate(dense):
+            if i == j:
+                continue
+            score = sum(w * other.get(c, 0.0) for c, w in row.items())
+            if score > 0:
+                scored.append((-round(score, 4), engine.names[j]))
+        result[engine.names[i]] = [(name, -neg) for neg, name in sorted(scored)[:k]]
+    return result
+
+
+class WeightingTest(unittest.TestCase):
+    def test_rows_are_unit_length(self) -> None:
+        engine = SimilarityIndex.from_skills(random_roster(20, 1))
+        for _cols, weights in engine.rows:
+            self.assertAlmostEqual(math.sqrt(sum(w * w for w in weights)), 1.0)
+
+    def test_rare_shared_words_outweigh_common_ones(self) -> None:
+        engine = SimilarityIndex(
+            ["a", "b", "c", "d"],
+            ["pdf merge", "pdf split", "docx merge", "pdf lint"])
+        # "merge" is in 2 rows, "pdf" in 3: the merge pair ranks first for a.
+        self.assertEqual(engine.top_k_all(k=1)["a"][0][0], "c")
+
+    def test_query_ignores_unknown_terms(self) -> None:
+        engine = SimilarityIndex(["pdf-tool"], ["merge pdf files"])
+        self.assertEqual(engine.query("sourdough bread"), [])
+        self.assertEqual(engine.query("merge pdf please")[0][0], "pdf-tool")
+
+
+class BatchedTopKTest(unittest.TestCase):
+    def test_stdlib_matches_brute_force(self) -> None:
+        engine = SimilarityIndex.from_skills(random_roster(40, 7))
+        with mock.patch.object(similarity, "np", None):
+            batched = engine.top_k_all(k=3)
+        expected = brute_force(engine, 3)
+        for name in engine.names:
+            self.assertEqual([n for n, _ in batched[name]], [n for n, _ in expected[name]])
+
+    @unittest.skipIf(similarity.np is None, "NumPy not installed")
+    def test_numpy_matches_stdlib(self) -> None:
+        engine = SimilarityIndex.from_skills(random_roster(300, 3))
+        dense = engine.top_k_all(k=4)
+        with mock.patch.object(similarity, "np", None):
+            sparse = engine.top_k_all(k=4)
+        self.assertEqual(dense, sparse)
+
+    def test_min_score_filters_neighbours(self) -> None:
+        engine = SimilarityIndex.from_skills(random_roster(30, 5))
+        for neighbours in engine.top_k_all(k=5, min_score=0.5).values():
+            self.assertTrue(all(score > 0.5 for _name, score in neighbours))
+
+
+class TriageSimilarSkillsTest(unittest.TestCase):
+    def test_create_new_lists_closest_descriptions(self) -> None:
+        skills = [
+            {"name": "sheet-tidy", "source": "t", "path": "/s/SKILL.md",
+             "description": "Use when cleaning messy quarterly ledger exports.",
+             "keywords": ["sheet", "tidy"], "domains": [], "triggers": []},
+            {"name": "bread", "source": "t", "path": "/b/SKILL.md",
+             "description": "Use when baking sourdough.",
+             "keywords": ["bread"], "domains": [], "triggers": []},
+        ]
+        with tempfile.TemporaryDirectory(prefix="skillforge-test-") as tmp:
+            index_path = Path(tmp) / "index.json"
+            index_path.write_text(json.dumps({"skills": skills}), encoding="utf-8")
+            result = triage_request("create a skill for reconciling quarterly ledger exports",
+                                    index_path=index_path)
+        self.assertEqual(result.data["action"], "CREATE_NEW")
+        similar = result.data["details"]["similar_skills"]
+        self.assertEqual([s["name"] for s in similar], ["sheet-tidy"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for skill_record.py - SkillRecord as a read-only mapping over an index
+entry, interning and tuple sharing, and that scoring treats records exactly
+like the dicts they came from.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import unittest
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1]
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import advisor_scoring  # noqa: E402
+from common import DOMAIN_MATCHER  # noqa: E402
+from skill_record import SkillRecord, measure, skill_records, synthetic_index  # noqa: E402
+from triage_skill_request import description_domain_terms, find_matching_skills  # noqa: E402
+
+ENTRY = {
+    "name": "code-review", "source": "user", "path": "/s/code-review/SKILL.md", "priority": 1,
+    "description": "Use when running a code review or pr review.",
+    "triggers": ["code review"], "keywords": ["code", "review"], "domains": ["code_quality"],
+    "version": "1.0.0", "facts": {"model": None, "refs": ["references/a.md"]},
+}
+
+
+def parsed(entry=ENTRY) -> dict:
+    """A fresh copy, as json.loads would produce for each index read."""
+    return json.loads(json.dumps(entry))
+
+
+class SkillRecordMappingTest(unittest.TestCase):
+    def test_reads_like_the_entry(self) -> None:
+        record = SkillRecord(parsed())
+        self.assertEqual(json.loads(json.dumps(dict(record))), ENTRY)
+        self.assertEqual(set(record), set(ENTRY))
+        self.assertEqual(len(record), len(ENTRY))
+        self.assertEqual(record["facts"]["refs"], ("references/a.md",))
+        self.assertEqual(record.get("missing", []), [])
+        self.assertNotIn("missing", record)
+
+    def test_absent_fields_are_absent(self) -> None:
+        record = SkillRecord({"name": "bare"})
+        self.assertEqual(dict(record), {"name": "bare"})
+        self.assertEqual(record.get("keywords", []), [])
+        with self.assertRaises(KeyError):
+            record["description"]
+
+    def test_slotted_and_interned(self) -> None:
+        first, second = skill_records([parsed(), parsed(), "not-a-dict"])
+        self.assertFalse(hasattr(first, "__dict__"))
+        self.assertIsInstance(first.keywords, tuple)
+        self.assertIs(first.domains[0], second.domains[0])
+        self.assertIs(first.source, second.source)
+        self.assertIs(first["facts"]["refs"][0], second["facts"]["refs"][0])
+
+
+class RecordScoringTest(unittest.TestCase):
+    def test_matches_share_record_tuples(self) -> None:
+        record = SkillRecord(parsed())
+        match = find_matching_skills("run a code review", [record])[0]
+        self.assertIs(match["keywords"], record.keywords)
+        self.assertIs(match["domains"], record.domains)
+        self.assertEqual(json.dumps(match),
+                         json.dumps(find_matching_skills("run a code review", [parsed()])[0]))
+
+    def test_persisted_tuple_terms_are_honoured(self) -> None:
+        entry = parsed()
+        advisor_scoring.annotate_advisor_terms([entry])
+        entry["domain_terms"] = {"signature": "x", "description": []}
+        record = SkillRecord(entry)
+        self.assertEqual(advisor_scoring.skill_terms(record), advisor_scoring.skill_terms(entry))
+        self.assertEqual(description_domain_terms(record), description_domain_terms(entry))
+
+
+class MeasureTest(unittest.TestCase):
+    def test_synthetic_terms_carry_the_live_signature(self) -> None:
+        entry = json.loads(synthetic_index(3))["skills"][0]
+        self.assertEqual(entry["domain_terms"]["signature"], DOMAIN_MATCHER.signature)
+        self.assertEqual(description_domain_terms(entry),
+                         set(entry["domain_terms"]["description"]))
+
+    def test_records_are_smaller(self) -> None:
+        result = measure(200)
+        self.assertEqual(result["skills"], 200)
+        self.assertLess(result["record_bytes"], result["dict_bytes"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,24 +7,34 @@ full index (not the capped top-5 match list).
 
 from __future__ import annotations
 
+import ast
+import io
 import json
+import re
 import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 SCRIPTS_DIR = Path(__file__).resolve().parents[1]
 if str(SCRIPTS_DIR) not in sys.path:
     sys.path.insert(0, str(SCRIPTS_DIR))
 
 from _constants import score_band  # noqa: E402
-from common import phrase_in_text  # noqa: E402
+from common import DOMAIN_MATCHER, phrase_in_text  # noqa: E402
+import triage_skill_request  # noqa: E402
 from triage_skill_request import (  # noqa: E402
     Action,
+    InputCategory,
     calculate_match_score,
+    classify_input,
     find_matching_skills,
+    find_matching_skills_many,
     make_triage_decision,
     resolve_skill_by_name,
+    run_batch,
+    triage_many,
     triage_request,
 )
 
@@ -109,6 +119,177 @@ class DedupeRecommendationsTest(unittest.TestCase):
         self.assertEqual(len(names), len(set(names)), names)
 
 
+def classify_sequential(query: str):
+    """Reference walk: one re.search per *_PATTERNS entry, in priority order."""
+    query_lower = query.lower()
+    signals = {
+        "has_skill_mention": "skill" in query_lower,
+        "has_error": False,
+        "has_code": False,
+        "has_url": False,
+        "mentioned_skill_name": None,
+        "extracted_purpose": None,
+    }
+    if any(re.search(p, query_lower) for p in triage_skill_request.EXPLICIT_CREATE_PATTERNS):
+        purpose = re.search(r'skill\s+(?:for|to)\s+(.+?)(?:\.|$)', query_lower)
+        if purpose:
+            signals["extracted_purpose"] = purpose.group(1).strip()
+        return InputCategory.EXPLICIT_CREATE, signals
+    if any(re.search(p, query_lower) for p in triage_skill_request.EXPLICIT_IMPROVE_PATTERNS):
+        name = re.search(r'(?:improve|enhance|update|fix)\s+(?:the\s+)?(\w+(?:-\w+)*)\s+skill',
+                         query_lower)
+        if name:
+            signals["mentioned_skill_name"] = name.group(1)
+        return InputCategory.EXPLICIT_IMPROVE, signals
+    if any(re.search(p, query_lower) for p in triage_skill_request.SKILL_QUESTION_PATTERNS):
+        return InputCategory.SKILL_QUESTION, signals
+    for patterns, category, flag in (
+        (triage_skill_request.ERROR_PATTERNS, InputCategory.ERROR_MESSAGE, "has_error"),
+        (triage_skill_request.CODE_PATTERNS, InputCategory.CODE_SNIPPET, "has_code"),
+        (triage_skill_request.URL_PATTERNS, InputCategory.URL_CONTENT, "has_url"),
+    ):
+        if any(re.search(p, query, re.MULTILINE) for p in patterns):
+            signals[flag] = True
+            return category, signals
+    if any(re.search(p, query_lower) for p in triage_skill_request.TASK_REQUEST_PATTERNS):
+        return InputCategory.TASK_REQUEST, signals
+    return InputCategory.GENERAL, signals
+
+
+# Calls whose first argument is a user query.
+_QUERY_CALLS = {"calculate_match_score", "classify_input", "find_matching_skills",
+                "triage_request"}
+
+
+def corpus_queries() -> list:
+    """Every literal query this module feeds to triage.
+
+    The first argument of the calls above, every string assigned to query,
+    and the strings (or leading tuple items) of any QUERIES/queries/COLLISIONS
+    list.
+    """
+    tree = ast.parse(Path(__file__).read_text(encoding="utf-8"))
+    found = []
+
+    def literal(node):
+        if isinstance(node, ast.Tuple) and node.elts:
+            node = node.elts[0]
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            found.append(node.value)
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and node.args:
+            func = node.func
+            name = func.id if isinstance(func, ast.Name) else getattr(func, "attr", "")
+            if name in _QUERY_CALLS:
+                literal(node.args[0])
+        elif isinstance(node, ast.Assign):
+            names = {t.id for t in node.targets if isinstance(t, ast.Name)}
+            if "query" in names:
+                literal(node.value)
+            elif names & {"QUERIES", "queries", "COLLISIONS"} and isinstance(node.value, ast.List):
+                for item in node.value.elts:
+                    literal(item)
+    return list(dict.fromkeys(found))
+
+
+class ClassifyInputTest(unittest.TestCase):
+    # Priority collisions between categories (also part of corpus_queries()).
+    COLLISIONS = [
+        "create a skill for this:\nTraceback (most recent call last):",
+        "please make a skill for handling => arrows",
+        "what skill should I use? const x = 1",
+        "please help, Error: ENOENT while building",
+        "can you check https://example.com for me",
+        "fix the pdf-tools skill, it misses encrypted files",
+        "the deploy skill needs better rollback steps",
+        "@dataclass\nclass Point:\n    x: int",
+    ]
+
+    def test_combined_matchers_agree_with_sequential_walk(self) -> None:
+        queries = corpus_queries()
+        self.assertGreater(len(queries), 20)
+        for query in queries:
+            with self.subTest(query=query):
+                self.assertEqual(classify_input(query), classify_sequential(query))
+
+    def test_priority_order_survives_leftmost_matches(self) -> None:
+        # The task phrase comes first in the text, but create outranks it.
+        self.assertEqual(classify_input("please help: create a skill for x")[0],
+                         InputCategory.EXPLICIT_CREATE)
+        # An error beats code even when the code marker appears earlier.
+        category, signals = classify_input("x => y\nTypeError: boom")
+        self.assertEqual(category, InputCategory.ERROR_MESSAGE)
+        self.assertTrue(signals["has_error"])
+        self.assertFalse(signals["has_code"])
+        # Raw-text categories outrank a task request.
+        self.assertEqual(classify_input("can you open https://example.com")[0],
+                         InputCategory.URL_CONTENT)
+
+    def test_signals_extracted(self) -> None:
+        _category, signals = classify_input("Create a skill for merging PDFs.")
+        self.assertEqual(signals["extracted_purpose"], "merging pdfs")
+        category, signals = classify_input("please improve the pdf skill")
+        self.assertEqual(category, InputCategory.EXPLICIT_IMPROVE)
+        self.assertEqual(signals["mentioned_skill_name"], "pdf")
+        self.assertEqual(classify_input("")[0], InputCategory.GENERAL)
+
+
+class PersistedDomainTermsTest(unittest.TestCase):
+    def test_persisted_description_terms_drive_scoring(self) -> None:
+        base = skill("pdf-tools", "Merge and split pdf documents.", ["pdf"])
+        self.assertIn("pdf", triage_skill_request.description_domain_terms(base))
+        scanned = calculate_match_score("export a pdf", base)
+        persisted = dict(base, domain_terms={
+            "signature": DOMAIN_MATCHER.signature, "matches": {}, "description": []})
+        with_record = calculate_match_score("export a pdf", persisted)
+        self.assertIn("description: pdf", scanned[1])
+        self.assertNotIn("description: pdf", with_record[1])
+
+    def test_stale_signature_is_rescanned(self) -> None:
+        base = skill("pdf-tools", "Merge and split pdf documents.", ["pdf"])
+        stale = dict(base, domain_terms={"signature": "old", "description": []})
+        self.assertEqual(calculate_match_score("export a pdf", stale),
+                         calculate_match_score("export a pdf", base))
+
+
+class SharedScoringPassTest(unittest.TestCase):
+    ROSTER = [
+        skill("code-review", "Review pull requests for bugs", ["code_quality"],
+              triggers=["code review"]),
+        skill("debug-helper", "Debug failing tests and stack traces", ["debugging"]),
+        skill("excel-tools", "Edit xlsx workbooks and csv sheets", ["spreadsheet"]),
+        skill("pdf-tools", "Merge and split pdf documents"),
+    ]
+
+    def test_many_matches_separate_calls(self) -> None:
+        queries = [("review this pull request, tests failing", 24, {"has_error": True}),
+                   ("export the csv sheet", 12, None),
+                   ("merge pdf", 1, {"has_code": True})]
+        batched = find_matching_skills_many(queries, self.ROSTER)
+        separate = [find_matching_skills(q, self.ROSTER, limit=n, signals=sig)
+                    for q, n, sig in queries]
+        self.assertEqual(batched, separate)
+
+    def test_top_k_selection_matches_full_ranking(self) -> None:
+        roster = [skill(f"tool-{i % 7}", "review code and pdf spreadsheets",
+                        [["code_quality"], ["spreadsheet"], []][i % 3],
+                        keywords=["code", "review", f"k{i}"]) for i in range(40)]
+        roster.append(skill("TOOL-1", "review review", ["code_quality"]))  # case dup
+        query = "code review of the spreadsheet"
+        everything = find_matching_skills(query, roster, limit=None)
+        self.assertEqual(len({m["name"].lower() for m in everything}), len(everything))
+        for k in (0, 1, 3, 7, 50):
+            with self.subTest(k=k):
+                self.assertEqual(find_matching_skills(query, roster, limit=k), everything[:k])
+
+    def test_each_skill_prepared_once(self) -> None:
+        with mock.patch.object(triage_skill_request, "skill_features",
+                               wraps=triage_skill_request.skill_features) as prepared:
+            find_matching_skills_many([("code review", 5, None), ("pdf", 5, None)], self.ROSTER)
+        self.assertEqual(prepared.call_count, len(self.ROSTER))
+
+
 class ImproveResolutionTest(unittest.TestCase):
     def make_index(self, count: int = 30) -> list:
         # Many strong decoys so the named target cannot be in the top 5
@@ -159,17 +340,21 @@ class ImproveResolutionTest(unittest.TestCase):
         self.assertEqual(details["target_skill"], "obscure-target")
 
 
+def write_index(tmp: Path, skills: list) -> Path:
+    index_path = tmp / "index.json"
+    index_path.write_text(json.dumps({
+        "version": "2.0.0",
+        "skills": skills,
+        "domains": {},
+        "sources": {},
+        "total_count": len(skills),
+    }), encoding="utf-8")
+    return index_path
+
+
 class TriageEndToEndTest(unittest.TestCase):
     def _write_index(self, tmp: Path, skills: list) -> Path:
-        index_path = tmp / "index.json"
-        index_path.write_text(json.dumps({
-            "version": "2.0.0",
-            "skills": skills,
-            "domains": {},
-            "sources": {},
-            "total_count": len(skills),
-        }), encoding="utf-8")
-        return index_path
+        return write_index(tmp, skills)
 
     def test_code_review_query_ranks_code_review_skills_first(self) -> None:
         skills = [
@@ -223,5 +408,57 @@ class TriageEndToEndTest(unittest.TestCase):
         self.assertIn("top_band", result.data["details"])
 
 
+class BatchTriageTest(unittest.TestCase):
+    SKILLS = [
+        skill("code-review", "Use when running a code review or pr review.",
+              ["code_quality"], keywords=["code", "review"], triggers=["code review"]),
+        skill("pdf-tools", "Merge and split pdf documents.", ["documents"]),
+    ]
+    QUERIES = ["do I have a skill for code review?", "create a skill for pdf merging",
+               "TypeError: Cannot read property 'map' of undefined", "bake bread"]
+
+    def _index(self, tmp: str) -> Path:
+        return write_index(Path(tmp), self.SKILLS)
+
+    def test_triage_many_matches_one_at_a_time(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            index_path = self._index(tmp)
+            batched = [r.data for r in triage_many(self.QUERIES, index_path)]
+            single = [triage_request(q, index_path).data for q in self.QUERIES]
+        self.assertEqual(batched, single)
+
+    def test_roster_prepared_and_similarity_built_once(self) -> None:
+        import similarity
+        with tempfile.TemporaryDirectory() as tmp:
+            index_path = self._index(tmp)
+            with mock.patch.object(triage_skill_request, "skill_features",
+                                   wraps=triage_skill_request.skill_features) as prepared, \
+                    mock.patch.object(similarity.SimilarityIndex, "from_skills",
+                                      wraps=similarity.SimilarityIndex.from_skills) as built:
+                results = list(triage_many(["create a skill for x", "create a skill for y"],
+                                           index_path))
+        self.assertEqual([r.data["action"] for r in results], [Action.CREATE_NEW] * 2)
+        self.assertEqual(prepared.call_count, len(self.SKILLS))
+        self.assertEqual(built.call_count, 1)
+
+    def test_run_batch_streams_jsonl(self) -> None:
+        lines = [json.dumps({"id": "a", "query": self.QUERIES[0]}), "",
+                 json.dumps(self.QUERIES[1]), "plain text about pdf", json.dumps({"id": "b"})]
+        out = io.StringIO()
+        with tempfile.TemporaryDirectory() as tmp:
+            code = run_batch(io.StringIO("\n".join(lines) + "\n"), out, self._index(tmp))
+        rows = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(code, 1)  # line 5 has no query
+        self.assertEqual([r["line"] for r in rows], [1, 3, 4, 5])
+        self.assertEqual(rows[0]["id"], "a")
+        self.assertEqual(rows[0]["matches"][0][0], "code-review")
+        self.assertEqual(rows[2]["query"], "plain text about pdf")
+        self.assertEqual(rows[3], {"line": 5, "error": "missing query"})
+
+    def test_run_batch_missing_index_exits_2(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp, mock.patch("sys.stderr"):
+            code = run_batch(io.StringIO("x\n"), io.StringIO(), Path(tmp) / "none.json")
+        self.assertEqual(code, 2)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Tests for watch_skills.py - incremental re-indexing of changed skill
+directories (add, edit, shadowing, removal fallback) and both change
+detection backends.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1]
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import watch_skills  # noqa: E402
+from mapped_index import open_mapped_index  # noqa: E402
+from watch_skills import PollingWatcher, reindex_dirs, skill_dir_for, watch  # noqa: E402
+
+
+def write_skill(directory: Path, name: str, description: str) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / "SKILL.md"
+    path.write_text(f"---\nname: {name}\ndescription: \"{description}\"\n---\n\n# {name}\n",
+                    encoding="utf-8")
+    return path
+
+
+class WatchTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory(prefix="skillforge-watch-")
+        self.root = Path(self._tmp.name)
+        self.flat = self.root / "skills"
+        self.cache = self.root / "cache"
+        self.flat.mkdir()
+        self.cache.mkdir()
+        self.sources = [
+            {"name": "personal", "path": self.flat, "recursive": False, "priority": 1},
+            {"name": "plugins", "path": self.cache, "recursive": True, "priority": 4},
+        ]
+        self.index = self.root / "skill_index.json"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def names(self) -> list:
+        return [s["name"] for s in json.loads(self.index.read_text())["skills"]]
+
+    def skill(self, name: str) -> dict:
+        return next(s for s in json.loads(self.index.read_text())["skills"] if s["name"] == name)
+
+
+class ReindexDirsTest(WatchTestCase):
+    def test_missing_index_is_built_in_full(self) -> None:
+        write_skill(self.flat / "alpha", "alpha", "Use when testing alpha.")
+        summary = reindex_dirs([], self.sources, self.index)
+        self.assertEqual(summary["mode"], "full")
+        self.assertEqual(self.names(), ["alpha"])
+        self.assertIn("advisor_terms", self.skill("alpha"))
+
+    def test_added_and_edited_skills_merge_incrementally(self) -> None:
+        write_skill(self.flat / "alpha", "alpha", "Use when testing alpha.")
+        reindex_dirs([], self.sources, self.index)
+        plugin_dir = self.cache / "market" / "plugin" / "1.0" / "skills" / "beta"
+        write_skill(plugin_dir, "beta", "Use when testing beta.")
+        write_skill(self.flat / "alpha", "alpha", "Use when testing the new alpha.")
+        summary = reindex_dirs([self.cache / "market", self.flat / "alpha" / "references"],
+                               self.sources, self.index)
+        self.assertEqual(summary["mode"], "incremental")
+        self.assertEqual((summary["added"], summary["updated"]), (["beta"], ["alpha"]))
+        self.assertEqual(self.names(), ["alpha", "beta"])
+        self.assertIn("new alpha", self.skill("alpha")["description"])
+        self.assertIn("advisor_terms", self.skill("beta"))
+        # save_index refreshed the mmap sidecar as well
+        self.assertEqual([s["name"] for s in open_mapped_index(self.index)], ["alpha", "beta"])
+
+    def test_untouched_directory_leaves_index_alone(self) -> None:
+        write_skill(self.flat / "alpha", "alpha", "Use when testing alpha.")
+        reindex_dirs([], self.sources, self.index)
+        before = self.index.stat().st_mtime_ns
+        summary = reindex_dirs([self.flat / "alpha"], self.sources, self.index)
+        self.assertEqual(summary["mode"], "unchanged")
+        self.assertEqual(self.index.stat().st_mtime_ns, before)
+
+    def test_personal_copy_shadows_plugin_copy(self) -> None:
+        write_skill(self.cache / "m" / "p" / "skills" / "pdf", "pdf", "Plugin pdf skill.")
+        reindex_dirs([], self.sources, self.index)
+        write_skill(self.flat / "pdf", "pdf", "Personal pdf skill.")
+        summary = reindex_dirs([self.flat / "pdf"], self.sources, self.index)
+        self.assertEqual(summary["mode"], "incremental")
+        self.assertEqual(self.skill("pdf")["source"], "personal")
+
+    def test_removal_falls_back_to_full_discovery(self) -> None:
+        write_skill(self.cache / "m" / "p" / "skills" / "pdf", "pdf", "Plugin pdf skill.")
+        personal = write_skill(self.flat / "pdf", "pdf", "Personal pdf skill.")
+        reindex_dirs([], self.sources, self.index)
+        self.assertEqual(self.skill("pdf")["source"], "personal")
+        personal.unlink()
+        summary = reindex_dirs([self.flat / "pdf"], self.sources, self.index)
+        self.assertEqual((summary["mode"], summary["removed"]), ("full", ["pdf"]))
+        # the shadowed plugin copy surfaces again
+        self.assertEqual(self.skill("pdf")["source"], "plugins")
+
+    def test_paths_outside_sources_are_ignored(self) -> None:
+        self.assertIsNone(skill_dir_for(self.root / "elsewhere", self.sources))
+        self.assertEqual(skill_dir_for(self.flat / "a" / "refs" / "x.md", self.sources)[1],
+                         self.flat / "a")
+        self.assertEqual(skill_dir_for(self.cache / "m" / "p", self.sources)[1],
+                         self.cache / "m" / "p")
+
+
+class BackendTest(WatchTestCase):
+    def test_polling_reports_changed_skill_dirs(self) -> None:
+        watcher = PollingWatcher(self.sources, interval=0.01)
+        self.assertEqual(watcher.changes(0), set())
+        write_skill(self.flat / "alpha", "alpha", "Use when testing alpha.")
+        self.assertEqual(watcher.changes(0), {self.flat / "alpha"})
+        (self.flat / "alpha" / "SKILL.md").unlink()
+        self.assertEqual(watcher.changes(0), {self.flat / "alpha"})
+
+    def test_inotify_reports_new_skill_dirs(self) -> None:
+        try:
+            watcher = watch_skills.InotifyWatcher(self.sources)
+        except OSError:
+            self.skipTest("inotify not available")
+        try:
+            write_skill(self.flat / "alpha", "alpha", "Use when testing alpha.")
+            write_skill(self.cache / "m" / "p" / "skills" / "beta", "beta", "Beta.")
+            dirty = set()
+            for _ in range(5):
+                dirty |= watcher.changes(0.2)
+        finally:
+            watcher.close()
+        self.assertIn(self.flat / "alpha", dirty)
+        self.assertTrue(any(self.cache in p.parents for p in dirty), dirty)
+
+    def test_watch_loop_refreshes_once_per_burst(self) -> None:
+        reindex_dirs([], self.sources, self.index)
+        watcher = PollingWatcher(self.sources, interval=0.01)
+        write_skill(self.flat / "alpha", "alpha", "Use when testing alpha.")
+        write_skill(self.flat / "beta", "beta", "Use when testing beta.")
+        reports = []
+        watch(watcher, self.sources, self.index, settle=0.01, timeout=0.01,
+              report=reports.append, stop=lambda: bool(reports))
+        self.assertEqual(len(reports), 1)
+        self.assertEqual(reports[0]["added"], ["alpha", "beta"])
+        self.assertIn("alpha, beta", watch_skills.format_summary(reports[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,35 +16,42 @@ Usage:
     python triage_skill_request.py "create a skill for code review"
     python triage_skill_request.py "help me debug this error" --json
     python triage_skill_request.py "TypeError: Cannot read property 'map'"
+    python triage_skill_request.py --batch prompts.jsonl   # JSONL in, JSONL out
 
 Exit Codes:
     0 - Success
-    1 - General failure
+    1 - General failure (in --batch: some lines had no query)
     2 - Skill index not found (run discover_skills.py first)
 """
 
 import argparse
+import heapq
 import json
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Any
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
 
 try:
     from _constants import (
         DOMAIN_VOCABULARY,
         STRONG_MATCH_THRESHOLD, MODERATE_MATCH_THRESHOLD, WEAK_MATCH_THRESHOLD,
-        score_band,
+        SIMILAR_SKILL_MIN_COSINE, score_band,
     )
-    from common import Result, get_index_path, phrase_in_text
+    from common import DOMAIN_MATCHER, Result, domain_phrase, get_index_path, phrase_in_text
+    from mapped_index import open_mapped_index
+    from skill_record import skill_records
 except ImportError:
     sys.path.insert(0, str(Path(__file__).resolve().parent))
     from _constants import (
         DOMAIN_VOCABULARY,
         STRONG_MATCH_THRESHOLD, MODERATE_MATCH_THRESHOLD, WEAK_MATCH_THRESHOLD,
-        score_band,
+        SIMILAR_SKILL_MIN_COSINE, score_band,
     )
-    from common import Result, get_index_path, phrase_in_text
+    from common import DOMAIN_MATCHER, Result, domain_phrase, get_index_path, phrase_in_text
+    from mapped_index import open_mapped_index
+    from skill_record import skill_records
 
 
 class Action:
@@ -127,11 +134,55 @@ URL_PATTERNS = [
     r'https?://[^\s]+',
 ]
 
+_PURPOSE_RE = re.compile(r'skill\s+(?:for|to)\s+(.+?)(?:\.|$)')
+_IMPROVE_NAME_RE = re.compile(r'(?:improve|enhance|update|fix)\s+(?:the\s+)?(\w+(?:-\w+)*)\s+skill')
+
+
+def _category_matcher(groups: Sequence[Tuple[str, Sequence[str]]], flags: int = 0) -> "re.Pattern":
+    """
+    One anchored regex that names the first category (in list order) with a
+    match anywhere in the text.
+
+    A plain alternation would report whichever category matches leftmost, so
+    each category is a lookahead from the start of the text; alternatives are
+    tried in order and the first that succeeds sets its (empty) named group.
+    """
+    branches = [
+        r"(?=[\s\S]*?(?:" + "|".join(patterns) + f"))(?P<{name}>)"
+        for name, patterns in groups
+    ]
+    return re.compile(r"\A(?:" + "|".join(branches) + ")", flags)
+
+
+# Searched on the lowercased query, highest priority first. TASK_REQUEST is
+# only consulted once the raw-text categories below have missed.
+_LOWER_MATCHER = _category_matcher([
+    (InputCategory.EXPLICIT_CREATE, EXPLICIT_CREATE_PATTERNS),
+    (InputCategory.EXPLICIT_IMPROVE, EXPLICIT_IMPROVE_PATTERNS),
+    (InputCategory.SKILL_QUESTION, SKILL_QUESTION_PATTERNS),
+    (InputCategory.TASK_REQUEST, TASK_REQUEST_PATTERNS),
+])
+# Searched on the query as typed; ^ anchors at every line, as before.
+_RAW_MATCHER = _category_matcher([
+    (InputCategory.ERROR_MESSAGE, ERROR_PATTERNS),
+    (InputCategory.CODE_SNIPPET, CODE_PATTERNS),
+    (InputCategory.URL_CONTENT, URL_PATTERNS),
+], flags=re.MULTILINE)
+
+_RAW_SIGNALS = {
+    InputCategory.ERROR_MESSAGE: "has_error",
+    InputCategory.CODE_SNIPPET: "has_code",
+    InputCategory.URL_CONTENT: "has_url",
+}
+
 
 def classify_input(query: str) -> Tuple[str, Dict[str, Any]]:
     """
     Classify user input into a category and extract signals.
 
+    Categories are checked in priority order: explicit create, explicit
+    improve, skill question, error, code, URL, then task request.
+
     Returns:
         Tuple of (category, signals_dict)
     """
@@ -145,52 +196,28 @@ def classify_input(query: str) -> Tuple[str, Dict[str, Any]]:
         "extracted_purpose": None,
     }
 
-    # Check for explicit skill creation request
-    for pattern in EXPLICIT_CREATE_PATTERNS:
-        if re.search(pattern, query_lower):
-            # Extract the purpose/goal
-            purpose_match = re.search(r'skill\s+(?:for|to)\s+(.+?)(?:\.|$)', query_lower)
-            if purpose_match:
-                signals["extracted_purpose"] = purpose_match.group(1).strip()
-            return InputCategory.EXPLICIT_CREATE, signals
-
-    # Check for explicit improvement request
-    for pattern in EXPLICIT_IMPROVE_PATTERNS:
-        if re.search(pattern, query_lower):
-            # Try to extract skill name
-            skill_match = re.search(r'(?:improve|enhance|update|fix)\s+(?:the\s+)?(\w+(?:-\w+)*)\s+skill', query_lower)
-            if skill_match:
-                signals["mentioned_skill_name"] = skill_match.group(1)
-            return InputCategory.EXPLICIT_IMPROVE, signals
-
-    # Check for skill question
-    for pattern in SKILL_QUESTION_PATTERNS:
-        if re.search(pattern, query_lower):
-            return InputCategory.SKILL_QUESTION, signals
-
-    # Check for error message
-    for pattern in ERROR_PATTERNS:
-        if re.search(pattern, query, re.MULTILINE):
-            signals["has_error"] = True
-            return InputCategory.ERROR_MESSAGE, signals
-
-    # Check for code snippet
-    for pattern in CODE_PATTERNS:
-        if re.search(pattern, query, re.MULTILINE):
-            signals["has_code"] = True
-            return InputCategory.CODE_SNIPPET, signals
-
-    # Check for URL
-    for pattern in URL_PATTERNS:
-        if re.search(pattern, query):
-            signals["has_url"] = True
-            return InputCategory.URL_CONTENT, signals
-
-    # Check for task request
-    for pattern in TASK_REQUEST_PATTERNS:
-        if re.search(pattern, query_lower):
-            return InputCategory.TASK_REQUEST, signals
+    lower = _LOWER_MATCHER.match(query_lower)
+    category = lower.lastgroup if lower else None
+    if category == InputCategory.EXPLICIT_CREATE:
+        purpose_match = _PURPOSE_RE.search(query_lower)
+        if purpose_match:
+            signals["extracted_purpose"] = purpose_match.group(1).strip()
+        return category, signals
+    if category == InputCategory.EXPLICIT_IMPROVE:
+        skill_match = _IMPROVE_NAME_RE.search(query_lower)
+        if skill_match:
+            signals["mentioned_skill_name"] = skill_match.group(1)
+        return category, signals
+    if category == InputCategory.SKILL_QUESTION:
+        return category, signals
+
+    raw = _RAW_MATCHER.match(query)
+    if raw:
+        signals[_RAW_SIGNALS[raw.lastgroup]] = True
+        return raw.lastgroup, signals
 
+    if category == InputCategory.TASK_REQUEST:
+        return category, signals
     return InputCategory.GENERAL, signals
 
 
@@ -209,6 +236,22 @@ def load_skill_index(index_path: Optional[Path] = None) -> Optional[Dict]:
         return None
 
 
+def load_skills(index_path: Optional[Path] = None) -> Optional[Sequence[Mapping[str, Any]]]:
+    """
+    The index's skill records, or None when there is no index.
+
+    Served from the mmap-shared sidecar (mapped_index.py) when it matches
+    the JSON, so concurrent hook processes share one copy; otherwise parsed
+    from the JSON into compact SkillRecords (skill_record.py).
+    """
+    index_path = Path(index_path) if index_path else get_index_path()
+    mapped = open_mapped_index(index_path)
+    if mapped is not None:
+        return mapped
+    index = load_skill_index(index_path)
+    return skill_records(index.get("skills", [])) if index else None
+
+
 # Universal domain synonyms, shared with discover_skills.py via
 # _constants.DOMAIN_VOCABULARY. Concept-based, not tied to skill names.
 DOMAIN_SYNONYMS = DOMAIN_VOCABULARY
@@ -218,25 +261,62 @@ def detect_query_domains(query: str) -> List[Tuple[str, List[str]]]:
     """
     Detect which domains a query relates to using universal synonyms.
 
+    One pass of common.DOMAIN_MATCHER over the query.
+
     Returns:
         List of (domain_name, matched_terms) tuples, sorted by match count
     """
-    query_lower = query.lower()
-    detected = []
-
-    for domain, synonyms in DOMAIN_SYNONYMS.items():
-        matched_terms = []
-        for term in synonyms:
-            if phrase_in_text(term, query_lower):
-                matched_terms.append(term)
-        if matched_terms:
-            detected.append((domain, matched_terms))
-
+    detected = list(DOMAIN_MATCHER.domain_terms(DOMAIN_MATCHER.found(query)).items())
     # Sort by number of matches (more matches = stronger signal)
     detected.sort(key=lambda x: len(x[1]), reverse=True)
     return detected
 
 
+def description_domain_terms(skill: Dict) -> Set[str]:
+    """Vocabulary terms and domain names in a skill's description.
+
+    Read from the index record's "domain_terms" when discovery persisted it
+    against the current vocabulary; otherwise scanned here.
+    """
+    persisted = skill.get("domain_terms")
+    if (
+        isinstance(persisted, dict)
+        and persisted.get("signature") == DOMAIN_MATCHER.signature
+        and isinstance(persisted.get("description"), (list, tuple))
+    ):
+        return set(persisted["description"])
+    return DOMAIN_MATCHER.found(skill.get("description", ""))
+
+
+def query_features(query: str) -> Dict[str, Any]:
+    """Query-side inputs to scoring, computed once per query (not per skill)."""
+    query_lower = query.lower()
+    domains = detect_query_domains(query)
+    return {
+        "lower": query_lower,
+        "words": set(query_lower.split()),
+        "domains": domains,
+        "domain_names": [d[0] for d in domains],
+    }
+
+
+def skill_features(skill: Dict) -> Dict[str, Any]:
+    """Skill-side inputs to scoring, computed once per skill (not per query)."""
+    skill_name = skill.get("name", "").lower()
+    skill_description = skill.get("description", "").lower()
+    return {
+        "name": skill_name,
+        "name_words": set(skill_name.replace("-", " ").replace("_", " ").split()),
+        "keywords": set(k.lower() for k in skill.get("keywords", [])),
+        "triggers": set(t.lower() for t in skill.get("triggers", [])),
+        "domains": set(d.lower() for d in skill.get("domains", [])),
+        "domain_list": [d.lower() for d in skill.get("domains", [])],
+        "description": skill_description,
+        "description_words": set(skill_description.split()),
+        "description_terms": description_domain_terms(skill),
+    }
+
+
 def calculate_match_score(query: str, skill: Dict) -> Tuple[float, List[str]]:
     """
     Calculate how well a skill matches the query using UNIVERSAL domain matching.
@@ -249,20 +329,25 @@ def calculate_match_score(query: str, skill: Dict) -> Tuple[float, List[str]]:
     Returns:
         Tuple of (score 0-100, list of match reasons)
     """
-    query_lower = query.lower()
-    query_words = set(query_lower.split())
+    return score_features(query_features(query), skill_features(skill))
 
-    skill_name = skill.get("name", "").lower()
-    skill_keywords = set(k.lower() for k in skill.get("keywords", []))
-    skill_triggers = set(t.lower() for t in skill.get("triggers", []))
-    skill_domains = set(d.lower() for d in skill.get("domains", []))
-    skill_description = skill.get("description", "").lower()
+
+def score_features(query: Dict[str, Any], skill: Dict[str, Any]) -> Tuple[float, List[str]]:
+    """calculate_match_score() over prepared query_features()/skill_features()."""
+    query_lower = query["lower"]
+    query_words = query["words"]
+
+    skill_name = skill["name"]
+    skill_keywords = skill["keywords"]
+    skill_triggers = skill["triggers"]
+    skill_domains = skill["domains"]
+    description_terms = skill["description_terms"]
 
     score = 0
     reasons = []
 
-    # Step 1: Detect what domains the query is about
-    query_domains = detect_query_domains(query)
+    # Step 1: What domains the query is about (detected once in query_features)
+    query_domains = query["domains"]
 
     # Step 2: Check if skill's domains match detected query domains (STRONG signal)
     domain_matched = False
@@ -297,11 +382,11 @@ def calculate_match_score(query: str, skill: Dict) -> Tuple[float, List[str]]:
             break
 
     # Check if domain terms appear in skill's description (word-boundary
-    # matching: 'ai' must not match 'email')
+    # matching, precomputed per skill: 'ai' must not match 'email')
     desc_matched = False
     for domain, matched_terms in query_domains:
         for term in matched_terms:
-            if phrase_in_text(term, skill_description):
+            if term in description_terms:
                 score += 10
                 reasons.append(f"description: {term}")
                 desc_matched = True
@@ -310,7 +395,7 @@ def calculate_match_score(query: str, skill: Dict) -> Tuple[float, List[str]]:
             break
 
         # Also check domain name in description
-        if phrase_in_text(domain.replace("_", " "), skill_description):
+        if domain_phrase(domain) in description_terms:
             score += 10
             reasons.append(f"description: {domain}")
             desc_matched = True
@@ -322,8 +407,7 @@ def calculate_match_score(query: str, skill: Dict) -> Tuple[float, List[str]]:
         reasons.append(f"name match: {skill_name}")
     else:
         # Check if significant query words appear in skill name
-        name_words = set(skill_name.replace("-", " ").replace("_", " ").split())
-        name_overlap = query_words & name_words
+        name_overlap = query_words & skill["name_words"]
         if name_overlap and any(len(w) > 3 for w in name_overlap):
             score += 20
             reasons.append(f"partial name: {', '.join(name_overlap)}")
@@ -345,8 +429,7 @@ def calculate_match_score(query: str, skill: Dict) -> Tuple[float, List[str]]:
             reasons.append(f"keywords: {', '.join(significant_overlap[:3])}")
 
     # Step 7: Description word overlap (fallback)
-    desc_words = set(skill_description.split())
-    desc_overlap = query_words & desc_words
+    desc_overlap = query_words & skill["description_words"]
     significant_desc = [w for w in desc_overlap if len(w) > 4]
     if len(significant_desc) >= 2 and "description:" not in str(reasons):
         score += 8
@@ -355,24 +438,50 @@ def calculate_match_score(query: str, skill: Dict) -> Tuple[float, List[str]]:
     return min(100, score), reasons
 
 
-def find_matching_skills(query: str, skills: List[Dict], limit: int = 5, signals: Dict = None) -> List[Dict]:
+def find_matching_skills(query: str, skills: List[Dict], limit: Optional[int] = 5,
+                         signals: Dict = None) -> List[Dict]:
     """
     Find skills that match the query, sorted by score.
 
     Uses UNIVERSAL domain-based matching - no hardcoded skill names.
     """
-    matches = []
+    return rank_matches(query_features(query), skills, [skill_features(s) for s in skills],
+                        limit, signals)
+
+
+def find_matching_skills_many(
+    queries: List[Tuple[str, int, Optional[Dict]]], skills: List[Dict]
+) -> List[List[Dict]]:
+    """find_matching_skills() for several (query, limit, signals) at once.
+
+    Each skill is prepared once and scored against every query from the
+    shared skill_features(), instead of re-deriving them per query.
+    """
+    prepared = [skill_features(s) for s in skills]
+    return [
+        rank_matches(query_features(query), skills, prepared, limit, signals)
+        for query, limit, signals in queries
+    ]
+
+
+def rank_matches(query: Dict[str, Any], skills: List[Dict], prepared: List[Dict[str, Any]],
+                 limit: Optional[int] = 5, signals: Dict = None) -> List[Dict]:
+    """Score prepared skills against a prepared query; the find_matching_skills() core.
+
+    Selects the top limit with a heap (limit=None ranks everything) and
+    builds match dicts only for the winners.
+    """
+    best_by_name: Dict[str, Tuple[float, int, List[str]]] = {}
     signals = signals or {}
 
-    # Detect query domains for context boosting
-    query_domains = detect_query_domains(query)
-    query_domain_names = [d[0] for d in query_domains]
+    # Query domains for context boosting
+    query_domain_names = query["domain_names"]
 
-    for skill in skills:
-        score, reasons = calculate_match_score(query, skill)
+    for position, (skill, features) in enumerate(zip(skills, prepared)):
+        score, reasons = score_features(query, features)
 
         # Apply context-based boosting using DOMAINS (not skill names)
-        skill_domains = [d.lower() for d in skill.get("domains", [])]
+        skill_domains = features["domain_list"]
 
         # Error context + debugging domain boost
         if signals.get("has_error") and "debugging" in skill_domains:
@@ -397,31 +506,39 @@ def find_matching_skills(query: str, skills: List[Dict], limit: int = 5, signals
             score += min(15, len(matching_domains) * 5)
 
         if score > 0:
+            # Dedupe by skill name (keep the highest-scoring entry) so the same
+            # skill never appears twice in one recommendation list. Only
+            # (score, position, reasons) is held until the winners are known.
             final_score = min(100, score)
-            matches.append({
-                "name": skill.get("name"),
-                "score": final_score,
-                "band": score_band(final_score),
-                "reasons": reasons,
-                "source": skill.get("source"),
-                "path": skill.get("path"),
-                "description": skill.get("description", "")[:100],
-                "domains": skill.get("domains", []),
-                "keywords": skill.get("keywords", []),
-                "triggers": skill.get("triggers", []),
-            })
-
-    # Dedupe by skill name (keep the highest-scoring entry) so the same
-    # skill never appears twice in one recommendation list.
-    best_by_name: Dict[str, Dict] = {}
-    for match in matches:
-        key = str(match["name"]).lower()
-        if key not in best_by_name or match["score"] > best_by_name[key]["score"]:
-            best_by_name[key] = match
-    matches = list(best_by_name.values())
-
-    matches.sort(key=lambda m: (-m["score"], str(m["name"])))
-    return matches[:limit]
+            key = str(skill.get("name")).lower()
+            held = best_by_name.get(key)
+            if held is None or final_score > held[0]:
+                best_by_name[key] = (final_score, position, reasons)
+
+    ranked = ((-score, str(skills[position].get("name")), position, reasons)
+              for score, position, reasons in best_by_name.values())
+    if limit is None:
+        winners = sorted(ranked, key=lambda r: r[:3])
+    else:
+        winners = heapq.nsmallest(limit, ranked, key=lambda r: r[:3])
+    return [match_record(skills[position], -neg_score, reasons)
+            for neg_score, _name, position, reasons in winners]
+
+
+def match_record(skill: Dict, score: float, reasons: List[str]) -> Dict:
+    """The match dict find_matching_skills() returns for one ranked skill."""
+    return {
+        "name": skill.get("name"),
+        "score": score,
+        "band": score_band(score),
+        "reasons": reasons,
+        "source": skill.get("source"),
+        "path": skill.get("path"),
+        "description": skill.get("description", "")[:100],
+        "domains": skill.get("domains", []),
+        "keywords": skill.get("keywords", []),
+        "triggers": skill.get("triggers", []),
+    }
 
 
 # ===========================================================================
@@ -634,26 +751,54 @@ def triage_request(query: str, index_path: Optional[Path] = None) -> Result:
     Returns:
         Result with action recommendation and supporting data.
     """
-    # Step 1: Classify input
-    category, signals = classify_input(query)
+    skills = load_skills(index_path)
+    if skills is None:
+        return missing_index_result(index_path)
+    return triage_query(query, skills, [skill_features(s) for s in skills])
+
+
+def missing_index_result(index_path: Optional[Path] = None) -> Result:
+    return Result(
+        success=False,
+        message="Skill index not found. Run discover_skills.py first.",
+        errors=[f"Index file missing: {index_path or get_index_path()}"]
+    )
 
-    # Step 2: Load skill index
-    index = load_skill_index(index_path)
-    if not index:
-        return Result(
-            success=False,
-            message="Skill index not found. Run discover_skills.py first.",
-            errors=[f"Index file missing: {index_path or get_index_path()}"]
-        )
 
-    skills = index.get("skills", [])
+def triage_query(
+    query: str,
+    skills: List[Dict],
+    prepared: List[Dict[str, Any]],
+    similarity: Optional[Callable[[], Any]] = None,
+) -> Result:
+    """
+    Triage one query against an already loaded and prepared roster.
+
+    prepared is skill_features() per skill; similarity returns a shared
+    SimilarityIndex (built here on demand when omitted).
+    """
+    # Step 1: Classify input
+    category, signals = classify_input(query)
 
-    # Step 3: Find matching skills (pass signals for context-aware boosting)
-    matches = find_matching_skills(query, skills, signals=signals)
+    # Step 2: Find matching skills (pass signals for context-aware boosting)
+    matches = rank_matches(query_features(query), skills, prepared, 5, signals)
 
-    # Step 4: Make decision (full index passed for named-skill resolution)
+    # Step 3: Make decision (full index passed for named-skill resolution)
     action, details = make_triage_decision(category, signals, matches, query, skills=skills)
 
+    # Step 4: Before recommending a new skill, surface the closest existing
+    # descriptions (IDF-weighted) so near-duplicates get improved instead.
+    if action == Action.CREATE_NEW and skills:
+        if similarity is None:
+            from similarity import SimilarityIndex  # deferred: imports this module
+            engine = SimilarityIndex.from_skills(skills)
+        else:
+            engine = similarity()
+        details["similar_skills"] = [
+            {"name": name, "similarity": score}
+            for name, score in engine.query(query, k=3, min_score=SIMILAR_SKILL_MIN_COSINE)
+        ]
+
     # Build response
     return Result(
         success=True,
@@ -669,6 +814,28 @@ def triage_request(query: str, index_path: Optional[Path] = None) -> Result:
     )
 
 
+def triage_many(queries: Iterable[str], index_path: Optional[Path] = None) -> Iterator[Result]:
+    """
+    Triage a stream of queries, loading and preparing the roster once.
+
+    Results are yielded in query order as each is ready. A missing index
+    yields a single failed Result and nothing else.
+    """
+    skills = load_skills(index_path)
+    if skills is None:
+        yield missing_index_result(index_path)
+        return
+    prepared = [skill_features(s) for s in skills]
+
+    @lru_cache(maxsize=1)
+    def similarity() -> Any:
+        from similarity import SimilarityIndex  # deferred: imports this module
+        return SimilarityIndex.from_skills(skills)
+
+    for query in queries:
+        yield triage_query(query, skills, prepared, similarity)
+
+
 # ===========================================================================
 # CLI
 # ===========================================================================
@@ -723,6 +890,10 @@ def format_output(result: Result) -> str:
         purpose = details.get("purpose", "the requested functionality")
         lines.append(f"  Create new skill for: {purpose}")
         lines.append(f"  Command: SkillForge: create a skill for {purpose}")
+        similar = details.get("similar_skills", [])
+        if similar:
+            names = ", ".join(s["name"] for s in similar)
+            lines.append(f"  Closest existing descriptions (check first): {names}")
 
     elif action == Action.COMPOSE:
         chain = details.get("recommended_chain", [])
@@ -738,6 +909,68 @@ def format_output(result: Result) -> str:
     return "\n".join(lines)
 
 
+def read_batch(stream: IO[str]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """(line number, record) per non-blank batch line.
+
+    A line is a JSON object with a "query" key (other keys are echoed back),
+    a JSON string, or plain text taken verbatim as the query.
+    """
+    for line_no, line in enumerate(stream, 1):
+        text = line.strip()
+        if not text:
+            continue
+        try:
+            parsed = json.loads(text)
+        except json.JSONDecodeError:
+            parsed = text
+        if isinstance(parsed, str):
+            parsed = {"query": parsed}
+        if not isinstance(parsed, dict):
+            parsed = {"query": text}
+        yield line_no, parsed
+
+
+def batch_record(line_no: int, record: Dict[str, Any], result: Result) -> Dict[str, Any]:
+    """Compact JSONL row for one batch query (enough to re-tune thresholds)."""
+    data = result.data
+    details = data.get("details", {})
+    return {
+        **{k: v for k, v in record.items() if k != "query"},
+        "line": line_no,
+        "query": record.get("query"),
+        "action": data.get("action"),
+        "input_category": data.get("input_category"),
+        "top_score": details.get("top_score", 0),
+        "top_band": details.get("top_band"),
+        "matches": [[m["name"], m["score"]] for m in data.get("top_matches", [])],
+    }
+
+
+def run_batch(stream: IO[str], out: IO[str], index_path: Optional[Path] = None) -> int:
+    """Stream JSONL results for every batch line; returns the exit code."""
+    rows: List[Tuple[int, Dict[str, Any]]] = []
+    invalid: List[int] = []
+
+    def queries() -> Iterator[str]:
+        for line_no, record in read_batch(stream):
+            query = record.get("query")
+            if not isinstance(query, str) or not query.strip():
+                invalid.append(line_no)
+                out.write(json.dumps({"line": line_no, "error": "missing query"}) + "\n")
+                continue
+            rows.append((line_no, record))
+            yield query
+
+    for result in triage_many(queries(), index_path):
+        if not result.success:
+            print(f"Error: {result.message}", file=sys.stderr)
+            return 2
+        line_no, record = rows.pop(0)
+        out.write(json.dumps(batch_record(line_no, record, result)) + "\n")
+        out.flush()
+    return 1 if invalid else 0
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Analyze input and recommend skill action",
@@ -748,15 +981,31 @@ Examples:
   %(prog)s "help me debug this error"
   %(prog)s "do I have a skill for testing?" --json
   %(prog)s "TypeError: Cannot read property 'map' of undefined"
+  %(prog)s --batch prompts.jsonl > routes.jsonl   # one JSON row per query
+  cat prompts.txt | %(prog)s --batch -
         """
     )
 
     parser.add_argument(
         "query",
         type=str,
+        nargs="?",
         help="The user input to analyze"
     )
 
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="Triage every line of FILE ('-' for stdin) and stream JSONL results; "
+             "lines are {\"query\": ...} objects, JSON strings, or plain text"
+    )
+
+    parser.add_argument(
+        "--index",
+        type=Path,
+        help="Skill index (default: shared cache)"
+    )
+
     parser.add_argument(
         "--json",
         action="store_true",
@@ -770,9 +1019,21 @@ Examples:
     )
 
     args = parser.parse_args()
+    if (args.query is None) == (args.batch is None):
+        parser.error("give exactly one of a query or --batch FILE")
+
+    if args.batch is not None:
+        if args.batch == "-":
+            sys.exit(run_batch(sys.stdin, sys.stdout, args.index))
+        try:
+            with open(args.batch, encoding="utf-8") as stream:
+                sys.exit(run_batch(stream, sys.stdout, args.index))
+        except OSError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            sys.exit(1)
 
     # Run triage
-    result = triage_request(args.query)
+    result = triage_request(args.query, args.index)
 
     # Output
     if args.json:
@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""
+watch_skills.py - Keep the skill index current while skills change (opt-in).
+
+The advisor and the doctor only rebuild the index once it is older than
+INDEX_MAX_AGE_HOURS, so a newly installed skill can stay invisible for up to
+a day. This foreground command watches the skill sources and, a moment
+after the last change in a burst, re-indexes ONLY the skill directories
+that changed:
+
+  - inotify (Linux, through ctypes; no dependency) reports created, edited,
+    moved and deleted skill directories as they happen
+  - elsewhere, or with --backend poll, SKILL.md mtimes/sizes are compared
+    every --interval seconds
+
+An edited or added skill is re-parsed and merged into the existing index.
+When a skill disappears or is renamed, a shadowed copy in a lower-priority
+source may have to take its place, and the index only keeps dedupe
+winners, so that case falls back to a full discovery. Every write goes
+through save_index(), which also refreshes the mmap-shared sidecar.
+
+Nothing runs unless you start it; stop with Ctrl-C. Hooks never start it.
+
+Usage:
+    python3 watch_skills.py
+    python3 watch_skills.py --backend poll --interval 5
+    python3 watch_skills.py --index /tmp/skill_index.json --verbose
+
+Exit Codes:
+    0 - Stopped (Ctrl-C)
+    1 - General failure
+    2 - Usage error (e.g. --backend inotify where inotify is unavailable)
+"""
+
+from __future__ import annotations
+
+import argparse
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from common import Result, get_index_path
+    from discover_skills import (
+        SKILL_SOURCES, build_domain_index, dedupe_skills, discover_skills,
+        find_skill_files, parse_skill_file, save_index,
+    )
+    from triage_skill_request import load_skill_index
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from common import Result, get_index_path
+    from discover_skills import (
+        SKILL_SOURCES, build_domain_index, dedupe_skills, discover_skills,
+        find_skill_files, parse_skill_file, save_index,
+    )
+    from triage_skill_request import load_skill_index
+
+DEFAULT_POLL_INTERVAL = 2.0  # seconds between polling scans
+DEFAULT_SETTLE = 0.5  # quiet time that ends a burst of changes
+
+Source = Dict[str, Any]
+
+
+# ===========================================================================
+# INCREMENTAL RE-INDEX
+# ===========================================================================
+
+def skill_dir_for(path: Path, sources: List[Source]) -> Optional[Tuple[Source, Path]]:
+    """The (source, directory to re-scan) a changed path belongs to.
+
+    Flat sources re-scan the top-level skill directory the path is in (or
+    the whole source when the root itself changed); recursive plugin caches
+    re-scan the changed directory's subtree.
+    """
+    for source in sources:
+        root = Path(source["path"])
+        try:
+            rel = path.relative_to(root)
+        except ValueError:
+            continue
+        if source["recursive"] or not rel.parts:
+            return source, path
+        return source, root / rel.parts[0]
+    return None
+
+
+def skill_files_in(directory: Path, source: Source) -> List[Path]:
+    """SKILL.md files under directory, as find_skill_files() would see them."""
+    if not directory.is_dir():
+        return []
+    if source["recursive"] or directory == Path(source["path"]):
+        return find_skill_files(directory, source["recursive"])
+    for candidate in sorted(directory.iterdir()):
+        if candidate.is_file() and candidate.name.lower() == "skill.md":
+            return [candidate]
+    return []
+
+
+def _within(path: str, directory: Path) -> bool:
+    candidate = Path(path)
+    return candidate == directory or directory in candidate.parents
+
+
+def _write_index(skills: List[Dict[str, Any]], sources: List[Source], message: str,
+                 index_path: Optional[Path]) -> None:
+    skills.sort(key=lambda s: (s["priority"], s["name"]))
+    save_index(Result(success=True, message=message, data={
+        "skills": skills,
+        "domains": build_domain_index(skills),
+        "sources": {s["name"]: str(s["path"]) for s in sources},
+        "total_count": len(skills),
+    }), index_path)
+
+
+def full_reindex(sources: List[Source], index_path: Optional[Path] = None) -> Dict[str, Any]:
+    """Rebuild the whole index from every source."""
+    result = discover_skills(verbose=False, sources=sources)
+    skills = result.data["skills"]
+    save_index(result, index_path)
+    return {"mode": "full", "dirs": 0, "added": [], "updated": [], "removed": [],
+            "total": len(skills)}
+
+
+def reindex_dirs(dirty: Iterable[Path], sources: Optional[List[Source]] = None,
+                 index_path: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Re-parse only the skill directories in dirty and merge them into the index.
+
+    Returns a summary: mode ("incremental", "full" or "unchanged"), the
+    number of directories re-scanned, and the added/updated/removed names.
+    """
+    sources = SKILL_SOURCES if sources is None else sources
+    index = load_skill_index(index_path)
+    if not index:
+        return full_reindex(sources, index_path)
+
+    targets: Dict[Path, Source] = {}
+    for path in dirty:
+        located = skill_dir_for(Path(path), sources)
+        if located is not None:
+            targets[located[1]] = located[0]
+    entries = [s for s in index.get("skills", []) if isinstance(s, dict)]
+    stale = [e for e in entries if any(_within(str(e.get("path", "")), d) for d in targets)]
+    fresh = []
+    for directory, source in targets.items():
+        for skill_file in skill_files_in(directory, source):
+            record = parse_skill_file(skill_file, source["name"], source["priority"])
+            if record:
+                fresh.append(record)
+
+    stale_names = {e.get("name", "").lower() for e in stale}
+    fresh_names = {r["name"].lower() for r in fresh}
+    if stale_names - fresh_names:
+        # A vanished name may have been shadowing a copy the index never kept.
+        summary = full_reindex(sources, index_path)
+        summary.update(dirs=len(targets), removed=sorted(stale_names - fresh_names))
+        return summary
+
+    unchanged = {
+        "mode": "unchanged", "dirs": len(targets), "added": [], "updated": [], "removed": [],
+        "total": len(entries),
+    }
+
+    def identity(record: Dict[str, Any]) -> Tuple[Any, ...]:
+        return (str(record.get("path")), record.get("mtime_ns"), record.get("size"))
+
+    if sorted(map(identity, stale)) == sorted(map(identity, fresh)):
+        return unchanged  # e.g. only a references/ file moved
+    stale_ids = {id(e) for e in stale}
+    merged = dedupe_skills([e for e in entries if id(e) not in stale_ids] + fresh)
+    winners = {id(s) for s in merged}
+    kept = [r for r in fresh if id(r) in winners]
+    if not kept and not stale:
+        return unchanged  # every new file lost dedupe to a higher-priority copy
+    _write_index(merged, sources, "incrementally re-indexed by watch_skills", index_path)
+    return {
+        "mode": "incremental",
+        "dirs": len(targets),
+        "added": sorted(r["name"] for r in kept if r["name"].lower() not in stale_names),
+        "updated": sorted(r["name"] for r in kept if r["name"].lower() in stale_names),
+        "removed": [],
+        "total": len(merged),
+    }
+
+
+# ===========================================================================
+# WATCHERS
+# ===========================================================================
+# Both backends expose changes(timeout) -> set of changed directories,
+# blocking for at most timeout seconds.
+
+class PollingWatcher:
+    """Portable backend: diff SKILL.md (mtime_ns, size) snapshots."""
+
+    backend = "poll"
+
+    def __init__(self, sources: List[Source], interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        self.sources = sources
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot = {}
+        for source in self.sources:
+            root = Path(source["path"])
+            if not root.is_dir():
+                continue
+            for skill_file in find_skill_files(root, source["recursive"]):
+                try:
+                    stat = skill_file.stat()
+                except OSError:
+                    continue
+                snapshot[skill_file] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def changes(self, timeout: float) -> Set[Path]:
+        time.sleep(min(timeout, self.interval))
+        current = self._scan()
+        changed = {path for path in current.keys() | self._snapshot.keys()
+                   if current.get(path) != self._snapshot.get(path)}
+        self._snapshot = current
+        return {path.parent for path in changed}
+
+    def close(self) -> None:
+        pass
+
+
+# inotify(7) constants
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+_WATCH_MASK = (IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE
+               | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len; then len bytes of name
+
+
+class InotifyWatcher:
+    """Linux backend: inotify through libc, one watch per relevant directory.
+
+    Flat sources watch the root and each skill directory; plugin caches
+    watch every directory in the tree. Directories created later are added
+    as their events arrive. Raises OSError when inotify is unavailable.
+    """
+
+    backend = "inotify"
+
+    def __init__(self, sources: List[Source]) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        try:
+            self._init = libc.inotify_init1
+            self._add_watch = libc.inotify_add_watch
+        except AttributeError as exc:
+            raise OSError(errno.ENOSYS, "inotify is not available") from exc
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = self._init(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.sources = sources
+        # wd -> (directory, its source, whether subdirectories get watches)
+        self._watches: Dict[int, Tuple[Path, Source, bool]] = {}
+        for source in sources:
+            root = Path(source["path"])
+            if root.is_dir():
+                self._watch_tree(root, source)
+
+    def _watch(self, directory: Path, source: Source, descend: bool) -> None:
+        wd = self._add_watch(self.fd, os.fsencode(str(directory)), _WATCH_MASK)
+        if wd >= 0:
+            self._watches[wd] = (directory, source, descend)
+
+    def _watch_tree(self, directory: Path, source: Source) -> None:
+        root = Path(source["path"])
+        if source["recursive"]:
+            for current, _dirs, _files in os.walk(directory):
+                self._watch(Path(current), source, True)
+        elif directory == root:
+            self._watch(root, source, True)
+            for child in sorted(root.iterdir()):
+                if child.is_dir():
+                    self._watch(child, source, False)
+        else:
+            self._watch(directory, source, False)
+
+    def _read(self) -> bytes:
+        chunks = []
+        while True:
+            try:
+                chunk = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    def changes(self, timeout: float) -> Set[Path]:
+        ready, _w, _x = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        data = self._read()
+        dirty: Set[Path] = set()
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            wd, mask, _cookie, length = _EVENT.unpack_from(data, offset)
+            raw_name = data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b"\0")
+            offset += _EVENT.size + length
+            if mask & IN_Q_OVERFLOW:
+                dirty.update(Path(s["path"]) for s in self.sources)  # events lost: rescan all
+                continue
+            watch = self._watches.get(wd)
+            if watch is None:
+                continue
+            directory, source, descend = watch
+            if mask & IN_IGNORED:
+                del self._watches[wd]
+                continue
+            if not raw_name:  # the watched directory itself moved or was deleted
+                dirty.add(directory)
+                continue
+            path = directory / os.fsdecode(raw_name)
+            if mask & IN_ISDIR:
+                if descend and mask & (IN_CREATE | IN_MOVED_TO) and path.is_dir():
+                    self._watch_tree(path, source)
+                dirty.add(path)
+            elif raw_name.lower() == b"skill.md":
+                dirty.add(directory)
+        return dirty
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def make_watcher(sources: List[Source], backend: str = "auto",
+                 interval: float = DEFAULT_POLL_INTERVAL) -> Any:
+    """The requested backend; "auto" prefers inotify and falls back to polling."""
+    if backend in ("auto", "inotify"):
+        try:
+            return InotifyWatcher(sources)
+        except OSError:
+            if backend == "inotify":
+                raise
+    return PollingWatcher(sources, interval)
+
+
+def watch(watcher: Any, sources: List[Source], index_path: Optional[Path] = None,
+          settle: float = DEFAULT_SETTLE, timeout: float = 1.0,
+          report: Callable[[Dict[str, Any]], None] = lambda summary: None,
+          stop: Callable[[], bool] = lambda: False) -> None:
+    """Re-index changed directories until stop() is true.
+
+    After the first change, events keep being collected until settle seconds
+    pass quietly, so an install or a multi-file save is one refresh.
+    """
+    while not stop():
+        dirty = watcher.changes(timeout)
+        if not dirty:
+            continue
+        while True:
+            more = watcher.changes(settle)
+            if not more:
+                break
+            dirty |= more
+        report(reindex_dirs(dirty, sources, index_path))
+
+
+# ===========================================================================
+# CLI
+# ===========================================================================
+
+def format_summary(summary: Dict[str, Any]) -> str:
+    stamp = datetime.now().strftime("%H:%M:%S")
+    if summary["mode"] == "unchanged":
+        return f"[{stamp}] {summary['dirs']} dir(s) changed; index unchanged"
+    parts = [f"{label} {', '.join(summary[key])}"
+             for key, label in (("added", "+"), ("updated", "~"), ("removed", "-"))
+             if summary[key]]
+    detail = f" ({'; '.join(parts)})" if parts else ""
+    return f"[{stamp}] {summary['mode']} re-index: {summary['total']} skills{detail}"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Watch skill sources and re-index changed skills within seconds",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                               # inotify on Linux, polling elsewhere
+  %(prog)s --backend poll --interval 5
+  %(prog)s --index /tmp/skill_index.json --verbose
+        """,
+    )
+    parser.add_argument("--backend", choices=["auto", "inotify", "poll"], default="auto",
+                        help="Change detection (default: auto)")
+    parser.add_argument("--interval", type=float, default=DEFAULT_POLL_INTERVAL,
+                        help=f"Polling interval in seconds (default: {DEFAULT_POLL_INTERVAL})")
+    parser.add_argument("--settle", type=float, default=DEFAULT_SETTLE,
+                        help=f"Quiet seconds that end a burst (default: {DEFAULT_SETTLE})")
+    parser.add_argument("--index", type=Path, help="Skill index (default: shared cache)")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Also report bursts that left the index unchanged")
+    args = parser.parse_args(argv)
+    if args.interval <= 0 or args.settle < 0:
+        parser.error("--interval must be positive and --settle non-negative")
+
+    index_path = (args.index or get_index_path()).expanduser()
+    try:
+        watcher = make_watcher(SKILL_SOURCES, args.backend, args.interval)
+    except OSError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 2
+
+    def report(summary: Dict[str, Any]) -> None:
+        if summary["mode"] != "unchanged" or args.verbose:
+            print(format_summary(summary), flush=True)
+
+    print(f"Watching {len(SKILL_SOURCES)} skill sources ({watcher.backend}); "
+          f"index: {index_path}. Ctrl-C to stop.", flush=True)
+    try:
+        if not load_skill_index(index_path):
+            report(full_reindex(SKILL_SOURCES, index_path))
+        watch(watcher, SKILL_SOURCES, index_path, settle=args.settle,
+              timeout=args.interval, report=report)
+    except KeyboardInterrupt:
+        return 0
+    except OSError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    finally:
+        watcher.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())